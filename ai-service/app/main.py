@@ -1,16 +1,70 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Dict, Any
 from app.services.stt import transcribe_audio
 from app.services.question_generator import (
     generate_questions,
     generate_questions_with_context,
     generate_questions_with_relationship
 )
-from app.services.summary_generator import generate_meeting_summary
-from app.services.personalized_questions import generate_personalized_questions
+from app.services.summary_generator import format_transcript_line, generate_meeting_summary
+from app.services.rolling_summary import get_rolling_summary
+from app.services.summary_jobs import (
+    JobQueueFull,
+    get_job_metrics,
+    get_summary_job,
+    submit_summary_job,
+    validate_callback_url,
+    wait_summary_job
+)
+from app.services.personalized_questions import (
+    generate_multi_persona_questions,
+    generate_personalized_questions,
+    get_personalized_metrics,
+)
 from app.services.mock_data import mock_transcribe_audio, mock_generate_questions
+from app.services.speaker_analyzer import peek_role_tracker
+from app.services.heuristic_questions import (
+    generate_heuristic_questions,
+    get_llm_questions,
+    submit_llm_questions,
+    wait_llm_questions
+)
+from app.services.context_analyzer import get_context_session, peek_context_session
+from app.services.data_delta import (
+    detect_data_updates,
+    detect_data_updates_from_transcripts,
+    get_structured_data
+)
+from app.services.json_parser import get_parse_metrics
+from app.services.llm_gateway import get_gateway_metrics
+from app.services.model_router import budget_from_headers, get_routing_metrics
+from app.services.meeting_warmup import (
+    get_meeting_warmup,
+    get_warmup_metrics,
+    opening_or_generate,
+    start_meeting_warmup,
+    warmed_context,
+    warmed_template
+)
+from app.services.prompt_assembly import get_assembly_metrics
+from app.services.question_memory import get_question_memory_metrics
+from app.services.relationship_digest import (
+    get_digest_block,
+    get_relationship_digest,
+    update_relationship_digest
+)
+from app.services.relationship_registry import (
+    StaleRelationshipVersion,
+    get_registry_metrics,
+    get_relationship,
+    register_relationship,
+    relationship_status
+)
+from app.services.sentence_index import get_answered_check_metrics
+import json
 import logging
 import os
 from dotenv import load_dotenv
@@ -20,6 +74,9 @@ load_dotenv()
 # Mock 모드 설정
 MOCK_MODE = os.getenv("MOCK_MODE", "false").lower() == "true"
 
+# 롱 폴링 / SSE 대기 상한 (ms)
+MAX_WAIT_MS = 30000
+
 app = FastAPI(title="Onno AI Service", version="0.2.0")
 
 # CORS 설정
@@ -43,6 +100,15 @@ class QuestionRequest(BaseModel):
 class ContextAwareQuestionRequest(BaseModel):
     transcript: str
     previous_transcripts: Optional[List[str]] = None
+    meeting_id: Optional[str] = None  # 있으면 회의별 전사 윈도우 유지
+
+
+class FastQuestionRequest(BaseModel):
+    """2단계 질문 생성 요청 (휴리스틱 즉시 응답 → LLM 교체)"""
+    transcript: str
+    previous_transcripts: Optional[List[str]] = None
+    meeting_id: Optional[str] = None
+    relationship_type: Optional[str] = None  # STARTUP, CLIENT, PARTNER
 
 
 class RelationshipContext(BaseModel):
@@ -57,10 +123,19 @@ class RelationshipContext(BaseModel):
     recent_meetings: Optional[List[dict]] = None  # 이전 미팅 요약
 
 
+class RelationshipRegistration(BaseModel):
+    """관계 맥락 등록/갱신 (이후 질문 요청은 relationship_id + 버전만 전송)"""
+    version: int
+    relationship: RelationshipContext
+
+
 class RelationshipAwareQuestionRequest(BaseModel):
     """관계 맥락 기반 질문 생성 요청"""
     transcript: str
     relationship: Optional[RelationshipContext] = None
+    relationship_id: Optional[str] = None  # 등록된 관계 맥락 사용 (없거나 버전이 다르면 relationship으로 대체)
+    relationship_version: Optional[int] = None
+    meeting_id: Optional[str] = None  # 있으면 미팅 시작 시 준비한 오프닝 질문 / 맥락 재사용
 
 
 class PersonalizationContext(BaseModel):
@@ -77,7 +152,31 @@ class PersonalizedQuestionRequest(BaseModel):
     """Phase 3: 개인화된 질문 생성 요청"""
     transcript: str
     relationship: Optional[RelationshipContext] = None
+    relationship_id: Optional[str] = None  # 등록된 관계 맥락 사용 (없거나 버전이 다르면 relationship으로 대체)
+    relationship_version: Optional[int] = None
+    personalization: Optional[PersonalizationContext] = None
+    provider: Optional[Literal["openai", "anthropic"]] = None  # 없으면 라우터 결정
+    meeting_id: Optional[str] = None  # 있으면 미팅 시작 시 준비한 오프닝 질문 / 맥락 재사용
+
+
+class MeetingWarmupRequest(BaseModel):
+    """미팅 시작 준비 요청 (join_meeting 시점, personalization이 있으면 개인화 프롬프트로 준비)"""
+    relationship: Optional[RelationshipContext] = None
+    relationship_id: Optional[str] = None
+    relationship_version: Optional[int] = None
     personalization: Optional[PersonalizationContext] = None
+    provider: Optional[Literal["openai", "anthropic"]] = None
+
+
+class PersonaVariant(BaseModel):
+    """다중 페르소나 생성: 세트 하나"""
+    persona: str  # ANALYST, BUDDY, GUARDIAN, VISIONARY
+    level: Optional[int] = None  # 없으면 personalization.level
+
+
+class MultiPersonaQuestionRequest(PersonalizedQuestionRequest):
+    """다중 페르소나 질문 생성 요청 (없으면 전체 페르소나)"""
+    variants: List[PersonaVariant] = []
 
 
 class TranscriptItem(BaseModel):
@@ -100,6 +199,100 @@ class SummaryRequest(BaseModel):
     transcripts: List[TranscriptItem]
     questions: List[QuestionItem] = []
     relationship_context: Optional[Dict[str, Any]] = None
+    meeting_id: Optional[str] = None  # 있으면 회의 중 누적 요약 재사용
+    relationship_id: Optional[str] = None  # 있으면 요약 후 관계 메모리 요약 갱신
+    meeting_date: Optional[str] = None  # YYYY-MM-DD (관계 메모리의 지표 날짜, 없으면 오늘)
+
+
+class SummaryJobRequest(SummaryRequest):
+    """회의 요약 백그라운드 작업 제출"""
+    priority: int = Field(5, ge=0, le=9)  # 낮을수록 먼저 처리
+    callback_url: Optional[str] = None  # 완료 시 결과를 POST할 로컬 URL
+
+
+class SummaryIngestRequest(BaseModel):
+    """회의 중 누적 요약용 전사 전송 (이전 전송 이후의 새 발화만)"""
+    meeting_id: str
+    transcripts: List[TranscriptItem]
+
+
+class DataUpdateRequest(BaseModel):
+    """구조화 데이터 변화 감지 요청 (LLM 호출 없음)"""
+    transcripts: List[TranscriptItem] = []
+    meeting_id: Optional[str] = None  # 전사 없이 회의 세션의 사실 테이블 사용
+    structured_data: Optional[Dict[str, Any]] = None
+    relationship_context: Optional[Dict[str, Any]] = None
+
+
+def resolve_relationship(
+    relationship: Optional[RelationshipContext],
+    relationship_id: Optional[str],
+    version: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    """
+    질문 요청의 관계 맥락 (등록된 맥락 우선, 없으면 요청에 포함된 payload)
+
+    ID와 payload가 함께 오고 레지스트리에 없으면 payload를 등록해 다음 요청부터 재사용
+    ID만 오고 레지스트리에 없으면 409 (백엔드가 전체 payload로 재요청)
+    관계 메모리 요약이 있으면 memory_digest로 함께 전달 (이전 미팅 히스토리 대신 사용)
+    """
+    if relationship_id:
+        relationship_dict = _registered_or_inline(relationship, relationship_id, version)
+        digest = get_digest_block(relationship_id)
+        return {**relationship_dict, "memory_digest": digest} if digest else relationship_dict
+    return relationship.model_dump() if relationship else None
+
+
+def _registered_or_inline(
+    relationship: Optional[RelationshipContext],
+    relationship_id: str,
+    version: Optional[int]
+) -> Dict[str, Any]:
+    """등록된 관계 맥락, 없으면 요청 payload (등록 후 반환)"""
+    cached = get_relationship(relationship_id, version)
+    if cached is not None:
+        return cached
+    if relationship is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Relationship {relationship_id} (version {version}) is not registered, send the full relationship"
+        )
+    relationship_dict = relationship.model_dump()
+    if version is not None:
+        try:
+            register_relationship(relationship_id, version, relationship_dict)
+        except StaleRelationshipVersion as e:
+            logger.warning(f"Inline relationship not registered: {e}")
+    return relationship_dict
+
+
+def relationship_request_context(request: RelationshipAwareQuestionRequest):
+    """
+    관계 질문 요청의 (관계 맥락, 미리 채운 템플릿)
+
+    요청에 맥락이 없고 meeting_id가 있으면 미팅 시작 시 준비한 맥락과 템플릿 사용
+    """
+    if request.relationship or request.relationship_id or not request.meeting_id:
+        return resolve_relationship(request.relationship, request.relationship_id, request.relationship_version), None
+    warm = warmed_context(request.meeting_id)
+    return (warm["relationship"], warmed_template(warm, "relationship")) if warm else (None, None)
+
+
+def personalized_request_context(request: PersonalizedQuestionRequest):
+    """
+    개인화 질문 요청의 (관계 맥락, 개인화 정보, 미리 채운 템플릿)
+
+    요청에 맥락이 없고 meeting_id가 있으면 미팅 시작 시 준비한 맥락과 템플릿 사용
+    """
+    if request.relationship or request.relationship_id or request.personalization or not request.meeting_id:
+        relationship_dict = resolve_relationship(
+            request.relationship, request.relationship_id, request.relationship_version
+        )
+        return relationship_dict, request.personalization.model_dump() if request.personalization else None, None
+    warm = warmed_context(request.meeting_id)
+    if warm is None:
+        return None, None, None
+    return warm["relationship"], warm["personalization"], warmed_template(warm, "personalized")
 
 
 @app.get("/health")
@@ -112,10 +305,29 @@ async def health():
     }
 
 
+@app.get("/api/metrics")
+async def metrics():
+    """서비스 내부 메트릭 (LLM 응답 파싱 실패율 등)"""
+    return {
+        "json_parse": get_parse_metrics(),
+        "routing": get_routing_metrics(),
+        "gateway": get_gateway_metrics(),
+        "summary_jobs": get_job_metrics(),
+        "personalized_cache": get_personalized_metrics(),
+        "prompt_assembly": get_assembly_metrics(),
+        "relationship_registry": get_registry_metrics(),
+        "meeting_warmup": get_warmup_metrics(),
+        "question_memory": get_question_memory_metrics(),
+        "answered_check": get_answered_check_metrics(),
+    }
+
+
 @app.post("/api/stt/transcribe")
-async def transcribe(audio: UploadFile = File(...)):
+async def transcribe(audio: UploadFile = File(...), meeting_id: Optional[str] = Form(None)):
     """
     음성 파일을 받아 텍스트로 전사
+
+    meeting_id가 있으면 회의별 역할 추적기로 화자 역할을 누적 추정
     """
     try:
         logger.info(f"Transcribing audio: {audio.filename}, size: {audio.size} (Mock: {MOCK_MODE})")
@@ -124,7 +336,7 @@ async def transcribe(audio: UploadFile = File(...)):
             result = await mock_transcribe_audio(audio.file)
             logger.info(f"[MOCK] Transcription complete: {result['latency']:.2f}s")
         else:
-            result = await transcribe_audio(audio.file)
+            result = await transcribe_audio(audio.file, meeting_id)
             logger.info(f"Transcription complete: {result['latency']:.2f}s, provider: {result.get('provider', 'unknown')}")
 
         return result
@@ -143,10 +355,64 @@ async def transcribe(audio: UploadFile = File(...)):
         }
 
 
+@app.get("/api/speakers/roles/{meeting_id}")
+async def speaker_roles(meeting_id: str):
+    """회의별 화자 역할 추적 결과 (재계산 없이 누적 상태 조회)"""
+    tracker = peek_role_tracker(meeting_id)
+    if tracker is None:
+        raise HTTPException(status_code=404, detail="Unknown meeting")
+    return {"meeting_id": meeting_id, "utterances": tracker.utterances, "speakers": tracker.roles()}
+
+
+@app.post("/api/meetings/{meeting_id}/warmup")
+async def meeting_warmup_endpoint(meeting_id: str, request: MeetingWarmupRequest):
+    """
+    미팅 시작 준비 (join_meeting 시점, 첫 오디오 청크 전에 호출)
+
+    - 관계/개인화 블록을 미리 채운 프롬프트 템플릿을 회의 ID로 보관
+    - 1단계 오프닝 질문을 백그라운드로 생성 → meeting_id를 포함한 첫 /api/questions/* 요청에 바로 반환
+    - 이후 질문 요청은 맥락 없이 meeting_id만 보내도 준비된 맥락/템플릿 사용
+    """
+    try:
+        relationship_dict = resolve_relationship(
+            request.relationship, request.relationship_id, request.relationship_version
+        )
+        status = start_meeting_warmup(
+            meeting_id,
+            relationship_dict,
+            request.personalization.model_dump() if request.personalization else None,
+            request.provider,
+            mock_generate_questions("") if MOCK_MODE else None
+        )
+        logger.info(f"Meeting warmup {'reused' if status['reused'] else 'started'}: {meeting_id} ({status['kind']})")
+        return {"success": True, "data": status}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Meeting warmup error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/meetings/{meeting_id}/warmup")
+async def meeting_warmup_status_endpoint(meeting_id: str):
+    """미팅 시작 준비 상태 (pending | done | failed, 오프닝 질문 반환 여부)"""
+    status = get_meeting_warmup(meeting_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Meeting was not warmed up")
+    return {"success": True, "data": status}
+
+
 @app.post("/api/questions/generate")
-async def generate_questions_endpoint(request: QuestionRequest):
+async def generate_questions_endpoint(
+    request: QuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
     """
     대화 전사를 받아 AI 질문 생성
+
+    - X-Latency-Budget-Ms / X-Request-Deadline 헤더로 지연 예산 지정 가능
     """
     try:
         logger.info(f"Generating questions for transcript length: {len(request.transcript)} (Mock: {MOCK_MODE})")
@@ -155,7 +421,8 @@ async def generate_questions_endpoint(request: QuestionRequest):
             result = await mock_generate_questions(request.transcript)
             logger.info(f"[MOCK] Generated {len(result['questions'])} questions")
         else:
-            result = await generate_questions(request.transcript)
+            budget_ms = budget_from_headers(x_latency_budget_ms, x_request_deadline)
+            result = await generate_questions(request.transcript, budget_ms)
             logger.info(f"Generated {len(result['questions'])} questions")
 
         return result
@@ -166,7 +433,11 @@ async def generate_questions_endpoint(request: QuestionRequest):
 
 
 @app.post("/api/questions/generate-with-context")
-async def generate_questions_with_context_endpoint(request: ContextAwareQuestionRequest):
+async def generate_questions_with_context_endpoint(
+    request: ContextAwareQuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
     """
     맥락을 고려한 AI 질문 생성
 
@@ -184,9 +455,15 @@ async def generate_questions_with_context_endpoint(request: ContextAwareQuestion
             result = await mock_generate_questions(request.transcript)
             logger.info(f"[MOCK] Generated {len(result['questions'])} questions")
         else:
-            result = await generate_questions_with_context(
-                request.transcript,
-                request.previous_transcripts
+            result = await opening_or_generate(
+                request.meeting_id,
+                budget_from_headers(x_latency_budget_ms, x_request_deadline),
+                lambda budget_ms: generate_questions_with_context(
+                    request.transcript,
+                    request.previous_transcripts,
+                    request.meeting_id,
+                    budget_ms
+                )
             )
             logger.info(f"Generated {len(result['questions'])} context-aware questions")
 
@@ -197,8 +474,153 @@ async def generate_questions_with_context_endpoint(request: ContextAwareQuestion
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _start_fast_questions(request: FastQuestionRequest, budget_ms: Optional[float]) -> dict:
+    """휴리스틱 질문을 즉시 만들고 LLM 질문 생성은 백그라운드로 시작"""
+    all_transcripts = (request.previous_transcripts or []) + [request.transcript]
+    if request.meeting_id:
+        # 회의 세션은 LLM 단계에서 같은 전사로 다시 동기화되므로 증분 분석은 한 번만 수행됨
+        session = get_context_session(request.meeting_id)
+        session.sync(all_transcripts)
+        result = generate_heuristic_questions(
+            all_transcripts,
+            request.relationship_type,
+            session.mentioned_context(),
+            session.stage
+        )
+    else:
+        result = generate_heuristic_questions(all_transcripts, request.relationship_type)
+
+    if MOCK_MODE:
+        job = mock_generate_questions(request.transcript)
+    else:
+        job = opening_or_generate(
+            request.meeting_id,
+            budget_ms,
+            lambda remaining_ms: generate_questions_with_context(
+                request.transcript,
+                list(request.previous_transcripts or []),
+                request.meeting_id,
+                remaining_ms
+            )
+        )
+    result["request_id"] = submit_llm_questions(job)
+    result["status"] = "pending"
+    return result
+
+
+@app.post("/api/questions/generate-fast")
+async def generate_fast_questions_endpoint(
+    request: FastQuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
+    """
+    2단계 질문 생성 (폴링 방식)
+
+    - 아직 언급되지 않은 지표/주제 기반 템플릿 질문을 즉시 반환
+    - LLM 질문은 백그라운드에서 생성, /api/questions/result/{request_id}로 조회
+    """
+    try:
+        result = _start_fast_questions(request, budget_from_headers(x_latency_budget_ms, x_request_deadline))
+        logger.info(f"Returned {len(result['questions'])} heuristic questions (request_id={result['request_id']})")
+        return result
+
+    except Exception as e:
+        logger.error(f"Fast question generation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/questions/result/{request_id}")
+async def get_question_result_endpoint(request_id: str, wait_ms: int = 0):
+    """
+    백그라운드 LLM 질문 결과 조회
+
+    - wait_ms > 0이면 결과가 나올 때까지 최대 wait_ms 동안 대기 (롱 폴링)
+    """
+    if wait_ms > 0:
+        status = await wait_llm_questions(request_id, min(wait_ms, MAX_WAIT_MS) / 1000)
+    else:
+        status = get_llm_questions(request_id)
+
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired request_id")
+    return status
+
+
+@app.post("/api/questions/stream")
+async def stream_questions_endpoint(
+    request: FastQuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
+    """
+    2단계 질문 생성 (SSE 방식)
+
+    - event: heuristic → 템플릿 질문 (즉시)
+    - event: llm → LLM 질문 (생성 완료 시), 실패하면 event: error
+    - 지연 예산(없으면 MAX_WAIT_MS) 안에 끝나지 않으면 event: error (timeout, request_id로 이후 결과 조회)
+    """
+    budget_ms = budget_from_headers(x_latency_budget_ms, x_request_deadline)
+    result = _start_fast_questions(request, budget_ms)
+    # 예산이 없어도 연결을 무한정 잡고 있지 않도록 상한 적용 (이후 결과는 /api/questions/result로 조회)
+    wait_ms = min(budget_ms, MAX_WAIT_MS) if budget_ms is not None else MAX_WAIT_MS
+
+    def sse(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    async def events():
+        yield sse("heuristic", result)
+        status = await wait_llm_questions(result["request_id"], wait_ms / 1000)
+        if status and status["status"] == "done":
+            yield sse("llm", status["result"])
+        elif status and status["status"] == "pending":
+            yield sse("error", {"error": "timeout", "request_id": result["request_id"]})
+        else:
+            yield sse("error", {"error": status["error"] if status else "expired"})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.put("/api/relationships/{relationship_id}")
+async def register_relationship_endpoint(relationship_id: str, request: RelationshipRegistration):
+    """
+    관계 맥락 등록/갱신
+
+    - 관계 맥락이 바뀔 때(미팅 종료, 구조화 데이터 수정 등)마다 버전을 올려 등록
+    - 이후 질문 요청은 relationship_id + relationship_version만 전송
+    - 등록된 버전보다 오래된 버전은 409
+    """
+    try:
+        result = register_relationship(relationship_id, request.version, request.relationship.model_dump())
+        return {"success": True, "data": result}
+    except StaleRelationshipVersion as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@app.get("/api/relationships/{relationship_id}")
+async def relationship_status_endpoint(relationship_id: str):
+    """등록된 관계 맥락의 버전 확인"""
+    status = relationship_status(relationship_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Relationship not registered")
+    return {"success": True, "data": status}
+
+
+@app.get("/api/relationships/{relationship_id}/digest")
+async def relationship_digest_endpoint(relationship_id: str):
+    """관계 메모리 요약 (회의 요약마다 갱신되는 최신 지표 / 미해결 후속 조치 / 열린 질문)"""
+    digest = get_relationship_digest(relationship_id)
+    if digest is None:
+        raise HTTPException(status_code=404, detail="No digest for this relationship")
+    return {"success": True, "data": digest}
+
+
 @app.post("/api/questions/generate-with-relationship")
-async def generate_questions_with_relationship_endpoint(request: RelationshipAwareQuestionRequest):
+async def generate_questions_with_relationship_endpoint(
+    request: RelationshipAwareQuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
     """
     관계 객체 맥락을 활용한 AI 질문 생성 (Phase 2 핵심)
 
@@ -213,43 +635,44 @@ async def generate_questions_with_relationship_endpoint(request: RelationshipAwa
         logger.info(f"Generating relationship-aware questions (Mock: {MOCK_MODE})")
         logger.info(f"Transcript length: {len(request.transcript)}")
 
-        if request.relationship:
-            logger.info(f"Relationship: {request.relationship.name} ({request.relationship.type})")
-            logger.info(f"Meeting number: {request.relationship.meeting_number}")
-
         if MOCK_MODE:
             result = await mock_generate_questions(request.transcript)
             logger.info(f"[MOCK] Generated {len(result['questions'])} questions")
         else:
-            # 관계 정보를 dict로 변환
-            relationship_dict = None
-            if request.relationship:
-                relationship_dict = {
-                    "name": request.relationship.name,
-                    "type": request.relationship.type,
-                    "industry": request.relationship.industry,
-                    "stage": request.relationship.stage,
-                    "notes": request.relationship.notes,
-                    "structured_data": request.relationship.structured_data,
-                    "meeting_number": request.relationship.meeting_number,
-                    "recent_meetings": request.relationship.recent_meetings,
-                }
-
-            result = await generate_questions_with_relationship(
-                request.transcript,
-                relationship_dict
+            # 관계 정보 (등록된 맥락, 요청 payload 또는 미팅 시작 시 준비한 맥락)
+            relationship_dict, template = relationship_request_context(request)
+            if relationship_dict:
+                logger.info(f"Relationship: {relationship_dict['name']} ({relationship_dict['type']})")
+                logger.info(f"Meeting number: {relationship_dict['meeting_number']}")
+
+            result = await opening_or_generate(
+                request.meeting_id,
+                budget_from_headers(x_latency_budget_ms, x_request_deadline),
+                lambda budget_ms: generate_questions_with_relationship(
+                    request.transcript,
+                    relationship_dict,
+                    budget_ms,
+                    template,
+                    meeting_id=request.meeting_id
+                )
             )
             logger.info(f"Generated {len(result['questions'])} relationship-aware questions")
 
         return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Relationship-aware question generation error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/questions/generate-personalized")
-async def generate_personalized_questions_endpoint(request: PersonalizedQuestionRequest):
+async def generate_personalized_questions_endpoint(
+    request: PersonalizedQuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
     """
     Phase 3: 개인화된 AI 질문 생성
 
@@ -270,48 +693,87 @@ async def generate_personalized_questions_endpoint(request: PersonalizedQuestion
             result = await mock_generate_questions(request.transcript)
             logger.info(f"[MOCK] Generated {len(result['questions'])} questions")
         else:
-            # 관계 정보 변환
-            relationship_dict = None
-            if request.relationship:
-                relationship_dict = {
-                    "name": request.relationship.name,
-                    "type": request.relationship.type,
-                    "industry": request.relationship.industry,
-                    "stage": request.relationship.stage,
-                    "notes": request.relationship.notes,
-                    "structured_data": request.relationship.structured_data,
-                    "meeting_number": request.relationship.meeting_number,
-                    "recent_meetings": request.relationship.recent_meetings,
-                }
-
-            # 개인화 정보 변환
-            personalization_dict = None
-            if request.personalization:
-                personalization_dict = {
-                    "user_id": request.personalization.user_id,
-                    "domain": request.personalization.domain,
-                    "level": request.personalization.level,
-                    "persona": request.personalization.persona,
-                    "features": request.personalization.features,
-                    "preferences": request.personalization.preferences,
-                }
-
-            result = await generate_personalized_questions(
-                request.transcript,
-                relationship_dict,
-                personalization_dict
+            # 관계/개인화 정보 (요청 payload, 등록된 맥락 또는 미팅 시작 시 준비한 맥락)
+            relationship_dict, personalization_dict, template = personalized_request_context(request)
+
+            result = await opening_or_generate(
+                request.meeting_id,
+                budget_from_headers(x_latency_budget_ms, x_request_deadline),
+                lambda budget_ms: generate_personalized_questions(
+                    request.transcript,
+                    relationship_dict,
+                    personalization_dict,
+                    budget_ms,
+                    request.provider,
+                    template,
+                    request.meeting_id
+                )
             )
             logger.info(f"Generated {len(result['questions'])} personalized questions")
 
         return result
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Personalized question generation error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/questions/generate-personalized-multi")
+async def generate_multi_persona_questions_endpoint(
+    request: MultiPersonaQuestionRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
+    """
+    여러 페르소나/레벨의 개인화 질문 세트를 한 번의 LLM 호출로 생성 (페르소나 비교용)
+
+    - 전사와 관계/선호도 맥락은 프롬프트에 한 번만 포함
+    - 결과는 요청한 세트 순서대로 분리되고 세트별로 선호도 우선순위 조정 적용
+    """
+    try:
+        logger.info(f"Generating multi-persona questions: {len(request.variants) or 'all'} sets (Mock: {MOCK_MODE})")
+
+        if MOCK_MODE:
+            mock = await mock_generate_questions(request.transcript)
+            variants = request.variants or [PersonaVariant(persona=p) for p in ["ANALYST", "BUDDY", "GUARDIAN", "VISIONARY"]]
+            level = request.personalization.level if request.personalization else 1
+            return {
+                "sets": [
+                    {"persona": v.persona, "level": v.level or level, "questions": mock["questions"]}
+                    for v in variants
+                ],
+                "stage": mock.get("stage", "unknown"),
+                "analysis": mock.get("analysis", ""),
+            }
+
+        # 세트 비교용 응답 형식이 달라 오프닝 질문은 사용하지 않고 준비된 맥락만 재사용
+        relationship_dict, personalization_dict, _ = personalized_request_context(request)
+        result = await generate_multi_persona_questions(
+            request.transcript,
+            relationship_dict,
+            personalization_dict,
+            [v.model_dump() for v in request.variants],
+            budget_from_headers(x_latency_budget_ms, x_request_deadline),
+            request.provider
+        )
+        logger.info(f"Generated {len(result['sets'])} persona question sets")
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Multi-persona question generation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/api/summary/generate")
-async def generate_summary_endpoint(request: SummaryRequest):
+async def generate_summary_endpoint(
+    request: SummaryRequest,
+    x_latency_budget_ms: Optional[str] = Header(None),
+    x_request_deadline: Optional[str] = Header(None)
+):
     """
     Phase 3: 회의 자동 요약 생성
 
@@ -328,58 +790,196 @@ async def generate_summary_endpoint(request: SummaryRequest):
         logger.info(f"Generating meeting summary (Mock: {MOCK_MODE})")
         logger.info(f"Transcripts: {len(request.transcripts)}, Questions: {len(request.questions)}")
 
-        if MOCK_MODE:
-            # Mock 요약 반환
-            result = {
-                "success": True,
-                "data": {
-                    "summary": f"회의가 {len(request.transcripts)}개의 발화로 진행되었습니다.",
-                    "key_points": ["주요 논의 사항 1", "주요 논의 사항 2"],
-                    "decisions": [],
-                    "action_items": [],
-                    "key_questions": [q.text for q in request.questions if q.is_used][:3],
-                    "missed_questions": [q.text for q in request.questions if not q.is_used][:3],
-                    "suggested_data_updates": {},
-                    "next_meeting_agenda": [],
-                }
+        result = await _run_summary(request, budget_from_headers(x_latency_budget_ms, x_request_deadline))
+        logger.info("Generated meeting summary")
+        return result
+
+    except Exception as e:
+        logger.error(f"Summary generation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _run_summary(
+    request: SummaryRequest,
+    budget_ms: Optional[float] = None,
+    fallback_on_error: bool = True
+) -> dict:
+    """
+    요약 요청 처리 (동기 엔드포인트와 백그라운드 작업이 공유)
+
+    백그라운드 작업은 fallback_on_error=False로 실행해 LLM 실패를 재시도하고,
+    재시도를 모두 실패하면 budget_ms=0(추출 요약)으로 대체 실행
+    """
+    if MOCK_MODE:
+        # Mock 요약 반환
+        return {
+            "success": True,
+            "data": {
+                "summary": f"회의가 {len(request.transcripts)}개의 발화로 진행되었습니다.",
+                "key_points": ["주요 논의 사항 1", "주요 논의 사항 2"],
+                "decisions": [],
+                "action_items": [],
+                "key_questions": [q.text for q in request.questions if q.is_used][:3],
+                "missed_questions": [q.text for q in request.questions if not q.is_used][:3],
+                "suggested_data_updates": {},
+                "next_meeting_agenda": [],
             }
-            logger.info("[MOCK] Generated summary")
-        else:
-            # 전사 데이터 변환
-            transcripts = [
-                {
-                    "text": t.text,
-                    "speaker": t.speaker,
-                    "speaker_role": t.speaker_role,
-                    "start_time": t.start_time,
-                }
-                for t in request.transcripts
-            ]
-
-            # 질문 데이터 변환
-            questions = [
-                {
-                    "text": q.text,
-                    "category": q.category,
-                    "is_used": q.is_used,
-                }
-                for q in request.questions
-            ]
-
-            summary = await generate_meeting_summary(
-                transcripts,
-                questions,
-                request.relationship_context
+        }
+
+    # 전사 데이터 변환
+    transcripts = [
+        {
+            "text": t.text,
+            "speaker": t.speaker,
+            "speaker_role": t.speaker_role,
+            "start_time": t.start_time,
+        }
+        for t in request.transcripts
+    ]
+
+    # 질문 데이터 변환
+    questions = [
+        {
+            "text": q.text,
+            "category": q.category,
+            "is_used": q.is_used,
+        }
+        for q in request.questions
+    ]
+
+    summary = await generate_meeting_summary(
+        transcripts,
+        questions,
+        request.relationship_context,
+        budget_ms,
+        request.meeting_id,
+        fallback_on_error
+    )
+
+    # 다음 미팅 질문 프롬프트용 관계 메모리 갱신 (요약 결과에는 영향 없음)
+    if request.relationship_id:
+        try:
+            update_relationship_digest(request.relationship_id, summary, request.meeting_id, request.meeting_date)
+        except Exception as e:
+            logger.warning(f"Relationship digest update failed ({request.relationship_id}): {e}")
+
+    return {
+        "success": True,
+        "data": summary
+    }
+
+
+@app.post("/api/summary/jobs")
+async def submit_summary_job_endpoint(request: SummaryJobRequest):
+    """
+    회의 요약 백그라운드 작업 제출 (job_id 즉시 반환)
+
+    - 결과는 /api/summary/jobs/{job_id} 폴링 또는 callback_url(로컬 백엔드)로 수신
+    - 같은 회의 + 같은 내용의 중복 제출은 기존 작업 job_id 반환
+    - priority: 0~9, 낮을수록 먼저 처리
+    """
+    try:
+        callback_url = validate_callback_url(request.callback_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 작업 전용 필드(priority, callback_url)만 빼고 그대로 전달 (관계 메모리 갱신에 필요한 필드 포함)
+    summary_request = SummaryRequest(**request.model_dump(include=set(SummaryRequest.model_fields)))
+    try:
+        job = submit_summary_job(
+            request.meeting_id,
+            summary_request.model_dump(),
+            lambda: _run_summary(summary_request, fallback_on_error=False),
+            request.priority,
+            callback_url,
+            fallback=lambda: _run_summary(summary_request, budget_ms=0)
+        )
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return {"success": True, "data": job}
+
+
+@app.get("/api/summary/jobs/{job_id}")
+async def get_summary_job_endpoint(job_id: str, wait_ms: int = 0):
+    """
+    요약 작업 상태/결과 조회
+
+    - wait_ms > 0이면 작업이 끝날 때까지 최대 wait_ms 동안 대기 (롱 폴링)
+    """
+    if wait_ms > 0:
+        status = await wait_summary_job(job_id, min(wait_ms, MAX_WAIT_MS) / 1000)
+    else:
+        status = get_summary_job(job_id)
+
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job_id")
+    return status
+
+
+@app.post("/api/summary/ingest")
+async def summary_ingest_endpoint(request: SummaryIngestRequest):
+    """
+    회의 중 전사 증분 전송 (누적 요약 갱신)
+
+    - 새 발화가 일정 분량(ROLLING_SUMMARY_INTERVAL_*) 쌓이면 백그라운드에서 새 구간만 요약에 반영
+    - 회의 종료 시 /api/summary/generate에 같은 meeting_id를 넘기면 누적 요약 + 꼬리 발화만으로 요약
+    """
+    try:
+        rolling = get_rolling_summary(request.meeting_id)
+        rolling.ingest(
+            [format_transcript_line(t.model_dump()) for t in request.transcripts],
+            [t.start_time for t in request.transcripts]
+        )
+        if not MOCK_MODE:
+            rolling.schedule_update()
+
+        return {"success": True, "data": rolling.status()}
+
+    except Exception as e:
+        logger.error(f"Summary ingest error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/summary/data-updates")
+async def summary_data_updates_endpoint(request: DataUpdateRequest):
+    """
+    회의 수치 변화 감지 (LLM 없이 즉시 응답)
+
+    - 회의에서 언급된 MRR, CAC, LTV, Churn, 번 레이트, 런웨이 등을 기존 구조화 데이터와 비교
+    - 변화량과 모순(기존 값과 크게 다르거나 회의 중 값이 엇갈림) 표시
+    - 자동 반영 가능한 suggested_data_updates
+    - 전사 없이 meeting_id만 보내면 회의 세션의 사실 테이블 사용 (세션이 없거나 만료되었으면 404)
+    """
+    try:
+        structured_data = request.structured_data
+        if structured_data is None:
+            structured_data = get_structured_data(request.relationship_context)
+
+        if request.transcripts:
+            data_updates = detect_data_updates_from_transcripts(
+                [t.text for t in request.transcripts],
+                structured_data
             )
+        elif request.meeting_id:
+            session = peek_context_session(request.meeting_id)
+            if session is None:
+                raise HTTPException(status_code=404, detail="Unknown or expired meeting_id")
+            data_updates = detect_data_updates(session.facts.by_label, structured_data)
+        else:
+            raise HTTPException(status_code=400, detail="transcripts or meeting_id is required")
 
-            result = {
-                "success": True,
-                "data": summary
+        return {
+            "success": True,
+            "data": {
+                "suggested_data_updates": data_updates["updates"],
+                "deltas": data_updates["deltas"],
+                "contradictions": data_updates["contradictions"],
             }
-            logger.info("Generated meeting summary")
-
-        return result
+        }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Summary generation error: {str(e)}")
+        logger.error(f"Data update detection error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
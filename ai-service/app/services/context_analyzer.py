@@ -1,13 +1,20 @@
 """
 맥락 분석기 (Context Analyzer)
 - 이미 언급된 주제 추출
-- 중복 질문 필터링
+- 중복 질문 필터링 (키워드/지표 + 전사 문장 기준 답변 여부)
+- 회의별 증분 맥락 세션 (새 청크만 분석)
 """
 
 import re
-from typing import List, Dict, Set
+from collections import deque
+from typing import List, Dict, Optional, Set, Tuple
 import logging
 
+from app.services.numeric_facts import FactTable, extract_fact_snippets
+from app.services.pattern_engine import PatternEngine
+from app.services.sentence_index import MAX_INDEXES, SentenceIndex
+from app.services.session_store import ChunkCursor, SessionStore
+
 logger = logging.getLogger(__name__)
 
 # 주요 지표/용어 패턴
@@ -40,6 +47,50 @@ TOPIC_PATTERNS = {
     'PRODUCT': r'제품\s*특징|핵심\s*기능|MVP|프로덕트',
 }
 
+# 토픽 한글 이름
+TOPIC_NAMES = {
+    'BUSINESS_MODEL': '비즈니스 모델',
+    'TEAM': '팀 구성',
+    'MARKET': '시장',
+    'TECHNOLOGY': '기술',
+    'TRACTION': '트랙션',
+    'FUNDING': '투자/자금',
+    'RISKS': '리스크',
+    'COMPETITION': '경쟁',
+    'CUSTOMER': '고객',
+    'PRODUCT': '제품',
+}
+
+# 지표/토픽 패턴을 한 번의 스캔으로 매칭
+MENTION_ENGINE = PatternEngine({"metric": METRIC_PATTERNS, "topic": TOPIC_PATTERNS})
+
+
+def scan_mentions(text: str, min_end: int = 0) -> Tuple[Set[str], Set[str], Set[str]]:
+    """
+    텍스트에서 지표/토픽/키워드 추출
+
+    Args:
+        text: 분석할 텍스트
+        min_end: 이 위치 이후에서 끝나는 매칭만 사용 (증분 스캔 시 이미 본 구간 제외)
+
+    Returns:
+        (언급된 지표, 논의된 토픽, 매칭된 키워드)
+    """
+    metrics_mentioned = set()
+    topics_discussed = set()
+    keywords_found = set()
+
+    for table, key, _, end, matched in MENTION_ENGINE.scan(text):
+        if end <= min_end:
+            continue
+        if table == "metric":
+            metrics_mentioned.add(key)
+        else:
+            topics_discussed.add(key)
+        keywords_found.add(matched)
+
+    return metrics_mentioned, topics_discussed, keywords_found
+
 
 def extract_mentioned_topics(transcripts: List[str]) -> Dict[str, Set[str]]:
     """
@@ -55,25 +106,7 @@ def extract_mentioned_topics(transcripts: List[str]) -> Dict[str, Set[str]]:
             "keywords_found": {"월매출", "창업팀", ...}
         }
     """
-    combined_text = " ".join(transcripts)
-
-    metrics_mentioned = set()
-    topics_discussed = set()
-    keywords_found = set()
-
-    # 지표 추출
-    for metric, pattern in METRIC_PATTERNS.items():
-        matches = re.findall(pattern, combined_text, re.IGNORECASE)
-        if matches:
-            metrics_mentioned.add(metric)
-            keywords_found.update(matches)
-
-    # 토픽 추출
-    for topic, pattern in TOPIC_PATTERNS.items():
-        matches = re.findall(pattern, combined_text, re.IGNORECASE)
-        if matches:
-            topics_discussed.add(topic)
-            keywords_found.update(matches)
+    metrics_mentioned, topics_discussed, keywords_found = scan_mentions(" ".join(transcripts))
 
     logger.info(f"Extracted metrics: {metrics_mentioned}")
     logger.info(f"Extracted topics: {topics_discussed}")
@@ -89,27 +122,152 @@ def extract_answered_questions(transcripts: List[str]) -> List[str]:
     """
     전사 내용에서 이미 답변된 질문/정보 추출
 
-    특정 패턴을 찾아 이미 언급된 정보를 식별:
-    - "~입니다", "~있습니다" 형태의 답변
-    - 숫자 + 단위 형태의 정보 (100만원, 50%, 10명 등)
+    숫자 + 단위 형태의 정보 (100만원, 50%, 10명, 18개월, 2020년 등) 주변 문맥을
+    수치 토크나이저로 한 번에 추출 (등장 순, 최대 10개)
     """
-    combined_text = " ".join(transcripts)
-    answered = []
+    return extract_fact_snippets(transcripts, limit=10)
+
+
+# 질문 카테고리 → 토픽 매핑
+CATEGORY_TOPIC_MAP = {
+    'BUSINESS_MODEL': 'BUSINESS_MODEL',
+    'TRACTION': 'TRACTION',
+    'TEAM': 'TEAM',
+    'MARKET': 'MARKET',
+    'TECHNOLOGY': 'TECHNOLOGY',
+    'FINANCIALS': 'FUNDING',
+    'RISKS': 'RISKS',
+}
 
-    # 숫자 정보가 포함된 문장 추출
-    number_patterns = [
-        r'[0-9,]+\s*만?\s*원',  # 금액
-        r'[0-9]+\s*%',  # 퍼센트
-        r'[0-9]+\s*명',  # 인원
-        r'[0-9]+\s*개월',  # 기간
-        r'[0-9]+\s*년',  # 연도
-    ]
+_HANGUL_SPACE_RE = re.compile(r'(?<=[\uac00-\ud7a3])\s+(?=[\uac00-\ud7a3])')
+# 라벨 바로 뒤에서 값을 묻는 표현 ("ARPU는 얼마인가요?", "팀원은 현재 몇 명인가요?")
+# "매출 구성에서 ~", "CAC 회수 기간은 ~"처럼 라벨만 포함한 다른 질문은 제외하지 않음
+_VALUE_QUESTION_RE = re.compile(r'\s*(은|는|이|가|도)?\s*(현재|지금|최근)?\s*(얼마|몇|어느\s*정도|어떻게\s*되|수준|규모)')
+
+
+def normalize_keyword(text: str) -> str:
+    """키워드 비교용 정규화 (소문자화 + 한글 사이 띄어쓰기 제거: "고객 획득 비용" == "고객획득비용")"""
+    return _HANGUL_SPACE_RE.sub('', text.lower())
+
+
+def _compile_terms(terms) -> Optional["re.Pattern"]:
+    """정규화된 용어들을 하나의 정규식으로 (긴 용어 우선)"""
+    terms = [t for t in terms if t]
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)))
+
+
+class RedundancyIndex:
+    """
+    회의에서 이미 언급된 지표/키워드 인덱스
+
+    정규화된 키워드를 하나의 정규식으로 묶어 질문마다 한 번의 스캔으로 중복 여부 판정
+    (질문 수 x 키워드 수 부분 문자열 비교 제거)
+
+    Args:
+        mentioned_context: extract_mentioned_topics 결과
+        facts: 라벨별 수치 사실 (FactTable.latest) - 값이 이미 나온 지표의 값을 다시 묻는 질문도 제외
+    """
+
+    def __init__(self, mentioned_context: Dict[str, Set[str]], facts: Optional[Dict[str, Dict]] = None):
+        self.topics = set(mentioned_context.get("topics_discussed", set()))
+
+        # 정규화 용어 → 원래 지표/키워드 (이유 표시용)
+        self.metric_terms: Dict[str, str] = {}
+        for metric in mentioned_context.get("metrics_mentioned", set()):
+            self.metric_terms[normalize_keyword(metric)] = metric
+            self.metric_terms[normalize_keyword(metric.replace('_', ' '))] = metric
+
+        self.keyword_terms: Dict[str, str] = {}
+        for keyword in mentioned_context.get("keywords_found", set()):
+            self.keyword_terms.setdefault(normalize_keyword(keyword), keyword)
+
+        # 정규화 라벨 원문 → 사실 ("ARPU는 5만원" 이후의 "ARPU는 얼마인가요?")
+        self.fact_terms: Dict[str, Dict] = {}
+        for fact in (facts or {}).values():
+            self.fact_terms.setdefault(normalize_keyword(fact["label_text"]), fact)
+
+        self._metric_re = _compile_terms(self.metric_terms)
+        self._keyword_re = _compile_terms(self.keyword_terms)
+        self._fact_re = _compile_terms(self.fact_terms)
+
+    def match(self, question: Dict) -> Optional[Dict[str, str]]:
+        """
+        질문이 이미 언급된 내용과 겹치면 이유 반환
+
+        Returns:
+            {"type": "keyword" | "metric" | "fact", "matched": 원래 키워드/지표,
+             "topic"?: 토픽, "value"?: 이미 나온 수치} 또는 None
+        """
+        text = normalize_keyword(question.get("text", ""))
+
+        # 카테고리가 이미 논의된 토픽이면 키워드 기반으로 더 정밀하게 확인
+        mapped_topic = CATEGORY_TOPIC_MAP.get(question.get("category", "").upper())
+        if mapped_topic and mapped_topic in self.topics and self._keyword_re:
+            m = self._keyword_re.search(text)
+            if m:
+                return {"type": "keyword", "matched": self.keyword_terms[m.group()], "topic": mapped_topic}
+
+        # 지표 관련 중복 확인
+        if self._metric_re:
+            m = self._metric_re.search(text)
+            if m:
+                return {"type": "metric", "matched": self.metric_terms[m.group()]}
+
+        # 값이 이미 나온 지표의 같은 값을 묻는 질문 확인
+        if self._fact_re:
+            for m in self._fact_re.finditer(text):
+                if _VALUE_QUESTION_RE.match(text, m.end()):
+                    fact = self.fact_terms[m.group()]
+                    return {"type": "fact", "matched": fact["label_text"], "value": fact["raw"]}
+
+        return None
+
+
+def filter_redundant_questions_with_reasons(
+    questions: List[Dict],
+    mentioned_context: Optional[Dict[str, Set[str]]] = None,
+    index: Optional[RedundancyIndex] = None,
+    sentences: Optional[SentenceIndex] = None
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    이미 언급된 내용과 관련된 질문 필터링 (필터링 이유 포함)
+
+    Args:
+        questions: 생성된 질문 리스트 [{"text": "...", "category": "...", ...}]
+        mentioned_context: extract_mentioned_topics 결과 (index가 없을 때 사용)
+        index: 재사용할 RedundancyIndex (회의 세션에서 유지)
+        sentences: 전사 문장 인덱스 (있으면 키워드로 걸러지지 않은 질문의 답변 여부도 확인)
 
-    for pattern in number_patterns:
-        matches = re.findall(f'.{{0,50}}{pattern}.{{0,50}}', combined_text)
-        answered.extend(matches)
+    Returns:
+        (남은 질문 리스트, [{"question": 질문, "reason": 이유}, ...])
+    """
+    if index is None:
+        index = RedundancyIndex(mentioned_context or {})
+
+    reasons = [index.match(question) for question in questions]
+    if sentences is not None:
+        # 남은 질문만 한 번에 확인
+        unmatched = [i for i, reason in enumerate(reasons) if reason is None]
+        answered = sentences.answered([questions[i] for i in unmatched])
+        for i, reason in zip(unmatched, answered):
+            reasons[i] = reason
+
+    kept = []
+    filtered = []
+    for question, reason in zip(questions, reasons):
+        if reason:
+            logger.info(
+                f"Filtered redundant question ({reason['type']} match: {reason['matched']}): "
+                f"{question.get('text', '')[:50]}..."
+            )
+            filtered.append({"question": question, "reason": reason})
+        else:
+            kept.append(question)
 
-    return list(set(answered))[:10]  # 최대 10개
+    logger.info(f"Filtered {len(filtered)} redundant questions")
+    return kept, filtered
 
 
 def filter_redundant_questions(
@@ -126,53 +284,31 @@ def filter_redundant_questions(
     Returns:
         필터링된 질문 리스트
     """
-    metrics = mentioned_context.get("metrics_mentioned", set())
-    topics = mentioned_context.get("topics_discussed", set())
-    keywords = mentioned_context.get("keywords_found", set())
+    kept, _ = filter_redundant_questions_with_reasons(questions, mentioned_context)
+    return kept
 
-    filtered = []
-
-    for question in questions:
-        text = question.get("text", "").lower()
-        category = question.get("category", "").upper()
-
-        # 이미 언급된 지표에 대한 질문인지 확인
-        is_redundant = False
-
-        # 카테고리가 이미 충분히 논의된 토픽인지 확인
-        category_map = {
-            'BUSINESS_MODEL': 'BUSINESS_MODEL',
-            'TRACTION': 'TRACTION',
-            'TEAM': 'TEAM',
-            'MARKET': 'MARKET',
-            'TECHNOLOGY': 'TECHNOLOGY',
-            'FINANCIALS': 'FUNDING',
-            'RISKS': 'RISKS',
-        }
 
-        mapped_topic = category_map.get(category)
-        if mapped_topic and mapped_topic in topics:
-            # 해당 토픽이 이미 논의되었지만, 추가 질문이 필요할 수 있음
-            # 키워드 기반으로 더 정밀하게 확인
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    is_redundant = True
-                    logger.info(f"Filtered redundant question (keyword match): {text[:50]}...")
-                    break
+# 대화 단계 추정 설정
+STAGE_RECENT_UTTERANCES = 5       # 마무리 키워드를 확인할 최근 발화 수
+CLOSING_KEYWORDS = ['다음 단계', '감사합니다', '연락드리겠', '검토', '마무리', '정리하면']
+INTRODUCTION_MAX_WORDS = 200
+CLOSING_MIN_WORDS = 1000
 
-        # 지표 관련 중복 확인
-        for metric in metrics:
-            metric_lower = metric.lower()
-            if metric_lower in text or metric_lower.replace('_', ' ') in text:
-                is_redundant = True
-                logger.info(f"Filtered redundant question (metric match): {text[:50]}...")
-                break
 
-        if not is_redundant:
-            filtered.append(question)
+def _stage_from(recent_text: str, total_words: int) -> str:
+    """최근 발화와 누적 단어 수로 대화 단계 판단"""
+    # 마무리 키워드
+    for keyword in CLOSING_KEYWORDS:
+        if keyword in recent_text:
+            return 'closing'
 
-    logger.info(f"Filtered {len(questions) - len(filtered)} redundant questions")
-    return filtered
+    # 단어 수 기반 추정
+    if total_words < INTRODUCTION_MAX_WORDS:
+        return 'introduction'
+    elif total_words > CLOSING_MIN_WORDS:
+        return 'closing'
+    else:
+        return 'deep_dive'
 
 
 def get_conversation_stage(transcripts: List[str]) -> str:
@@ -187,31 +323,25 @@ def get_conversation_stage(transcripts: List[str]) -> str:
     if not transcripts:
         return 'introduction'
 
-    combined_text = " ".join(transcripts[-5:])  # 최근 5개 발화 기준
-    word_count = len(combined_text.split())
-
-    # 마무리 키워드
-    closing_keywords = ['다음 단계', '감사합니다', '연락드리겠', '검토', '마무리', '정리하면']
-    for keyword in closing_keywords:
-        if keyword in combined_text:
-            return 'closing'
-
-    # 단어 수 기반 추정
+    combined_text = " ".join(transcripts[-STAGE_RECENT_UTTERANCES:])  # 최근 5개 발화 기준
     total_words = sum(len(t.split()) for t in transcripts)
-    if total_words < 200:
-        return 'introduction'
-    elif total_words > 1000:
-        return 'closing'
-    else:
-        return 'deep_dive'
+    return _stage_from(combined_text, total_words)
 
 
 def build_context_for_prompt(
     transcripts: List[str],
-    mentioned_context: Dict = None
+    mentioned_context: Dict = None,
+    stage: Optional[str] = None,
+    facts: Optional[Dict[str, Dict]] = None
 ) -> str:
     """
     질문 생성 프롬프트에 포함할 맥락 문자열 생성
+
+    Args:
+        transcripts: 전사 텍스트 리스트
+        mentioned_context: extract_mentioned_topics 결과 (없으면 계산)
+        stage: 대화 단계 (없으면 계산)
+        facts: 라벨별 수치 사실 (FactTable.latest)
     """
     if mentioned_context is None:
         mentioned_context = extract_mentioned_topics(transcripts)
@@ -225,22 +355,15 @@ def build_context_for_prompt(
         context_parts.append(f"이미 언급된 지표: {', '.join(metrics)}")
 
     if topics:
-        topic_names = {
-            'BUSINESS_MODEL': '비즈니스 모델',
-            'TEAM': '팀 구성',
-            'MARKET': '시장',
-            'TECHNOLOGY': '기술',
-            'TRACTION': '트랙션',
-            'FUNDING': '투자/자금',
-            'RISKS': '리스크',
-            'COMPETITION': '경쟁',
-            'CUSTOMER': '고객',
-            'PRODUCT': '제품',
-        }
-        topic_korean = [topic_names.get(t, t) for t in topics]
+        topic_korean = [TOPIC_NAMES.get(t, t) for t in topics]
         context_parts.append(f"이미 논의된 주제: {', '.join(topic_korean)}")
 
-    stage = get_conversation_stage(transcripts)
+    if facts:
+        values = [f"{label} {fact['raw']}" for label, fact in facts.items()]
+        context_parts.append(f"확인된 수치: {', '.join(values)}")
+
+    if stage is None:
+        stage = get_conversation_stage(transcripts)
     stage_names = {
         'introduction': '초반 (회사 소개 단계)',
         'deep_dive': '중반 (상세 검토 단계)',
@@ -249,3 +372,102 @@ def build_context_for_prompt(
     context_parts.append(f"대화 단계: {stage_names.get(stage, stage)}")
 
     return "\n".join(context_parts) if context_parts else "맥락 정보 없음"
+
+
+# ============ 회의별 증분 맥락 세션 ============
+
+# 청크 경계에 걸친 패턴(예: "고객 획득 / 비용")을 놓치지 않도록 이전 텍스트 끝부분을 함께 스캔
+# (끝부분 안에서 끝나는 매칭은 이전 호출에서 이미 반영되었으므로 제외)
+OVERLAP_CHARS = 40
+
+
+class ContextSession:
+    """
+    회의별 맥락 상태
+
+    새로 들어온 청크만 스캔해 지표/토픽/키워드 집합, 수치 사실 테이블, 전사 문장 인덱스,
+    누적 단어 수, 대화 단계를 갱신
+    (호출당 비용이 회의 길이와 무관)
+    """
+
+    def __init__(self):
+        self.metrics_mentioned: Set[str] = set()
+        self.topics_discussed: Set[str] = set()
+        self.keywords_found: Set[str] = set()
+        self.facts = FactTable()
+        self.sentences = SentenceIndex()
+        self.total_words = 0
+        self.chunk_count = 0
+        self.recent: deque = deque(maxlen=STAGE_RECENT_UTTERANCES)
+        self._tail = ""
+        self._cursor = ChunkCursor()
+        self._index: Optional[RedundancyIndex] = None
+        self._index_key: Optional[Tuple[int, ...]] = None
+
+    def ingest(self, text: str):
+        """새 전사 청크 반영"""
+        # 이전 텍스트 끝부분은 단어 경계부터 포함 (단어 중간에서 시작하면 \b 판정이 달라짐)
+        scan_text = f"{self._tail} {text}" if self._tail else text
+        metrics, topics, keywords = scan_mentions(scan_text, len(self._tail))
+        self.metrics_mentioned |= metrics
+        self.topics_discussed |= topics
+        self.keywords_found |= keywords
+        self.facts.ingest(text)
+        self.sentences.add(text)
+
+        tail = scan_text[-OVERLAP_CHARS:]
+        if len(scan_text) > OVERLAP_CHARS:
+            space = tail.find(" ")
+            tail = tail[space + 1:] if space >= 0 else ""
+        self._tail = tail
+
+        self.total_words += len(text.split())
+        self.recent.append(text)
+        self.chunk_count += 1
+
+    def sync(self, transcripts: List[str]):
+        """
+        요청의 전사 리스트(이전 전사 + 현재 청크)에서 아직 반영하지 않은 청크만 추가
+
+        누적 리스트, 고정 크기 윈도우, 현재 청크만 보내는 경우 모두 마지막으로 반영한 청크 위치 기준으로 새 청크 판별
+        """
+        for text in self._cursor.take_new(transcripts):
+            self.ingest(text)
+
+    @property
+    def stage(self) -> str:
+        """get_conversation_stage와 같은 기준의 대화 단계"""
+        if not self.chunk_count:
+            return 'introduction'
+        return _stage_from(" ".join(self.recent), self.total_words)
+
+    def redundancy_index(self) -> RedundancyIndex:
+        """중복 질문 필터용 인덱스 (집합이 커졌을 때만 다시 생성)"""
+        key = (len(self.metrics_mentioned), len(self.topics_discussed), len(self.keywords_found),
+               self.facts.version)
+        if self._index is None or key != self._index_key:
+            self._index = RedundancyIndex(self.mentioned_context(), self.facts.latest())
+            self._index_key = key
+        return self._index
+
+    def mentioned_context(self) -> Dict[str, Set[str]]:
+        """extract_mentioned_topics와 같은 형식의 결과 (세션 상태를 그대로 참조하므로 읽기 전용)"""
+        return {
+            "metrics_mentioned": self.metrics_mentioned,
+            "topics_discussed": self.topics_discussed,
+            "keywords_found": self.keywords_found,
+        }
+
+
+# 회의별 맥락 세션
+_sessions = SessionStore(ContextSession, max_sessions=MAX_INDEXES, name="context session")
+
+
+def get_context_session(meeting_id: str) -> ContextSession:
+    """회의 ID에 해당하는 맥락 세션 (없으면 생성)"""
+    return _sessions.get_or_create(meeting_id)
+
+
+def peek_context_session(meeting_id: str) -> Optional[ContextSession]:
+    """회의 ID에 해당하는 맥락 세션 (없으면 None)"""
+    return _sessions.get(meeting_id)
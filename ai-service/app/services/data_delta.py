@@ -0,0 +1,223 @@
+"""
+구조화 데이터 변화 감지기 (Data Delta)
+- 회의에서 추출한 수치 사실(MRR, CAC, LTV, Churn, 번 레이트, 런웨이 등)을
+  관계 객체의 structured_data / structuredData 와 비교
+- 변화량 계산, 기존 데이터와 크게 어긋나거나 회의 중 엇갈린 값은 모순으로 표시
+- LLM 없이 suggested_data_updates 생성 (모순 항목은 자동 반영되지 않도록 제외)
+"""
+
+import math
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.services.numeric_facts import FactTable, tokenize_quantities
+
+logger = logging.getLogger(__name__)
+
+# 사실 라벨 → 구조화 데이터 필드
+# keys: 기존 데이터에서 찾을 키 (소문자, '_'/'-'/공백 제거 후 비교), 첫 번째가 새 필드 이름
+# default_scale: 기존 값이 없을 때 저장 단위 (금액: 1=원, 10000=만원 - 프론트엔드 입력 단위 기준)
+DATA_FIELDS = {
+    'MRR': {"kind": "money", "keys": ["mrr", "monthly_revenue"], "default_scale": 10 ** 4},
+    'ARR': {"kind": "money", "keys": ["arr", "annual_revenue"], "default_scale": 10 ** 4},
+    'CAC': {"kind": "money", "keys": ["cac"], "default_scale": 1},
+    'LTV': {"kind": "money", "keys": ["ltv"], "default_scale": 1},
+    'ARPU': {"kind": "money", "keys": ["arpu"], "default_scale": 1},
+    'BURN_RATE': {"kind": "money", "keys": ["burn_rate"], "default_scale": 10 ** 4},
+    'GMV': {"kind": "money", "keys": ["gmv"], "default_scale": 10 ** 4},
+    'CHURN': {"kind": "percent", "keys": ["churn", "churn_rate"], "default_scale": 1},
+    'RETENTION': {"kind": "percent", "keys": ["retention", "retention_rate"], "default_scale": 1},
+    'GROWTH': {"kind": "percent", "keys": ["growth_rate", "growth"], "default_scale": 1},
+    'RUNWAY': {"kind": "months", "keys": ["runway"], "default_scale": 1},
+    'CUSTOMERS': {"kind": "count", "keys": ["customers", "customer_count"], "default_scale": 1},
+    'MAU': {"kind": "count", "keys": ["mau", "users"], "default_scale": 1},
+    'DAU': {"kind": "count", "keys": ["dau"], "default_scale": 1},
+    'TEAM_SIZE': {"kind": "count", "keys": ["team_size", "employees"], "default_scale": 1},
+    'NPS': {"kind": "score", "keys": ["nps"], "default_scale": 1},
+}
+
+# 종류별로 인정하는 사실 단위
+KIND_UNITS = {
+    "money": {'원'},
+    "percent": {'%'},
+    "months": {'개월', '년'},
+    "count": {'명', '개', None},
+    "score": {None},
+}
+
+# 기존 값의 저장 단위 후보 (사실 값 / scale = 저장 값)
+# 금액은 원/만원, 비율은 % 또는 소수(0.025)
+KIND_SCALES = {
+    "money": [1, 10 ** 4],
+    "percent": [1, 100],
+}
+
+UNCHANGED_TOLERANCE = 0.01       # 1% 이내 차이는 변화 없음
+CONFLICT_TOLERANCE = 0.10        # 회의 중 같은 지표 값이 10% 넘게 다르면 모순
+LARGE_CHANGE_RATIO = 0.5         # 기존 값 대비 50% 이상 변화는 확인 필요 (모순)
+
+
+def _normalize_key(key: str) -> str:
+    return key.lower().replace('_', '').replace('-', '').replace(' ', '')
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """기존 데이터 값 → 숫자 ("3000", "3천만원" 문자열 포함, 변환 불가면 None)"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            return float(text.replace(',', ''))
+        except ValueError:
+            quantities = tokenize_quantities(text)
+            return float(quantities[0]["value"]) if quantities else None
+    return None
+
+
+def _fact_value(fact: Dict, kind: str) -> Optional[float]:
+    """사실 값을 필드 종류의 기준 단위로 (단위가 맞지 않으면 None)"""
+    if fact["unit"] not in KIND_UNITS[kind]:
+        return None
+    value = float(fact["value"])
+    if kind == "months" and fact["unit"] == '년':
+        value *= 12
+    return value
+
+
+def _pick_scale(kind: str, current: float, previous: Optional[float], default: float) -> float:
+    """기존 값과 가장 가까운 저장 단위 (기존 값이 없으면 기본 단위)"""
+    scales = KIND_SCALES.get(kind, [1])
+    if previous is None or previous <= 0 or current <= 0:
+        return default if default in scales else scales[0]
+    return min(scales, key=lambda s: abs(math.log((current / s) / previous)))
+
+
+def _round(value: float):
+    return int(value) if value == int(value) else round(value, 4)
+
+
+def detect_data_updates(
+    facts: Dict[str, List[Dict]],
+    structured_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    회의 수치 사실과 기존 구조화 데이터 비교
+
+    Args:
+        facts: 라벨별 사실 이력 {"MRR": [fact, ...]} (FactTable.by_label 형식, 등장 순)
+        structured_data: 관계 객체의 기존 데이터 {"mrr": 2000, "cac": 150000, ...}
+
+    Returns:
+        {
+            "updates": {"mrr": 3000, ...},      # 자동 반영해도 되는 값 (기존 데이터 단위)
+            "deltas": [{"label", "field", "previous", "current", "delta", "delta_pct",
+                        "status": new | changed | unchanged | contradiction,
+                        "reason"?, "raw", "evidence"}, ...],
+            "contradictions": [...]             # deltas 중 status가 contradiction인 항목
+        }
+    """
+    structured_data = structured_data or {}
+    existing_keys = {
+        _normalize_key(key): key
+        for key in structured_data
+        if isinstance(key, str) and not key.startswith('_')
+    }
+
+    updates: Dict[str, Any] = {}
+    deltas: List[Dict] = []
+
+    for label, spec in DATA_FIELDS.items():
+        history = facts.get(label)
+        if not history:
+            continue
+        kind = spec["kind"]
+        values = [(fact, _fact_value(fact, kind)) for fact in history]
+        values = [(fact, value) for fact, value in values if value is not None]
+        if not values:
+            continue
+
+        latest_fact, current = values[-1]
+
+        field = next(
+            (existing_keys[k] for k in map(_normalize_key, spec["keys"]) if k in existing_keys),
+            spec["keys"][0]
+        )
+        previous = _to_number(structured_data.get(field)) if field in structured_data else None
+
+        # 기존 값 단위에 맞춰 비교 (문자열 값은 이미 원 단위로 해석됨)
+        is_text = isinstance(structured_data.get(field), str)
+        scale = 1 if is_text else _pick_scale(kind, current, previous, spec["default_scale"])
+        current_stored = _round(current / scale)
+
+        item = {
+            "label": label,
+            "field": field,
+            "previous": structured_data.get(field),
+            "current": current_stored,
+            "delta": None,
+            "delta_pct": None,
+            "raw": latest_fact["raw"],
+            "evidence": latest_fact["context"],
+        }
+
+        meeting_values = [value for _, value in values]
+        low, high = min(meeting_values), max(meeting_values)
+        if low > 0 and (high - low) / low > CONFLICT_TOLERANCE:
+            item["status"] = "contradiction"
+            item["reason"] = "meeting_conflict"
+            item["meeting_values"] = [fact["raw"] for fact, _ in values]
+        elif previous is None:
+            item["status"] = "new"
+        else:
+            previous_base = previous * scale
+            item["delta"] = _round(current_stored - previous)
+            if previous_base:
+                change = (current - previous_base) / abs(previous_base)
+                item["delta_pct"] = round(change * 100, 1)
+            else:
+                change = math.inf if current else 0.0
+
+            if abs(change) <= UNCHANGED_TOLERANCE:
+                item["status"] = "unchanged"
+            elif abs(change) >= LARGE_CHANGE_RATIO:
+                item["status"] = "contradiction"
+                item["reason"] = "large_change"
+            else:
+                item["status"] = "changed"
+
+        if item["status"] in ("new", "changed"):
+            updates[field] = current_stored
+        deltas.append(item)
+
+    contradictions = [item for item in deltas if item["status"] == "contradiction"]
+    if deltas:
+        logger.info(
+            f"Data deltas: {len(updates)} updates, {len(contradictions)} contradictions "
+            f"({', '.join(item['label'] for item in deltas)})"
+        )
+
+    return {"updates": updates, "deltas": deltas, "contradictions": contradictions}
+
+
+def detect_data_updates_from_transcripts(
+    transcripts: List[str],
+    structured_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """전사 텍스트 리스트에서 사실을 추출해 detect_data_updates 실행"""
+    table = FactTable()
+    for text in transcripts:
+        table.ingest(text)
+    return detect_data_updates(table.by_label, structured_data)
+
+
+def get_structured_data(relationship_context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """관계 맥락에서 기존 구조화 데이터 (structuredData / structured_data 모두 지원)"""
+    if not relationship_context:
+        return {}
+    data = relationship_context.get('structuredData')
+    if data is None:
+        data = relationship_context.get('structured_data')
+    return data or {}
@@ -0,0 +1,192 @@
+"""
+추출 요약 (Extractive Summary)
+- LLM을 사용할 수 없거나 지연 예산을 넘을 때 쓰는 로컬 요약
+- 문장 분리는 한 번, 문자 n-gram TF-IDF 벡터(text_vectors)로 문장 점수를 배열 연산으로 계산
+- 점수: 문서 중심 벡터(centroid)와의 코사인 유사도 (TextRank의 N×N 유사도 행렬 대신 O(특징 수))
+- 점수 순으로 고르되 이미 고른 문장과 비슷하면 제외 (MMR 방식 중복 제거)
+- 결정 사항 / 후속 조치 후보는 전체 텍스트 한 번의 정규식 스캔으로 찾아 문장에 매핑
+"""
+
+import re
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.services.text_vectors import sparse_rows
+
+logger = logging.getLogger(__name__)
+
+VECTOR_DIM = 2 ** 14
+NGRAM_RANGE = (2, 3)               # 한 글자 n-gram은 변별력이 낮아 제외
+MIN_SENTENCE_CHARS = 8             # 이보다 짧은 문장("네.", "감사합니다.")은 후보에서 제외
+MAX_ITEM_CHARS = 120               # 항목 최대 길이 (단어 경계에서 자름)
+REDUNDANCY_THRESHOLD = 0.5         # 이미 고른 문장과 코사인 유사도가 이 이상이면 제외
+NUMERIC_BONUS = 1.2                # 숫자가 포함된 문장 가중치
+QUESTION_PENALTY = 0.6             # 질문 문장은 핵심 포인트로 덜 선택
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+_DIGIT_RE = re.compile(r'\d')
+
+# 결정 사항: 합의/확정 표현
+DECISION_PATTERNS = [
+    r"하기로\s*(했|하|결정|합의)",
+    r"결정(했|하였|됐|되었|하겠)",
+    r"합의(했|하였|됐|되었)",
+    r"확정(했|하였|됐|되었|하겠|입니다)",
+    r"(으로|로)\s*하죠",
+    r"진행하시죠",
+    r"그렇게\s*하(죠|시죠|겠습니다)",
+]
+
+# 후속 조치: 약속/요청/미래 표현
+ACTION_PATTERNS = [
+    r"(하|드리|보내|공유하|전달하|준비하|검토하|정리하)겠습니다",
+    r"(할|드릴|보낼|공유할|보내드릴)게요",
+    r"(보내|공유해|전달해|준비해|정리해)\s*주(세요|시면|시겠어요)",
+    r"부탁드(립니다|려요)",
+    r"예정입니다",
+    r"다음\s*(주|미팅|회의)(까지|에)",
+    r"까지\s*(보내|공유|전달|준비|정리)",
+]
+
+_DECISION_RE = re.compile("|".join(f"(?:{p})" for p in DECISION_PATTERNS))
+_ACTION_RE = re.compile("|".join(f"(?:{p})" for p in ACTION_PATTERNS))
+
+
+def split_sentences(transcripts: List[Dict[str, Any]]) -> List[str]:
+    """전사 항목을 문장 단위로 분리 (발화 순서 유지, 반복된 같은 문장은 처음 한 번만)"""
+    sentences = {}
+    for t in transcripts:
+        for sentence in _SENTENCE_SPLIT_RE.split(t.get("text") or ""):
+            sentence = sentence.strip()
+            if sentence:
+                sentences.setdefault(sentence, None)
+    return list(sentences)
+
+
+def clip(text: str, limit: int = MAX_ITEM_CHARS) -> str:
+    """단어 경계에서 자르고 말줄임표 추가"""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    return text[:cut if cut > limit // 2 else limit].rstrip(" ,") + "…"
+
+
+def score_sentences(sentences: List[str]) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    문장별 중요도 점수 (TF-IDF 중심 벡터 유사도)
+
+    Returns:
+        (점수 배열, TF-IDF 희소 행렬 (행, 열, 값))
+    """
+    n = len(sentences)
+    rows, indices, values = sparse_rows(sentences, VECTOR_DIM, NGRAM_RANGE)
+    if not n or not len(rows):
+        return np.zeros(n, dtype=np.float32), (rows, indices, values)
+
+    # TF-IDF 가중치 (희소 행렬은 (행, 열) 쌍이 유일하므로 열 빈도 = 문서 빈도)
+    df = np.bincount(indices, minlength=VECTOR_DIM)
+    idf = (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+    weights = values * idf[indices]
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n))
+    weights /= np.maximum(norms[rows], 1e-12).astype(np.float32)
+
+    centroid = np.bincount(indices, weights=weights, minlength=VECTOR_DIM) / n
+    centroid /= max(float(np.linalg.norm(centroid)), 1e-12)
+    scores = np.bincount(rows, weights=weights * centroid[indices], minlength=n)
+
+    lengths = np.fromiter((len(s) for s in sentences), dtype=np.float64, count=n)
+    scores *= np.minimum(1.0, lengths / 40.0)
+    scores[lengths < MIN_SENTENCE_CHARS] = 0.0
+    for i, sentence in enumerate(sentences):
+        if _DIGIT_RE.search(sentence):
+            scores[i] *= NUMERIC_BONUS
+        if sentence.endswith("?"):
+            scores[i] *= QUESTION_PENALTY
+    return scores, (rows, indices, weights)
+
+
+def _select(
+    candidates: np.ndarray,
+    scores: np.ndarray,
+    matrix: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    limit: int
+) -> List[int]:
+    """
+    점수 순으로 이미 고른 문장과 겹치지 않는 문장 선택 (결과는 발화 순)
+
+    유사도는 후보의 희소 벡터와 선택된 문장(최대 limit개)의 밀집 벡터로만 계산
+    """
+    candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+    candidates = candidates[scores[candidates] > 0]
+    if not len(candidates) or limit <= 0:
+        return []
+
+    rows, indices, weights = matrix
+    row_start = np.searchsorted(rows, np.arange(len(scores) + 1))  # 행 순으로 정렬된 희소 행렬의 행 시작 위치
+    chosen = np.zeros((limit, VECTOR_DIM), dtype=np.float32)
+    selected: List[int] = []
+    for i in candidates:
+        cols = indices[row_start[i]:row_start[i + 1]]
+        values = weights[row_start[i]:row_start[i + 1]]
+        if selected and float((chosen[:len(selected), cols] @ values).max()) >= REDUNDANCY_THRESHOLD:
+            continue
+        chosen[len(selected), cols] = values
+        selected.append(int(i))
+        if len(selected) == limit:
+            break
+    return sorted(selected)
+
+
+def _pattern_sentences(pattern: re.Pattern, text: str, offsets: np.ndarray) -> np.ndarray:
+    """전체 텍스트 한 번 스캔 → 매칭이 있는 문장 번호"""
+    starts = [m.start() for m in pattern.finditer(text)]
+    if not starts:
+        return np.zeros(0, dtype=np.intp)
+    return np.unique(np.searchsorted(offsets, starts, side="right") - 1)
+
+
+def extractive_summary(
+    transcripts: List[Dict[str, Any]],
+    max_points: int = 5,
+    max_items: int = 5
+) -> Dict[str, Any]:
+    """
+    LLM 없이 전사에서 요약 항목 추출
+
+    Args:
+        transcripts: 전사 항목 리스트 ({"text", "speaker", ...})
+        max_points: 핵심 포인트 최대 개수
+        max_items: 결정 사항 / 후속 조치 최대 개수
+
+    Returns:
+        {"summary_sentences", "key_points", "decisions", "action_items"}
+    """
+    sentences = split_sentences(transcripts)
+    if not sentences:
+        return {"summary_sentences": [], "key_points": [], "decisions": [], "action_items": []}
+
+    scores, matrix = score_sentences(sentences)
+
+    # 문장 시작 위치 (구분자 1글자 포함) → 정규식 매칭 위치를 문장 번호로 변환
+    lengths = np.fromiter((len(s) + 1 for s in sentences), dtype=np.intp, count=len(sentences))
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    text = "\n".join(sentences)
+
+    decision_ids = _pattern_sentences(_DECISION_RE, text, offsets)
+    action_ids = np.setdiff1d(_pattern_sentences(_ACTION_RE, text, offsets), decision_ids)
+
+    # 결정/후속 조치는 짧아도 의미가 있으므로 최소 점수 보장
+    item_scores = np.maximum(scores, 1e-6)
+    decisions = _select(decision_ids, item_scores, matrix, max_items)
+    actions = _select(action_ids, item_scores, matrix, max_items)
+    key_points = _select(np.arange(len(sentences)), scores, matrix, max_points)
+    top = sorted(key_points, key=lambda i: -scores[i])[:2]
+
+    return {
+        "summary_sentences": [clip(sentences[i], 80) for i in sorted(top)],
+        "key_points": [clip(sentences[i]) for i in key_points],
+        "decisions": [clip(sentences[i]) for i in decisions],
+        "action_items": [clip(sentences[i]) for i in actions],
+    }
@@ -0,0 +1,194 @@
+"""
+휴리스틱 질문 생성기 (Heuristic Questions)
+- LLM 호출 없이 아직 언급되지 않은 지표/주제에 대한 템플릿 질문을 즉시 생성
+- 대화 단계와 관계 유형에 따라 우선순위 결정
+- 2단계 응답: 휴리스틱 질문을 먼저 반환하고 LLM 질문은 백그라운드에서 생성 후 교체
+"""
+
+import uuid
+import time
+import asyncio
+import logging
+from typing import Awaitable, Dict, List, Optional
+
+from app.services.context_analyzer import extract_mentioned_topics, get_conversation_stage
+from app.services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+# 지표/주제별 템플릿 질문 (키는 context_analyzer의 METRIC_PATTERNS / TOPIC_PATTERNS)
+QUESTION_TEMPLATES = {
+    # 지표
+    'MRR': {"text": "현재 MRR은 얼마이고, 최근 3개월 성장률은 어떻게 되나요?", "category": "metrics",
+            "reason": "매출 규모와 성장 속도는 가장 기본적인 투자 판단 지표입니다."},
+    'ARR': {"text": "연간 반복 매출(ARR) 기준으로 올해 목표와 현재 달성률은 어떻게 되나요?", "category": "metrics",
+            "reason": "연간 매출 목표 대비 실적으로 실행력을 확인할 수 있습니다."},
+    'CAC': {"text": "고객 한 명을 획득하는 데 드는 비용(CAC)은 얼마이고, 주요 채널은 어디인가요?", "category": "metrics",
+            "reason": "획득 비용은 성장의 효율성과 확장 가능성을 보여줍니다."},
+    'LTV': {"text": "고객 생애 가치(LTV)는 어떻게 계산하고 계시며, LTV/CAC 비율은 어느 정도인가요?", "category": "metrics",
+            "reason": "단위 경제성이 성립하는지 확인해야 합니다."},
+    'CHURN': {"text": "월간 이탈률(Churn)은 어느 수준이고, 주요 이탈 사유는 무엇인가요?", "category": "metrics",
+              "reason": "이탈률은 제품-시장 적합성의 핵심 신호입니다."},
+    'NPS': {"text": "고객 만족도나 NPS를 측정하고 계신가요? 결과는 어떤가요?", "category": "metrics",
+            "reason": "고객 만족도는 장기 성장의 선행 지표입니다."},
+    'MAU': {"text": "월간 활성 사용자(MAU)는 몇 명이고, 추이는 어떤가요?", "category": "metrics",
+            "reason": "사용자 기반의 크기와 성장 추세를 확인합니다."},
+    'DAU': {"text": "일간 활성 사용자(DAU)와 DAU/MAU 비율은 어느 정도인가요?", "category": "metrics",
+            "reason": "사용 빈도로 제품의 습관화 정도를 파악합니다."},
+    'GMV': {"text": "총 거래액(GMV)과 테이크레이트는 어떻게 되나요?", "category": "metrics",
+            "reason": "거래 규모와 수익화 수준을 함께 확인해야 합니다."},
+    'RETENTION': {"text": "코호트별 리텐션은 어떻게 나타나고 있나요?", "category": "metrics",
+                  "reason": "리텐션 곡선으로 제품의 지속 사용 가치를 판단합니다."},
+    'BURN_RATE': {"text": "현재 월 번 레이트는 얼마이고, 주요 비용 항목은 무엇인가요?", "category": "risk",
+                  "reason": "자금 소진 속도는 생존 가능성과 직결됩니다."},
+    'RUNWAY': {"text": "현재 자금으로 런웨이는 몇 개월 남았나요?", "category": "risk",
+               "reason": "다음 투자 유치까지의 시간 여유를 확인해야 합니다."},
+    # 주제
+    'BUSINESS_MODEL': {"text": "수익 모델은 어떻게 구성되어 있고, 가장 큰 매출원은 무엇인가요?", "category": "strategy",
+                       "reason": "돈을 버는 구조를 명확히 이해해야 합니다."},
+    'TEAM': {"text": "창업팀은 어떻게 구성되어 있고, 각자의 역할과 관련 경험은 무엇인가요?", "category": "team",
+             "reason": "초기 단계에서는 팀의 실행력이 가장 중요한 판단 요소입니다."},
+    'MARKET': {"text": "목표 시장 규모(TAM/SAM/SOM)는 어떻게 추정하셨나요?", "category": "strategy",
+               "reason": "시장 규모가 성장의 상한을 결정합니다."},
+    'TECHNOLOGY': {"text": "핵심 기술은 무엇이고, 경쟁사가 쉽게 따라 할 수 없는 이유는 무엇인가요?", "category": "strategy",
+                   "reason": "기술적 차별화로 방어 가능성을 확인합니다."},
+    'TRACTION': {"text": "현재까지의 주요 트랙션(고객 수, 매출, 성장률)을 수치로 말씀해주실 수 있나요?", "category": "metrics",
+                 "reason": "시장 검증 정도를 객관적으로 확인해야 합니다."},
+    'FUNDING': {"text": "이번 투자 유치 규모와 자금 사용 계획은 어떻게 되나요?", "category": "strategy",
+                "reason": "투자금이 어떤 마일스톤으로 이어지는지 확인해야 합니다."},
+    'RISKS': {"text": "현재 가장 큰 리스크는 무엇이고, 어떻게 대응하고 계신가요?", "category": "risk",
+              "reason": "리스크 인식 수준과 대응 능력을 파악합니다."},
+    'COMPETITION': {"text": "주요 경쟁사 대비 차별화 포인트는 무엇인가요?", "category": "strategy",
+                    "reason": "경쟁 우위가 지속 가능한지 확인해야 합니다."},
+    'CUSTOMER': {"text": "핵심 타겟 고객은 누구이고, 그 고객이 겪는 가장 큰 문제는 무엇인가요?", "category": "strategy",
+                 "reason": "고객 정의가 명확해야 제품과 영업이 효율적입니다."},
+    'PRODUCT': {"text": "제품의 핵심 기능은 무엇이고, 고객이 가장 많이 쓰는 기능은 무엇인가요?", "category": "strategy",
+                "reason": "제품 가치가 실제 사용으로 이어지는지 확인합니다."},
+}
+
+# 대화 단계별 우선순위 (앞쪽일수록 먼저 제안)
+STAGE_PRIORITIES = {
+    'introduction': ['TEAM', 'BUSINESS_MODEL', 'CUSTOMER', 'PRODUCT', 'MARKET', 'TRACTION', 'MRR'],
+    'deep_dive': ['MRR', 'CAC', 'LTV', 'CHURN', 'RETENTION', 'COMPETITION', 'TECHNOLOGY',
+                  'BURN_RATE', 'MARKET', 'TRACTION', 'ARR', 'MAU', 'NPS', 'GMV', 'DAU'],
+    'closing': ['FUNDING', 'RUNWAY', 'BURN_RATE', 'RISKS', 'COMPETITION', 'MRR'],
+}
+
+# 관계 유형별로 앞당길 주제
+RELATIONSHIP_PRIORITIES = {
+    'STARTUP': ['MRR', 'CAC', 'LTV', 'RUNWAY'],
+    'CLIENT': ['CUSTOMER', 'PRODUCT', 'TECHNOLOGY', 'RISKS'],
+    'PARTNER': ['BUSINESS_MODEL', 'MARKET', 'COMPETITION', 'CUSTOMER'],
+}
+
+PRIORITY_LABELS = ['critical', 'important', 'follow_up']
+
+
+def generate_heuristic_questions(
+    transcripts: List[str],
+    relationship_type: Optional[str] = None,
+    mentioned_context: Optional[Dict] = None,
+    stage: Optional[str] = None,
+    count: int = 3
+) -> dict:
+    """
+    아직 언급되지 않은 지표/주제에 대한 템플릿 질문 생성 (LLM 호출 없음)
+
+    Args:
+        transcripts: 전사 텍스트 리스트
+        relationship_type: STARTUP, CLIENT, PARTNER (없으면 단계 우선순위만 사용)
+        mentioned_context: extract_mentioned_topics 결과 (없으면 계산)
+        stage: 대화 단계 (없으면 계산)
+        count: 생성할 질문 수
+
+    Returns:
+        dict: {"questions": [...], "stage": str, "source": "heuristic"}
+    """
+    if mentioned_context is None:
+        mentioned_context = extract_mentioned_topics(transcripts)
+    if stage is None:
+        stage = get_conversation_stage(transcripts)
+
+    covered = mentioned_context.get("metrics_mentioned", set()) | mentioned_context.get("topics_discussed", set())
+
+    # 관계 유형 우선 → 단계 우선 → 나머지 템플릿 순
+    ordered = RELATIONSHIP_PRIORITIES.get(relationship_type or "", []) + STAGE_PRIORITIES.get(stage, [])
+    ordered += [key for key in QUESTION_TEMPLATES if key not in ordered]
+
+    questions = []
+    seen = set()
+    for key in ordered:
+        if key in covered or key in seen:
+            continue
+        seen.add(key)
+        template = QUESTION_TEMPLATES[key]
+        questions.append({
+            "text": template["text"],
+            "priority": PRIORITY_LABELS[min(len(questions), len(PRIORITY_LABELS) - 1)],
+            "reason": template["reason"],
+            "category": template["category"],
+            "topic": key,
+        })
+        if len(questions) >= count:
+            break
+
+    return {"questions": questions, "stage": stage, "source": "heuristic"}
+
+
+# ============ 2단계 응답 (휴리스틱 → LLM 교체) ============
+
+PENDING_TTL_SECONDS = 10 * 60
+
+_pending = SessionStore(dict, ttl_seconds=PENDING_TTL_SECONDS, max_sessions=2000, name="pending question")
+
+
+def submit_llm_questions(job: Awaitable[dict]) -> str:
+    """
+    LLM 질문 생성을 백그라운드로 시작
+
+    Args:
+        job: 질문 생성 코루틴
+
+    Returns:
+        결과 조회용 request_id
+    """
+    request_id = uuid.uuid4().hex
+    entry = {"status": "pending", "result": None, "error": None, "created": time.time()}
+
+    async def run():
+        try:
+            entry["result"] = await job
+            entry["status"] = "done"
+        except Exception as e:
+            logger.error(f"Background LLM question generation failed: {e}")
+            entry["error"] = str(e)
+            entry["status"] = "failed"
+
+    entry["task"] = asyncio.create_task(run())
+    _pending.set(request_id, entry)
+    return request_id
+
+
+def get_llm_questions(request_id: str) -> Optional[dict]:
+    """
+    백그라운드 LLM 질문 상태 조회
+
+    Returns:
+        {"status": pending | done | failed, "result", "error"} 또는 None (없거나 만료)
+    """
+    entry = _pending.get(request_id)
+    if entry is None:
+        return None
+    return {"status": entry["status"], "result": entry["result"], "error": entry["error"]}
+
+
+async def wait_llm_questions(request_id: str, timeout: Optional[float] = None) -> Optional[dict]:
+    """LLM 질문이 끝날 때까지 대기 (timeout 초과 시 현재 상태 반환)"""
+    entry = _pending.get(request_id)
+    if entry is None:
+        return None
+    try:
+        await asyncio.wait_for(asyncio.shield(entry["task"]), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    return get_llm_questions(request_id)
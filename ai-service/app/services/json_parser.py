@@ -0,0 +1,383 @@
+"""
+LLM 응답 JSON 파서
+- 응답 전체가 JSON 객체면 (코드 펜스 제거 후) json.loads 한 번으로 처리
+- 그 외에는 문자열/이스케이프를 인식하는 선형 시간 중괄호 스캐너
+- 잘린 응답(max_tokens 초과) 복구, 후행 쉼표 보정
+- 질문/요약 페이로드 스키마 검증
+- 파싱 실패율 메트릭
+"""
+
+import re
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 파싱을 시도할 후보 객체 최대 개수
+MAX_CANDIDATES = 8
+
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_STRUCTURAL_RE = re.compile(r'[{}\[\]"\\]')
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+# ============ 스키마 ============
+
+# Claude 기본/맥락/관계 질문
+QUESTIONS_SCHEMA = {
+    "type": "object",
+    "required": ["questions"],
+    "properties": {
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["text"],
+                "properties": {
+                    "text": {"type": "string", "minLength": 1},
+                    "priority": {"type": "string", "enum": ["critical", "important", "follow_up"]},
+                    "reason": {"type": "string"},
+                    "category": {"type": "string"},
+                    "explanation": {"type": "string"},
+                },
+            },
+        },
+    },
+}
+
+# OpenAI 개인화 질문 (priority 1-10)
+PERSONALIZED_QUESTIONS_SCHEMA = {
+    "type": "object",
+    "required": ["questions"],
+    "properties": {
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["text"],
+                "properties": {
+                    "text": {"type": "string", "minLength": 1},
+                    "category": {"type": "string"},
+                    "priority": {"type": "integer"},
+                    "reasoning": {"type": "string"},
+                    "insight": {"type": ["string", "null"]},
+                },
+            },
+        },
+        "stage": {"type": "string"},
+        "analysis": {"type": "string"},
+    },
+}
+
+# 여러 페르소나/레벨 개인화 질문 (한 번의 호출로 세트별 생성)
+MULTI_PERSONA_QUESTIONS_SCHEMA = {
+    "type": "object",
+    "required": ["sets"],
+    "properties": {
+        "sets": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["persona", "questions"],
+                "properties": {
+                    "persona": {"type": "string"},
+                    "level": {"type": "integer"},
+                    "questions": PERSONALIZED_QUESTIONS_SCHEMA["properties"]["questions"],
+                },
+            },
+        },
+        "stage": {"type": "string"},
+        "analysis": {"type": "string"},
+    },
+}
+
+# 회의 요약
+SUMMARY_SCHEMA = {
+    "type": "object",
+    "required": ["summary"],
+    "properties": {
+        "summary": {"type": "string"},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+        "decisions": {"type": "array", "items": {"type": "string"}},
+        "action_items": {"type": "array", "items": {"type": "string"}},
+        "key_questions": {"type": "array", "items": {"type": "string"}},
+        "missed_questions": {"type": "array", "items": {"type": "string"}},
+        "suggested_data_updates": {"type": "object"},
+        "next_meeting_agenda": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+# 긴 회의 구간 요약 (map 단계)
+CHUNK_SUMMARY_SCHEMA = {
+    "type": "object",
+    "required": ["summary"],
+    "properties": {
+        "summary": {"type": "string"},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+        "decisions": {"type": "array", "items": {"type": "string"}},
+        "action_items": {"type": "array", "items": {"type": "string"}},
+        "open_questions": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+# ============ 메트릭 ============
+
+_parse_stats: Dict[str, Dict[str, int]] = {}
+
+
+def record_parse(source: str, outcome: str):
+    """파싱 결과 기록 (outcome: ok | repaired | invalid | failed)"""
+    stats = _parse_stats.setdefault(source, {"ok": 0, "repaired": 0, "invalid": 0, "failed": 0})
+    stats[outcome] = stats.get(outcome, 0) + 1
+
+
+def get_parse_metrics() -> Dict[str, Any]:
+    """소스별 파싱 통계와 실패율"""
+    result = {}
+    for source, stats in _parse_stats.items():
+        total = sum(stats.values())
+        failures = stats["invalid"] + stats["failed"]
+        result[source] = {
+            **stats,
+            "total": total,
+            "failure_rate": round(failures / total, 4) if total else 0.0,
+        }
+    return result
+
+
+# ============ 스캐너 ============
+
+def scan_json_candidates(text: str) -> Tuple[List[Tuple[int, int]], Optional[str]]:
+    """
+    텍스트를 한 번 훑어 균형 잡힌 {...} 구간과 잘린 객체 복구 후보를 반환
+
+    - 문자열 안의 중괄호와 이스케이프된 따옴표는 무시
+    - 앞쪽의 짝 없는 '{'가 있어도 안쪽의 완결된 객체를 찾아냄
+
+    Returns:
+        (완결된 객체 구간 리스트 [(start, end)], 잘린 객체 복구 문자열 또는 None)
+    """
+    spans = []
+    stack: List[Tuple[str, int]] = []
+    in_string = False
+    escaped_pos = -1
+    last_close: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+    # 구조 문자만 건너뛰며 방문 (일반 텍스트는 정규식 엔진이 스킵)
+    for match in _STRUCTURAL_RE.finditer(text):
+        i = match.start()
+        ch = text[i]
+        if in_string:
+            if i == escaped_pos:
+                continue
+            if ch == "\\":
+                escaped_pos = i + 1
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            # 객체 밖의 따옴표는 산문으로 취급
+            if stack:
+                in_string = True
+        elif ch in "{[":
+            stack.append((ch, i))
+        elif ch in "}]":
+            # 짝이 맞지 않는 닫는 괄호는 무시
+            if not stack or _CLOSERS[stack[-1][0]] != ch:
+                continue
+            opener, start = stack.pop()
+            if opener == "{":
+                spans.append((start, i + 1))
+            if stack:
+                last_close = (i, tuple(c for c, _ in stack))
+
+    # 잘린 응답: 가장 바깥 객체가 닫히지 않음 → 마지막 완결 요소까지 자르고 닫기
+    repaired = None
+    if stack and stack[0][0] == "{" and last_close:
+        cut, open_chars = last_close
+        body = text[stack[0][1]:cut + 1]
+        closers = "".join(_CLOSERS[c] for c in reversed(open_chars))
+        repaired = body + closers
+
+    return spans, repaired
+
+
+def _loads(candidate: str) -> Tuple[Optional[Any], bool]:
+    """json.loads + 후행 쉼표 보정 (값, 보정 여부)"""
+    try:
+        return json.loads(candidate), False
+    except json.JSONDecodeError:
+        pass
+
+    fixed = _TRAILING_COMMA_RE.sub(r'\1', candidate)
+    if fixed != candidate:
+        try:
+            return json.loads(fixed), True
+        except json.JSONDecodeError:
+            pass
+    return None, False
+
+
+def _strip_code_fence(text: str) -> str:
+    """앞뒤 공백과 ```json ... ``` 코드 펜스 제거"""
+    body = text.strip()
+    if body.startswith("```"):
+        newline = body.find("\n")
+        body = body[newline + 1:] if newline >= 0 else body[3:]
+    if body.endswith("```"):
+        body = body[:-3]
+    return body.strip()
+
+
+def extract_json_object(
+    text: str,
+    required_keys: Optional[List[str]] = None
+) -> Tuple[Optional[dict], bool]:
+    """
+    LLM 응답에서 JSON 객체 추출
+
+    Args:
+        text: LLM 응답 텍스트 (코드 펜스, 앞뒤 설명문 포함 가능)
+        required_keys: 반드시 포함해야 하는 최상위 키
+
+    Returns:
+        (추출된 dict 또는 None, 보정/복구 여부)
+    """
+    if not text:
+        return None, False
+
+    # 대부분의 응답은 (코드 펜스로 감싼) JSON 객체 하나 → 스캐너 없이 바로 파싱
+    body = _strip_code_fence(text)
+    if body.startswith("{") and body.endswith("}"):
+        try:
+            value = json.loads(body)
+        except json.JSONDecodeError:
+            value = None
+        if isinstance(value, dict) and all(k in value for k in (required_keys or [])):
+            return value, False
+
+    spans, repaired = scan_json_candidates(text)
+
+    # 바깥쪽(긴) 객체부터 시도
+    spans.sort(key=lambda s: s[0] - s[1])
+    for start, end in spans[:MAX_CANDIDATES]:
+        value, fixed = _loads(text[start:end])
+        if isinstance(value, dict) and all(k in value for k in (required_keys or [])):
+            return value, fixed
+
+    if repaired:
+        value, _ = _loads(repaired)
+        if isinstance(value, dict) and all(k in value for k in (required_keys or [])):
+            logger.info("Recovered truncated JSON response")
+            return value, True
+
+    return None, False
+
+
+# ============ 스키마 검증 ============
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _matches(value: Any, schema: dict) -> bool:
+    """JSON Schema 부분 집합 검사 (type, required, properties, items, enum, minLength)"""
+    expected = schema.get("type")
+    if expected:
+        types = expected if isinstance(expected, list) else [expected]
+        if not any(_TYPE_CHECKS[t](value) for t in types):
+            return False
+
+    if "enum" in schema and value not in schema["enum"]:
+        return False
+    if "minLength" in schema and isinstance(value, str) and len(value.strip()) < schema["minLength"]:
+        return False
+
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if key not in value:
+                return False
+        for key, sub in schema.get("properties", {}).items():
+            if key in value and not _matches(value[key], sub):
+                return False
+
+    if isinstance(value, list) and "items" in schema:
+        return all(_matches(item, schema["items"]) for item in value)
+
+    return True
+
+
+def validate_payload(data: Any, schema: dict) -> Optional[dict]:
+    """
+    스키마 검증 후 정리된 페이로드 반환
+
+    - 배열 안의 잘못된 항목은 제거 (나머지는 살림)
+    - 최상위 필수 키가 없거나 선택 필드 타입이 틀리면 해당 필드 제거
+    - 필수 항목이 유효하지 않으면 None
+    """
+    if not isinstance(data, dict):
+        return None
+
+    cleaned = dict(data)
+    for key, sub in schema.get("properties", {}).items():
+        if key not in cleaned:
+            continue
+        value = cleaned[key]
+        if sub.get("type") == "array" and isinstance(value, list) and "items" in sub:
+            cleaned[key] = [item for item in value if _matches(item, sub["items"])]
+        elif not _matches(value, sub):
+            del cleaned[key]
+
+    for key in schema.get("required", []):
+        if key not in cleaned:
+            return None
+        value = cleaned[key]
+        if isinstance(value, list) and not value:
+            return None
+
+    return cleaned
+
+
+def parse_llm_json(text: str, schema: dict, source: str) -> Optional[dict]:
+    """
+    LLM 응답 파싱 + 스키마 검증 + 메트릭 기록
+
+    Args:
+        text: LLM 응답 텍스트
+        schema: 검증할 스키마
+        source: 메트릭 구분용 이름 (예: "claude_questions")
+
+    Returns:
+        검증된 dict 또는 None (호출부에서 폴백 처리)
+    """
+    data, fixed = extract_json_object(text, schema.get("required"))
+    if data is None:
+        record_parse(source, "failed")
+        logger.warning(f"[{source}] JSON parse failed: {text[:100]!r}")
+        return None
+
+    payload = validate_payload(data, schema)
+    if payload is None:
+        record_parse(source, "invalid")
+        logger.warning(f"[{source}] JSON payload failed schema validation")
+        return None
+
+    record_parse(source, "repaired" if fixed else "ok")
+    return payload
+
+
+def record_structured_output(source: str, data: Any, schema: dict) -> Optional[dict]:
+    """네이티브 구조화 출력(tool use, json_schema) 결과 검증 + 메트릭 기록"""
+    payload = validate_payload(data, schema)
+    record_parse(source, "ok" if payload is not None else "invalid")
+    return payload
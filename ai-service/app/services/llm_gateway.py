@@ -0,0 +1,388 @@
+"""
+LLM 게이트웨이 (LLM Gateway)
+- 모든 외부 AI 제공자(Anthropic, OpenAI, Daglo) 클라이언트를 한 곳에서 관리
+- 제공자별 토큰 버킷 레이트 리밋 + 동시 실행 수 제한
+- 429/5xx/연결 오류 시 지터가 있는 지수 백오프 재시도
+- 데드라인 전파 (남은 시간 안에서만 대기/재시도)
+- 제공자/모델별 지연시간, 토큰 사용량 메트릭
+"""
+
+import os
+import time
+import random
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import anthropic
+import httpx
+import openai
+from dotenv import load_dotenv
+
+from app.services.model_router import record_latency
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 제공자별 한도 (환경변수로 조정)
+PROVIDER_LIMITS = {
+    "anthropic": {
+        "rate_per_sec": float(os.getenv("ANTHROPIC_RATE_PER_SEC", "5")),
+        "burst": int(os.getenv("ANTHROPIC_BURST", "10")),
+        "concurrency": int(os.getenv("ANTHROPIC_CONCURRENCY", "8")),
+    },
+    "openai": {
+        "rate_per_sec": float(os.getenv("OPENAI_RATE_PER_SEC", "8")),
+        "burst": int(os.getenv("OPENAI_BURST", "16")),
+        "concurrency": int(os.getenv("OPENAI_CONCURRENCY", "12")),
+    },
+    "daglo": {
+        "rate_per_sec": float(os.getenv("DAGLO_RATE_PER_SEC", "4")),
+        "burst": int(os.getenv("DAGLO_BURST", "8")),
+        "concurrency": int(os.getenv("DAGLO_CONCURRENCY", "8")),
+    },
+}
+
+REQUEST_TIMEOUT = 60.0        # 단일 시도 최대 시간 (초)
+QUEUE_TIMEOUT = 30.0          # 데드라인이 없을 때 최대 대기 시간 (초)
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5            # 초
+BACKOFF_MAX = 8.0             # 초
+
+
+class GatewayError(Exception):
+    """게이트웨이에서 요청을 처리하지 못함"""
+
+
+class DeadlineExceeded(GatewayError):
+    """데드라인 안에 요청을 시작/완료할 수 없음"""
+
+
+class TokenBucket:
+    """
+    토큰 버킷 레이트 리미터
+
+    Args:
+        rate: 초당 보충 토큰 수
+        capacity: 최대 버스트
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, deadline: float):
+        """토큰 1개 획득 (데드라인 전에 못 얻으면 DeadlineExceeded)"""
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            wait = (1 - self.tokens) / self.rate
+            if time.monotonic() + wait > deadline:
+                raise DeadlineExceeded("rate limit wait exceeds deadline")
+            await asyncio.sleep(wait)
+
+
+# ============ 클라이언트 ============
+
+_async_clients: Dict[str, Any] = {}
+_sync_clients: Dict[str, Any] = {}
+
+
+def get_async_client(provider: str):
+    """제공자별 비동기 클라이언트 (재시도는 게이트웨이가 담당하므로 SDK 재시도 비활성화)"""
+    if provider not in _async_clients:
+        if provider == "anthropic":
+            _async_clients[provider] = anthropic.AsyncAnthropic(
+                api_key=os.getenv("ANTHROPIC_API_KEY"), max_retries=0, timeout=REQUEST_TIMEOUT
+            )
+        elif provider == "openai":
+            _async_clients[provider] = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"), max_retries=0, timeout=REQUEST_TIMEOUT
+            )
+        elif provider == "daglo":
+            _async_clients[provider] = httpx.AsyncClient(timeout=300.0)
+        else:
+            raise GatewayError(f"Unknown provider: {provider}")
+    return _async_clients[provider]
+
+
+def get_sync_client(provider: str):
+    """동기 클라이언트 (테스트 스크립트 호환용, 서비스 코드에서는 사용하지 않음)"""
+    if provider not in _sync_clients:
+        if provider == "anthropic":
+            _sync_clients[provider] = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        elif provider == "openai":
+            _sync_clients[provider] = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        else:
+            raise GatewayError(f"Unknown provider: {provider}")
+    return _sync_clients[provider]
+
+
+# ============ 한도 / 메트릭 ============
+
+_buckets: Dict[str, TokenBucket] = {}
+_semaphores: Dict[str, asyncio.Semaphore] = {}
+_metrics: Dict[str, Dict[str, Any]] = {}
+
+
+def _limits(provider: str):
+    if provider not in _buckets:
+        limits = PROVIDER_LIMITS[provider]
+        _buckets[provider] = TokenBucket(limits["rate_per_sec"], limits["burst"])
+        _semaphores[provider] = asyncio.Semaphore(limits["concurrency"])
+    return _buckets[provider], _semaphores[provider]
+
+
+def _provider_metrics(provider: str) -> Dict[str, Any]:
+    return _metrics.setdefault(provider, {
+        "calls": 0,
+        "success": 0,
+        "errors": 0,
+        "retries": 0,
+        "rejected": 0,
+        "in_flight": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "latencies_ms": deque(maxlen=500),
+    })
+
+
+def _record_usage(provider: str, result: Any):
+    """응답의 토큰 사용량 기록 (Anthropic: input/output, OpenAI: prompt/completion)"""
+    usage = getattr(result, "usage", None)
+    if usage is None:
+        return
+    stats = _provider_metrics(provider)
+    stats["input_tokens"] += getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", 0) or 0
+    stats["output_tokens"] += getattr(usage, "output_tokens", None) or getattr(usage, "completion_tokens", 0) or 0
+
+
+def get_gateway_metrics() -> Dict[str, Any]:
+    """제공자별 호출/오류/재시도/토큰/지연시간 통계"""
+    result = {}
+    for provider, stats in _metrics.items():
+        latencies = sorted(stats["latencies_ms"])
+        summary = {k: v for k, v in stats.items() if k != "latencies_ms"}
+        if latencies:
+            summary["latency_ms"] = {
+                "p50": round(latencies[len(latencies) // 2], 1),
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1),
+            }
+        result[provider] = summary
+    return result
+
+
+# ============ 호출 ============
+
+def deadline_from_budget(budget_ms: Optional[float]) -> Optional[float]:
+    """지연 예산(ms)을 monotonic 데드라인으로 변환"""
+    if budget_ms is None:
+        return None
+    return time.monotonic() + budget_ms / 1000
+
+
+def _is_retryable(error: Exception) -> bool:
+    """429 / 5xx / 연결 오류 / 타임아웃만 재시도"""
+    if isinstance(error, httpx.HTTPStatusError):
+        # raise_for_status() 오류는 상태 코드가 응답에만 있음 (Daglo)
+        status = error.response.status_code
+    else:
+        status = getattr(error, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(error, (
+        asyncio.TimeoutError,
+        httpx.TransportError,
+        anthropic.APIConnectionError,
+        openai.APIConnectionError,
+    ))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Retry-After 헤더 (초)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def run(
+    provider: str,
+    operation: str,
+    call: Callable[[float], Awaitable[Any]],
+    model: Optional[str] = None,
+    deadline: Optional[float] = None,
+    retry: bool = True
+) -> Any:
+    """
+    제공자 한도/재시도/데드라인을 적용해 호출 실행
+
+    Args:
+        provider: anthropic | openai | daglo
+        operation: 로그/메트릭용 작업 이름
+        call: 단일 시도 코루틴 팩토리 (인자: 이번 시도에 허용된 타임아웃 초)
+        model: 모델 이름 (있으면 라우터에 지연시간 보고)
+        deadline: monotonic 데드라인 (None이면 QUEUE_TIMEOUT + 재시도 허용)
+        retry: False면 재시도하지 않음 (서버가 이미 처리했을 수 있는 비멱등 요청)
+
+    Returns:
+        call 결과
+    """
+    bucket, semaphore = _limits(provider)
+    stats = _provider_metrics(provider)
+    stats["calls"] += 1
+    hard_deadline = deadline or (time.monotonic() + QUEUE_TIMEOUT + REQUEST_TIMEOUT * (MAX_RETRIES + 1))
+
+    attempt = 0
+    while True:
+        queue_deadline = min(hard_deadline, time.monotonic() + QUEUE_TIMEOUT)
+        try:
+            await bucket.acquire(queue_deadline)
+            await asyncio.wait_for(semaphore.acquire(), timeout=max(0.0, queue_deadline - time.monotonic()))
+        except (DeadlineExceeded, asyncio.TimeoutError):
+            stats["rejected"] += 1
+            logger.warning(f"[gateway] {provider}.{operation} rejected: no capacity before deadline")
+            raise DeadlineExceeded(f"{provider}.{operation}: no capacity before deadline")
+
+        start = time.monotonic()
+        stats["in_flight"] += 1
+        try:
+            timeout = min(REQUEST_TIMEOUT, hard_deadline - start)
+            if timeout <= 0:
+                raise DeadlineExceeded(f"{provider}.{operation}: deadline passed")
+            result = await asyncio.wait_for(call(timeout), timeout=timeout)
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        finally:
+            stats["in_flight"] -= 1
+            semaphore.release()
+
+        elapsed = time.monotonic() - start
+        if error is None:
+            stats["success"] += 1
+            stats["latencies_ms"].append(elapsed * 1000)
+            _record_usage(provider, result)
+            if model:
+                record_latency(model, elapsed)
+            return result
+
+        stats["errors"] += 1
+        if not retry or isinstance(error, DeadlineExceeded) or not _is_retryable(error) or attempt >= MAX_RETRIES:
+            logger.warning(f"[gateway] {provider}.{operation} failed after {attempt + 1} attempts: {error}")
+            raise error
+
+        # 지터 포함 지수 백오프 (Retry-After가 있으면 우선)
+        backoff = _retry_after(error) or random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+        if time.monotonic() + backoff >= hard_deadline:
+            logger.warning(f"[gateway] {provider}.{operation} giving up: backoff exceeds deadline")
+            raise error
+
+        attempt += 1
+        stats["retries"] += 1
+        logger.info(f"[gateway] {provider}.{operation} retry {attempt}/{MAX_RETRIES} in {backoff:.2f}s ({error})")
+        await asyncio.sleep(backoff)
+
+
+async def anthropic_messages(
+    model: str,
+    max_tokens: int,
+    messages: list,
+    deadline: Optional[float] = None,
+    **kwargs
+):
+    """Anthropic Messages API 호출"""
+    client = get_async_client("anthropic")
+    return await run(
+        "anthropic",
+        "messages",
+        lambda timeout: client.messages.create(
+            model=model, max_tokens=max_tokens, messages=messages, timeout=timeout, **kwargs
+        ),
+        model=model,
+        deadline=deadline,
+    )
+
+
+async def openai_chat(
+    model: str,
+    messages: list,
+    deadline: Optional[float] = None,
+    **kwargs
+):
+    """OpenAI Chat Completions API 호출"""
+    client = get_async_client("openai")
+    return await run(
+        "openai",
+        "chat",
+        lambda timeout: client.chat.completions.create(
+            model=model, messages=messages, timeout=timeout, **kwargs
+        ),
+        model=model,
+        deadline=deadline,
+    )
+
+
+async def openai_transcribe(
+    file_factory: Callable[[], Any],
+    deadline: Optional[float] = None,
+    **kwargs
+):
+    """
+    OpenAI Whisper 전사 호출
+
+    Args:
+        file_factory: 시도마다 새 파일 객체를 만드는 함수 (재시도 시 스트림 재사용 방지)
+    """
+    client = get_async_client("openai")
+    return await run(
+        "openai",
+        "transcribe",
+        lambda timeout: client.audio.transcriptions.create(file=file_factory(), timeout=timeout, **kwargs),
+        model=kwargs.get("model"),
+        deadline=deadline,
+    )
+
+
+async def daglo_request(
+    method: str,
+    url: str,
+    deadline: Optional[float] = None,
+    retry: bool = False,
+    **kwargs
+) -> httpx.Response:
+    """
+    Daglo STT API 호출
+
+    Args:
+        retry: True면 5xx/429/타임아웃 재시도 (상태 조회 GET처럼 멱등인 요청만)
+            전사 작업 제출 POST는 서버가 접수한 뒤 실패해도 재시도하면 작업이 중복 생성되어 과금되므로 기본값 False
+    """
+    client = get_async_client("daglo")
+
+    async def call(timeout: float) -> httpx.Response:
+        response = await client.request(method, url, timeout=timeout, **kwargs)
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
+    try:
+        return await run("daglo", method.lower(), call, deadline=deadline, retry=retry)
+    except httpx.HTTPStatusError as e:
+        return e.response
@@ -0,0 +1,222 @@
+"""
+미팅 시작 준비 (Meeting Warm Start)
+- 백엔드가 미팅 시작(join_meeting) 시점에 관계/개인화 맥락으로 호출 → 첫 오디오 청크 전에 준비
+  - 고정 프롬프트 부분(관계 정보, 페르소나/레벨/선호도 블록)을 미리 채운 템플릿
+  - 1단계(도입) 오프닝 질문 LLM 생성을 백그라운드로 시작
+- 회의 ID로 보관
+  - 첫 /api/questions/* 호출은 오프닝 질문을 바로 반환 (한 번만, 생성 중이면 진행 중인 호출 결과를 대기)
+  - 이후 호출은 맥락을 다시 보내지 않아도 준비된 템플릿에 전사만 채워 사용
+"""
+
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.services.personalized_questions import bind_personalized_template, generate_personalized_questions
+from app.services.prompt_assembly import PromptTemplate, content_key
+from app.services.question_generator import bind_relationship_template, generate_questions_with_relationship
+from app.services.question_memory import get_question_memory
+from app.services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TTL_SECONDS = 4 * 60 * 60
+WARMUP_MAX_MEETINGS = 500
+OPENING_STAGE = "introduction"
+OPENING_WAIT_SHARE = 0.5  # 오프닝 질문이 아직 생성 중일 때 기다리는 지연 예산 비율 (나머지는 새 생성용)
+
+# 대화가 시작되기 전이므로 전사 자리에 상황 설명을 넣어 오프닝 질문을 요청
+OPENING_TRANSCRIPT = "(미팅 시작 전 - 아직 대화 내용이 없습니다. 인사 직후 바로 꺼낼 수 있는 오프닝 질문을 제안하세요.)"
+
+_warmups = SessionStore(dict, ttl_seconds=WARMUP_TTL_SECONDS, max_sessions=WARMUP_MAX_MEETINGS, name="meeting warmup")
+_stats = {"started": 0, "reused": 0, "served_ready": 0, "served_waited": 0, "missed": 0, "failed": 0, "context_reuses": 0}
+
+
+async def _generate_opening(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """준비된 템플릿으로 오프닝 질문 생성"""
+    if entry["kind"] == "personalized":
+        return await generate_personalized_questions(
+            OPENING_TRANSCRIPT,
+            entry["relationship"],
+            entry["personalization"],
+            provider=entry["provider"],
+            template=entry["template"]
+        )
+    return await generate_questions_with_relationship(
+        OPENING_TRANSCRIPT,
+        entry["relationship"],
+        template=entry["template"],
+        stage=OPENING_STAGE
+    )
+
+
+def start_meeting_warmup(
+    meeting_id: str,
+    relationship: Optional[Dict[str, Any]] = None,
+    personalization: Optional[Dict[str, Any]] = None,
+    provider: Optional[str] = None,
+    opening: Optional[Awaitable[dict]] = None
+) -> Dict[str, Any]:
+    """
+    미팅 시작 준비 (템플릿 바인딩 + 오프닝 질문 백그라운드 생성)
+
+    같은 맥락으로 다시 호출하면(재접속 등) 기존 준비 결과 재사용
+
+    Args:
+        meeting_id: 회의 ID
+        relationship: 관계 맥락 (resolve_relationship 결과)
+        personalization: 개인화 정보 (있으면 개인화 프롬프트 사용)
+        provider: 개인화 질문 제공자 (openai | anthropic, None이면 라우터 결정)
+        opening: 오프닝 질문 코루틴 (Mock 모드 등에서 교체용, 없으면 LLM 생성)
+
+    Returns:
+        준비 상태 (warmup_status + "reused")
+    """
+    kind = "personalized" if personalization else "relationship"
+    key = content_key((kind, relationship, personalization, provider))
+    existing = _warmups.get(meeting_id)
+    if existing is not None and key is not None and existing["key"] == key and existing["status"] != "failed":
+        if opening is not None:
+            opening.close()
+        _stats["reused"] += 1
+        return {**warmup_status(existing), "reused": True}
+
+    if kind == "personalized":
+        template = bind_personalized_template(relationship, personalization)
+    else:
+        template = bind_relationship_template(relationship) if relationship else None
+
+    entry = {
+        "meeting_id": meeting_id,
+        "kind": kind,
+        "key": key,
+        "relationship": relationship,
+        "personalization": personalization,
+        "provider": provider,
+        "template": template,
+        "status": "pending",
+        "result": None,
+        "served": False,
+        "created": time.time(),
+    }
+    job = opening if opening is not None else _generate_opening(entry)
+
+    async def run():
+        start = time.monotonic()
+        try:
+            entry["result"] = await job
+            entry["status"] = "done"
+            logger.info(f"Opening questions ready for {meeting_id} in {(time.monotonic() - start) * 1000:.0f}ms")
+        except Exception as e:
+            _stats["failed"] += 1
+            logger.error(f"Opening question generation failed ({meeting_id}): {e}")
+            entry["status"] = "failed"
+
+    entry["task"] = asyncio.create_task(run())
+    _warmups.set(meeting_id, entry)
+    _stats["started"] += 1
+    return {**warmup_status(entry), "reused": False}
+
+
+async def take_opening_questions(meeting_id: Optional[str], timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    첫 질문 요청에 오프닝 질문 반환 (회의당 한 번)
+
+    Args:
+        meeting_id: 회의 ID
+        timeout: 생성 중일 때 최대 대기 시간 (초, None이면 완료까지)
+
+    Returns:
+        질문 생성 결과 (이미 반환했거나, 준비하지 않았거나, 실패/시간 초과면 None)
+    """
+    entry = _warmups.get(meeting_id) if meeting_id else None
+    if entry is None or entry["served"]:
+        return None
+    # 결과와 관계없이 첫 요청에서 소진 (이후 요청은 실제 전사 기반으로 생성)
+    entry["served"] = True
+
+    ready = entry["status"] == "done"
+    if not ready:
+        try:
+            await asyncio.wait_for(asyncio.shield(entry["task"]), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    if entry["status"] != "done":
+        _stats["missed"] += 1
+        return None
+
+    _stats["served_ready" if ready else "served_waited"] += 1
+    result = {**entry["result"], "warm_start": True}
+    # 보여준 오프닝 질문도 제안 질문으로 기록 (이후 요청에서 반복 제안 방지)
+    if "questions" in result:
+        result["questions"], _ = get_question_memory(meeting_id).dedupe(result["questions"])
+    return result
+
+
+async def opening_or_generate(
+    meeting_id: Optional[str],
+    budget_ms: Optional[float],
+    generate: Callable[[Optional[float]], Awaitable[dict]]
+) -> dict:
+    """
+    회의의 첫 질문 요청이면 오프닝 질문, 아니면 generate(남은 지연 예산)로 생성
+
+    Args:
+        meeting_id: 회의 ID (None이면 바로 생성)
+        budget_ms: 요청 지연 예산 (ms)
+        generate: 지연 예산(ms) → 질문 생성 코루틴
+    """
+    start = time.monotonic()
+    timeout = budget_ms * OPENING_WAIT_SHARE / 1000 if budget_ms is not None else None
+    opening = await take_opening_questions(meeting_id, timeout)
+    if opening is not None:
+        return opening
+    if budget_ms is not None:
+        budget_ms = max(0.0, budget_ms - (time.monotonic() - start) * 1000)
+    return await generate(budget_ms)
+
+
+def warmed_context(meeting_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    미팅 시작 시 준비한 맥락 {"kind", "relationship", "personalization", "template"} (없으면 None)
+
+    요청에 맥락이 없을 때만 사용 (요청에 포함된 맥락이 항상 우선)
+    """
+    entry = _warmups.get(meeting_id) if meeting_id else None
+    if entry is None:
+        return None
+    _stats["context_reuses"] += 1
+    return {key: entry[key] for key in ("kind", "relationship", "personalization", "template")}
+
+
+def warmed_template(context: Optional[Dict[str, Any]], kind: str) -> Optional[PromptTemplate]:
+    """준비된 맥락의 템플릿 (프롬프트 종류가 다르면 None)"""
+    return context["template"] if context and context["kind"] == kind else None
+
+
+def warmup_status(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """준비 상태 (외부 응답용)"""
+    return {
+        "meeting_id": entry["meeting_id"],
+        "kind": entry["kind"],
+        "status": entry["status"],
+        "served": entry["served"],
+        "created": entry["created"],
+    }
+
+
+def get_meeting_warmup(meeting_id: str) -> Optional[Dict[str, Any]]:
+    """회의의 준비 상태 (없으면 None)"""
+    entry = _warmups.get(meeting_id)
+    return warmup_status(entry) if entry else None
+
+
+def get_warmup_metrics() -> Dict[str, Any]:
+    """미팅 시작 준비 통계 (메트릭 엔드포인트용)"""
+    served = _stats["served_ready"] + _stats["served_waited"]
+    return {
+        **_stats,
+        "ready_rate": round(_stats["served_ready"] / served, 3) if served else 0.0,
+        "active": len(_warmups),
+    }
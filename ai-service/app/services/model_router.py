@@ -0,0 +1,216 @@
+"""
+모델 라우터 (Model Router)
+- 요청별 지연 예산(latency budget / deadline)과 대화 단계에 따라
+  모델, max_tokens, 전사 토큰 예산 선택
+- 모델별 최근 지연시간 분위수(p50/p95) 기반 판단
+- 라우팅 결정은 감사(audit)용으로 로그 + 최근 이력 보관
+"""
+
+import os
+import time
+import logging
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from app.services.transcript_window import (
+    QUESTION_TOKEN_BUDGET,
+    SUMMARY_CHUNK_TOKEN_BUDGET,
+    SUMMARY_TOKEN_BUDGET
+)
+
+logger = logging.getLogger(__name__)
+
+# 모델 티어 (환경변수로 교체 가능)
+FAST_CLAUDE_MODEL = os.getenv("FAST_CLAUDE_MODEL", "claude-3-5-haiku-20241022")
+STRONG_CLAUDE_MODEL = os.getenv("STRONG_CLAUDE_MODEL", "claude-sonnet-4-20250514")
+FAST_OPENAI_MODEL = os.getenv("FAST_OPENAI_MODEL", "gpt-4o-mini")
+STRONG_OPENAI_MODEL = os.getenv("STRONG_OPENAI_MODEL", "gpt-4o")
+
+# 관측치가 없을 때 사용할 기본 지연시간 (ms): (p50, p95)
+DEFAULT_LATENCY_MS = {
+    FAST_CLAUDE_MODEL: (1500, 3500),
+    STRONG_CLAUDE_MODEL: (4000, 9000),
+    FAST_OPENAI_MODEL: (2000, 5000),
+    STRONG_OPENAI_MODEL: (5000, 12000),
+}
+
+MODEL_PROVIDERS = {
+    FAST_CLAUDE_MODEL: "anthropic",
+    STRONG_CLAUDE_MODEL: "anthropic",
+    FAST_OPENAI_MODEL: "openai",
+    STRONG_OPENAI_MODEL: "openai",
+}
+
+# 작업별 설정: 단계별 후보 모델(선호 순), 기본 max_tokens, 기본 전사 토큰 예산
+# default_model: 지연 예산 헤더가 없을 때 쓸 모델 (없으면 단계별 첫 후보)
+TASK_PROFILES = {
+    "questions": {
+        "candidates": {
+            "introduction": [FAST_CLAUDE_MODEL, STRONG_CLAUDE_MODEL],
+            "deep_dive": [STRONG_CLAUDE_MODEL, FAST_CLAUDE_MODEL],
+            "closing": [STRONG_CLAUDE_MODEL, FAST_CLAUDE_MODEL],
+        },
+        "max_tokens": 1024,
+        "transcript_tokens": QUESTION_TOKEN_BUDGET,
+    },
+    "personalized_questions": {
+        "candidates": {
+            "introduction": [FAST_OPENAI_MODEL],
+            "deep_dive": [FAST_OPENAI_MODEL],
+            "closing": [FAST_OPENAI_MODEL],
+        },
+        "max_tokens": 1500,
+        "transcript_tokens": QUESTION_TOKEN_BUDGET,
+    },
+    "summary": {
+        "candidates": {
+            "introduction": [STRONG_OPENAI_MODEL, FAST_OPENAI_MODEL],
+            "deep_dive": [STRONG_OPENAI_MODEL, FAST_OPENAI_MODEL],
+            "closing": [STRONG_OPENAI_MODEL, FAST_OPENAI_MODEL],
+        },
+        # 강한 모델은 예산을 명시한 요청에서만 (예산 없는 요약은 기존과 같은 비용의 gpt-4o-mini)
+        "default_model": FAST_OPENAI_MODEL,
+        "max_tokens": 2000,
+        "transcript_tokens": SUMMARY_TOKEN_BUDGET,
+    },
+    # 긴 회의 계층 요약의 구간 요약 (병렬 호출이므로 빠른 모델 우선)
+    "summary_chunk": {
+        "candidates": {
+            "introduction": [FAST_OPENAI_MODEL, STRONG_OPENAI_MODEL],
+            "deep_dive": [FAST_OPENAI_MODEL, STRONG_OPENAI_MODEL],
+            "closing": [FAST_OPENAI_MODEL, STRONG_OPENAI_MODEL],
+        },
+        "max_tokens": 600,
+        "transcript_tokens": SUMMARY_CHUNK_TOKEN_BUDGET,
+    },
+}
+
+LATENCY_WINDOW = 200          # 모델별 보관할 최근 지연시간 개수
+MIN_SAMPLES = 5               # 관측치 분위수를 쓰기 위한 최소 샘플 수
+MIN_MAX_TOKENS = 400
+MIN_TRANSCRIPT_TOKENS = 800
+
+_latencies: Dict[str, deque] = {}
+_decisions: deque = deque(maxlen=100)
+
+
+def record_latency(model: str, seconds: float):
+    """모델 호출 지연시간 기록"""
+    _latencies.setdefault(model, deque(maxlen=LATENCY_WINDOW)).append(seconds * 1000)
+
+
+def get_latency_percentiles(model: str) -> Dict[str, float]:
+    """모델의 p50/p95 지연시간 (ms), 샘플이 부족하면 기본값"""
+    samples = _latencies.get(model)
+    if not samples or len(samples) < MIN_SAMPLES:
+        p50, p95 = DEFAULT_LATENCY_MS.get(model, (4000, 9000))
+        return {"p50": p50, "p95": p95, "samples": len(samples or [])}
+
+    ordered = sorted(samples)
+    return {
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "samples": len(ordered),
+    }
+
+
+def budget_from_headers(
+    latency_budget_ms: Optional[str] = None,
+    deadline: Optional[str] = None
+) -> Optional[float]:
+    """
+    요청 헤더에서 지연 예산(ms) 계산
+
+    Args:
+        latency_budget_ms: X-Latency-Budget-Ms (남은 시간, ms)
+        deadline: X-Request-Deadline (Unix epoch ms)
+
+    Returns:
+        남은 예산 (ms) 또는 None (제한 없음)
+    """
+    budgets = []
+    try:
+        if latency_budget_ms:
+            budgets.append(float(latency_budget_ms))
+        if deadline:
+            budgets.append(float(deadline) - time.time() * 1000)
+    except ValueError:
+        logger.warning(f"Invalid latency budget headers: {latency_budget_ms!r}, {deadline!r}")
+
+    return max(0.0, min(budgets)) if budgets else None
+
+
+def route(
+    task: str,
+    stage: Optional[str] = None,
+    budget_ms: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    작업에 사용할 모델과 토큰 설정 선택
+
+    Args:
+        task: questions | personalized_questions | summary | summary_chunk
+        stage: get_conversation_stage 결과 (introduction, deep_dive, closing)
+        budget_ms: 지연 예산 (ms), None이면 제한 없음
+
+    Returns:
+        dict: {
+            "model", "provider", "max_tokens", "transcript_tokens",
+            "task", "stage", "budget_ms", "deadline", "reason"
+        }
+        deadline은 time.monotonic() 기준 (예산이 없으면 None)
+    """
+    profile = TASK_PROFILES[task]
+    stage = stage if stage in profile["candidates"] else "deep_dive"
+    candidates: List[str] = profile["candidates"][stage]
+    max_tokens = profile["max_tokens"]
+    transcript_tokens = profile["transcript_tokens"]
+
+    if budget_ms is None:
+        model = profile.get("default_model", candidates[0])
+        reason = f"no budget, default model ({stage})" if "default_model" in profile \
+            else f"no budget, stage preference ({stage})"
+    else:
+        model = None
+        for candidate in candidates:
+            if get_latency_percentiles(candidate)["p95"] <= budget_ms:
+                model = candidate
+                reason = f"p95 fits budget ({stage})"
+                break
+
+        if model is None:
+            # 예산 내 모델이 없으면 가장 빠른 모델 + 출력/입력 축소
+            model = min(candidates, key=lambda m: get_latency_percentiles(m)["p50"])
+            p50 = get_latency_percentiles(model)["p50"]
+            scale = max(0.3, min(1.0, budget_ms / p50)) if p50 else 1.0
+            max_tokens = max(MIN_MAX_TOKENS, int(max_tokens * scale))
+            transcript_tokens = max(MIN_TRANSCRIPT_TOKENS, int(transcript_tokens * scale))
+            reason = f"over budget, fastest model scaled x{scale:.2f}"
+
+    decision = {
+        "task": task,
+        "stage": stage,
+        "budget_ms": budget_ms,
+        "deadline": time.monotonic() + budget_ms / 1000 if budget_ms is not None else None,
+        "model": model,
+        "provider": MODEL_PROVIDERS.get(model, "anthropic"),
+        "max_tokens": max_tokens,
+        "transcript_tokens": transcript_tokens,
+        "reason": reason,
+    }
+
+    _decisions.append({**decision, "timestamp": time.time()})
+    logger.info(
+        f"[route] task={task} stage={stage} budget={budget_ms} -> "
+        f"model={model} max_tokens={max_tokens} transcript_tokens={transcript_tokens} ({reason})"
+    )
+
+    return decision
+
+
+def get_routing_metrics() -> Dict[str, Any]:
+    """모델별 지연시간 분위수와 최근 라우팅 결정"""
+    return {
+        "latency": {model: get_latency_percentiles(model) for model in MODEL_PROVIDERS},
+        "recent_decisions": list(_decisions)[-20:],
+    }
@@ -0,0 +1,276 @@
+"""
+수치 사실 추출기 (Numeric Facts)
+- 한국어 숫자 표기 토크나이저 (3억 5천만원, 15만원, 20%, 25명, 18개월, 2020년)
+- 값/단위/가까운 지표 라벨/위치를 가진 구조화된 사실 생성
+- 회의별 사실 테이블: 프롬프트 맥락, 중복 질문 필터, 데이터 업데이트 제안에 LLM 없이 사용
+- 숫자 위치에서만 단위/배수를 확인하므로 텍스트 길이에 선형 (.{0,50} 형태의 역추적 없음)
+"""
+
+import re
+import bisect
+import logging
+from collections import deque
+from typing import Dict, List
+
+from app.services.pattern_engine import PatternEngine
+
+logger = logging.getLogger(__name__)
+
+# 숫자 (천 단위 콤마, 소수점) - "1,2,3" 같은 나열은 각각 따로 인식
+_NUMBER_RE = re.compile(r'\d+(?:,\d{3})*(?:\.\d+)?')
+# 숫자 바로 뒤의 한글 배수 (천만/백만/십만은 한 단위로)
+_MULTIPLIER_RE = re.compile(r'\s*(천만|백만|십만|천|백|십|만|억|조)')
+# 배수 뒤의 단위 ('개월'이 '개'보다 먼저)
+_UNIT_RE = re.compile(r'\s*(원|%|퍼센트|명|개월|달|년|개|배)')
+# 문장 경계 (라벨은 같은 문장 안에서만 연결)
+_SENTENCE_END_RE = re.compile(r'[.!?](?!\d)|\n')
+
+SMALL_MULTIPLIERS = {'십': 10, '백': 100, '천': 1000}
+LARGE_MULTIPLIERS = {'만': 10 ** 4, '억': 10 ** 8, '조': 10 ** 12}
+
+# 표기 통일
+UNIT_ALIASES = {'퍼센트': '%', '달': '개월'}
+
+# extract_answered_questions가 "답변된 정보"로 보는 단위
+ANSWER_UNITS = {'원', '%', '명', '개월', '년'}
+
+# 숫자 앞에 오는 지표 라벨 (대소문자 무시, 조사가 붙은 "MRR은"도 잡도록 \b 없이 정의)
+FACT_LABEL_PATTERNS = {
+    'MRR': r'MRR|월\s*반복\s*매출|월간\s*매출|월\s*매출|월매출',
+    'ARR': r'ARR|연간\s*반복\s*매출|연\s*매출|연매출',
+    'REVENUE': r'매출액|매출',
+    'CAC': r'CAC|고객\s*획득\s*비용|획득\s*비용',
+    'LTV': r'LTV|고객\s*생애\s*가치|생애\s*가치',
+    'ARPU': r'ARPU|객단가',
+    'CHURN': r'churn|이탈률|해지율',
+    'RETENTION': r'리텐션|잔존율|재구매율|재방문율',
+    'GROWTH': r'성장률|증가율|성장',
+    'BURN_RATE': r'burn\s*rate|번\s*레이트|월\s*지출|월\s*비용',
+    'RUNWAY': r'runway|런웨이',
+    'GMV': r'GMV|거래액',
+    'TAKE_RATE': r'take\s*rate|테이크\s*레이트|수수료율',
+    'MAU': r'MAU|월간\s*활성',
+    'DAU': r'DAU|일간\s*활성',
+    'NPS': r'NPS',
+    'CUSTOMERS': r'고객사|고객\s*수|사용자\s*수|가입자',
+    'TEAM_SIZE': r'팀원|직원|인원',
+    'FUNDING': r'투자\s*유치|투자금|라운드',
+    'VALUATION': r'밸류에이션|기업\s*가치',
+    'MARKET_SIZE': r'TAM|SAM|SOM|시장\s*규모',
+}
+
+LABEL_ENGINE = PatternEngine({"label": FACT_LABEL_PATTERNS})
+
+LABEL_WINDOW_CHARS = 30     # 라벨 끝과 숫자 사이 최대 거리
+CONTEXT_CHARS = 50          # 사실 주변 문맥 길이 (앞뒤)
+
+
+def _parse_term(text: str, match: "re.Match") -> tuple:
+    """숫자 하나와 바로 뒤 배수 → (값, 큰 배수 또는 None, 배수 여부, 끝 위치)"""
+    value = float(match.group().replace(',', ''))
+    end = match.end()
+    large = None
+    m = _MULTIPLIER_RE.match(text, end)
+    if not m:
+        return value, None, False, end
+
+    word = m.group(1)
+    if word[-1] in LARGE_MULTIPLIERS:
+        large = LARGE_MULTIPLIERS[word[-1]]
+        value *= SMALL_MULTIPLIERS.get(word[0], 1) if len(word) > 1 else 1
+        value *= large
+    else:
+        value *= SMALL_MULTIPLIERS[word]
+    return value, large, True, m.end()
+
+
+def _format_value(value: float):
+    """정수로 떨어지면 int"""
+    return int(value) if value == int(value) else round(value, 4)
+
+
+def tokenize_quantities(text: str) -> List[Dict]:
+    """
+    텍스트의 수량 표현을 한 번의 스캔으로 토큰화
+
+    "3억 5천만원"처럼 큰 배수가 이어지는 표현은 하나로 합치고,
+    "3억 5천"처럼 억/조 뒤 마지막 항에 큰 배수가 없으면 한 단계 아래 배수를 적용 (3억 5천만)
+
+    Returns:
+        [{"value": 350000000, "unit": "원" | None, "raw": "3억 5천만원",
+          "start": int, "end": int, "multiplied": bool}, ...]
+    """
+    matches = list(_NUMBER_RE.finditer(text))
+    quantities = []
+    i = 0
+    while i < len(matches):
+        start = matches[i].start()
+        value, large, _, end = _parse_term(text, matches[i])
+        multiplied = large is not None
+        i += 1
+
+        # 큰 배수 뒤에 더 작은 배수 항이 공백만 두고 이어지면 합산 ("5만 3천", "3억 5천만")
+        while large is not None and i < len(matches) and not text[end:matches[i].start()].strip():
+            term, term_large, has_multiplier, term_end = _parse_term(text, matches[i])
+            if not has_multiplier or (term_large is not None and term_large >= large):
+                break
+            if term_large is None and large >= LARGE_MULTIPLIERS['억']:
+                term *= large // LARGE_MULTIPLIERS['만']
+            value += term
+            large = term_large
+            end = term_end
+            i += 1
+
+        unit = None
+        m = _UNIT_RE.match(text, end)
+        if m:
+            unit = UNIT_ALIASES.get(m.group(1), m.group(1))
+            end = m.end()
+        elif multiplied:
+            # "50억", "3천만" 처럼 큰 배수만 있으면 금액으로 간주
+            unit = '원'
+
+        quantities.append({
+            "value": _format_value(value),
+            "unit": unit,
+            "raw": text[start:end],
+            "start": start,
+            "end": end,
+            "multiplied": multiplied,
+        })
+    return quantities
+
+
+def extract_numeric_facts(text: str, base_offset: int = 0) -> List[Dict]:
+    """
+    텍스트에서 구조화된 수치 사실 추출
+
+    단위가 없는 숫자는 바로 앞에 지표 라벨이 있을 때만 사실로 인정 (예: "NPS는 45")
+
+    Args:
+        text: 분석할 텍스트
+        base_offset: 회의 전체 기준 위치 보정값
+
+    Returns:
+        [{"label": "MRR" | None, "label_text": "MRR", "value": 30000000, "unit": "원",
+          "raw": "3천만원", "offset": int, "context": "...현재 MRR은 3천만원이고..."}, ...]
+    """
+    quantities = tokenize_quantities(text)
+    if not quantities:
+        return []
+
+    hits = LABEL_ENGINE.scan(text)
+    hit_starts = [hit[2] for hit in hits]
+    boundaries = [m.start() for m in _SENTENCE_END_RE.finditer(text)]
+
+    facts = []
+    for quantity in quantities:
+        start = quantity["start"]
+        label, label_text = _nearest_label(hits, hit_starts, boundaries, start)
+        if quantity["unit"] is None and label is None:
+            continue
+        facts.append({
+            "label": label,
+            "label_text": label_text,
+            "value": quantity["value"],
+            "unit": quantity["unit"],
+            "raw": quantity["raw"],
+            "offset": base_offset + start,
+            "context": text[max(0, start - CONTEXT_CHARS):quantity["end"] + CONTEXT_CHARS].strip(),
+        })
+    return facts
+
+
+def _nearest_label(hits: List, hit_starts: List[int], boundaries: List[int], pos: int) -> tuple:
+    """pos 앞 같은 문장 안에서 가장 가까운 라벨 → (라벨 키, 원문) 또는 (None, None)"""
+    best = None
+    i = bisect.bisect_left(hit_starts, pos) - 1
+    # 같은 위치에서 시작하는 라벨이 여러 개일 수 있으므로 근처 몇 개만 확인 ("월간 매출" / "매출")
+    while i >= 0 and pos - hits[i][2] <= LABEL_WINDOW_CHARS * 2:
+        _, key, hit_start, hit_end, matched = hits[i]
+        if hit_end <= pos and pos - hit_end <= LABEL_WINDOW_CHARS:
+            # 끝이 더 가깝거나, 끝이 같으면 더 긴(먼저 시작한) 라벨
+            if best is None or hit_end > best[2] or (hit_end == best[2] and hit_start < best[1]):
+                best = (key, hit_start, hit_end, matched)
+        i -= 1
+
+    if best is None:
+        return None, None
+
+    # 라벨과 숫자 사이에 문장 경계가 있으면 연결하지 않음
+    j = bisect.bisect_left(boundaries, best[2])
+    if j < len(boundaries) and boundaries[j] < pos:
+        return None, None
+    return best[0], best[3]
+
+
+def extract_fact_snippets(transcripts: List[str], limit: int = 10) -> List[str]:
+    """
+    금액/비율/인원/기간/연도 사실 주변 문맥 (등장 순, 중복 제거)
+
+    Args:
+        transcripts: 전사 텍스트 리스트
+        limit: 최대 개수
+    """
+    snippets = []
+    seen = set()
+    for fact in extract_numeric_facts(" ".join(transcripts)):
+        if fact["unit"] not in ANSWER_UNITS or fact["context"] in seen:
+            continue
+        seen.add(fact["context"])
+        snippets.append(fact["context"])
+        if len(snippets) >= limit:
+            break
+    return snippets
+
+
+# ============ 회의별 사실 테이블 ============
+
+MAX_FACTS_PER_MEETING = 500
+MAX_HISTORY_PER_LABEL = 20
+
+
+class FactTable:
+    """
+    회의별 수치 사실 테이블
+
+    새 전사 청크만 추출해 누적하고, 라벨별 최신 값과 이력을 유지
+    """
+
+    def __init__(self):
+        self.facts: deque = deque(maxlen=MAX_FACTS_PER_MEETING)
+        self.by_label: Dict[str, deque] = {}
+        self.length = 0  # 지금까지 반영한 텍스트 길이 (offset 기준)
+        self.version = 0  # 사실이 추가될 때마다 증가 (캐시 무효화용)
+
+    def ingest(self, text: str) -> List[Dict]:
+        """새 전사 청크의 사실 추가 (추가된 사실 반환)"""
+        facts = extract_numeric_facts(text, self.length)
+        self.length += len(text) + 1  # " ".join 기준 위치
+        if facts:
+            self.version += 1
+        for fact in facts:
+            self.facts.append(fact)
+            if fact["label"]:
+                history = self.by_label.get(fact["label"])
+                if history is None:
+                    history = self.by_label[fact["label"]] = deque(maxlen=MAX_HISTORY_PER_LABEL)
+                history.append(fact)
+        return facts
+
+    def latest(self) -> Dict[str, Dict]:
+        """라벨별 가장 최근 사실"""
+        return {label: history[-1] for label, history in self.by_label.items()}
+
+    def history(self, label: str) -> List[Dict]:
+        """라벨의 사실 이력 (등장 순)"""
+        return list(self.by_label.get(label, ()))
+
+    def render(self, limit: int = 10) -> str:
+        """프롬프트용 요약 ("MRR 3천만원, CAC 15만원")"""
+        latest = sorted(self.latest().values(), key=lambda f: f["offset"], reverse=True)[:limit]
+        return ", ".join(f"{fact['label']} {fact['raw']}" for fact in latest)
+
+    def __len__(self) -> int:
+        return len(self.facts)
+
@@ -0,0 +1,217 @@
+"""
+패턴 엔진 (Pattern Engine)
+- 여러 정규식 패턴 테이블(지표/토픽/화자 역할)을 텍스트 한 번의 스캔으로 매칭
+- 각 패턴의 리터럴 접두어(예: "MRR", "고객", "저희")를 모은 단일 정규식으로 후보 위치를 찾고,
+  후보 위치에서만 해당 패턴을 확인
+- 리터럴 접두어가 없는 패턴(예: \\d+%)만 별도 스캔
+- 대소문자 무시: 텍스트를 한 번 소문자화하고 패턴 리터럴도 소문자로 컴파일 (IGNORECASE 비용 제거)
+- 패턴별 결과는 re.finditer(pattern, text, re.IGNORECASE)와 동일 (비중첩, 위치 순)
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 매칭 결과: (테이블 이름, 패턴 키, 시작, 끝, 원문 매칭 문자열)
+PatternHit = Tuple[str, object, int, int, str]
+
+_METACHARS = set(".^$*+?{}[]()|\\")
+_OPTIONAL_QUANTIFIERS = set("*?{")
+
+
+def _lower_pattern(pattern: str) -> str:
+    """이스케이프 시퀀스(\\S, \\B 등)는 그대로 두고 리터럴만 소문자화"""
+    chars = []
+    escaped = False
+    for ch in pattern:
+        chars.append(ch if escaped else ch.lower())
+        escaped = ch == "\\" and not escaped
+    return "".join(chars)
+
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """최상위 '|' 기준으로 분리 (괄호, 문자 클래스, 이스케이프 안의 '|'는 무시)"""
+    parts = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            # 문자 클래스 끝까지 건너뜀 ([]...], [^]...] 형태의 첫 ']'는 리터럴)
+            i += 1
+            if i < len(pattern) and pattern[i] == "^":
+                i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+
+def _leading_literal(alternative: str) -> str:
+    """대안이 반드시 시작하는 리터럴 문자열 (없으면 빈 문자열)"""
+    i = 0
+    # 단어 경계는 폭이 없으므로 건너뜀
+    while alternative.startswith("\\b", i):
+        i += 2
+
+    chars = []
+    while i < len(alternative):
+        ch = alternative[i]
+        if ch in _METACHARS:
+            # 'a?', 'a*', 'a{0,2}'처럼 직전 문자가 선택적일 수 있으면 제외
+            if ch in _OPTIONAL_QUANTIFIERS and chars:
+                chars.pop()
+            break
+        chars.append(ch)
+        i += 1
+    return "".join(chars)
+
+
+def literal_prefixes(pattern: str) -> Optional[List[str]]:
+    """
+    패턴의 모든 매칭이 시작해야 하는 리터럴 접두어 목록
+
+    Returns:
+        접두어 리스트, 접두어를 정할 수 없는 대안이 있으면 None
+    """
+    prefixes = []
+    for alternative in _split_alternatives(pattern):
+        prefix = _leading_literal(alternative)
+        if not prefix:
+            return None
+        prefixes.append(prefix)
+    return prefixes
+
+
+class PatternEngine:
+    """
+    여러 패턴 테이블을 한 번에 스캔하는 매처 (대소문자 무시)
+
+    Args:
+        tables: {테이블 이름: {패턴 키: 정규식}} (리스트 테이블은 dict(enumerate(...)) 로 전달)
+    """
+
+    def __init__(self, tables: Dict[str, Dict[object, str]]):
+        self.entries: List[Tuple[str, object]] = []
+        self._lowered: List[re.Pattern] = []
+        self._fallback: List[re.Pattern] = []
+        self._unanchored: List[int] = []
+        anchors: Dict[str, List[int]] = {}
+
+        for table, patterns in tables.items():
+            for key, pattern in patterns.items():
+                index = len(self.entries)
+                self.entries.append((table, key))
+                lowered = _lower_pattern(pattern)
+                self._lowered.append(re.compile(lowered))
+                self._fallback.append(re.compile(pattern, re.IGNORECASE))
+
+                prefixes = literal_prefixes(lowered)
+                if prefixes is None:
+                    self._unanchored.append(index)
+                    continue
+                # '월'이 있으면 '월간'은 중복이므로 가장 짧은 접두어만 사용
+                for prefix in set(prefixes):
+                    if any(other != prefix and prefix.startswith(other) for other in prefixes):
+                        continue
+                    anchors.setdefault(prefix, []).append(index)
+
+        # 첫 글자별 접두어 목록 (긴 접두어 우선)
+        self._anchors_by_char: Dict[str, List[Tuple[str, List[int]]]] = {}
+        for prefix in sorted(anchors, key=len, reverse=True):
+            self._anchors_by_char.setdefault(prefix[0], []).append((prefix, anchors[prefix]))
+
+        # 후보 위치 탐색: 첫 글자만 소비하고 나머지는 전방탐색으로 확인
+        # (모든 분기가 리터럴로 시작하므로 정규식 엔진이 첫 글자 집합으로 빠르게 건너뜀,
+        #  한 글자만 소비하므로 겹치는 접두어 위치도 빠짐없이 방문)
+        branches = []
+        for prefix in sorted(anchors, key=len, reverse=True):
+            rest = f"(?={re.escape(prefix[1:])})" if len(prefix) > 1 else ""
+            branches.append(re.escape(prefix[0]) + rest)
+        self._anchor_re = re.compile("|".join(branches)) if branches else None
+
+        logger.info(
+            f"PatternEngine compiled {len(self.entries)} patterns "
+            f"({len(anchors)} literal anchors, {len(self._unanchored)} unanchored)"
+        )
+
+    def scan(self, text: str, first_only: bool = False) -> List[PatternHit]:
+        """
+        텍스트를 한 번 스캔해 모든 테이블의 매칭 반환
+
+        Args:
+            text: 분석할 텍스트
+            first_only: 패턴별 첫 매칭만 반환 (re.search 용도)
+
+        Returns:
+            [(table, key, start, end, matched_text), ...] (시작 위치 순)
+        """
+        if not text:
+            return []
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 소문자화로 길이가 바뀌는 문자(예: 'İ')가 있으면 위치가 어긋나므로 패턴별 스캔
+            return self._scan_fallback(text, first_only)
+
+        found: List[Tuple[int, int, int]] = []  # (start, index, end)
+        next_pos = [0] * len(self.entries)
+        done = len(text) + 1
+
+        if self._anchor_re is not None:
+            anchors_by_char = self._anchors_by_char
+            compiled = self._lowered
+            for match in self._anchor_re.finditer(lowered):
+                pos = match.start()
+                for prefix, ids in anchors_by_char[lowered[pos]]:
+                    if not lowered.startswith(prefix, pos):
+                        continue
+                    for index in ids:
+                        if pos < next_pos[index]:
+                            continue
+                        m = compiled[index].match(lowered, pos)
+                        if m:
+                            found.append((pos, index, m.end()))
+                            next_pos[index] = done if first_only else max(m.end(), pos + 1)
+
+        for index in self._unanchored:
+            pattern = self._lowered[index]
+            if first_only:
+                m = pattern.search(lowered)
+                if m:
+                    found.append((m.start(), index, m.end()))
+            else:
+                found.extend((m.start(), index, m.end()) for m in pattern.finditer(lowered))
+
+        found.sort()
+        return [(*self.entries[index], start, end, text[start:end]) for start, index, end in found]
+
+    def _scan_fallback(self, text: str, first_only: bool) -> List[PatternHit]:
+        """패턴별 IGNORECASE 스캔 (scan과 같은 결과 형식)"""
+        found = []
+        for index, pattern in enumerate(self._fallback):
+            if first_only:
+                m = pattern.search(text)
+                matches = [m] if m else []
+            else:
+                matches = pattern.finditer(text)
+            found.extend((m.start(), index, m.end()) for m in matches)
+
+        found.sort()
+        return [(*self.entries[index], start, end, text[start:end]) for start, index, end in found]
@@ -1,14 +1,47 @@
 """
 Phase 3: 개인화된 질문 생성기
 레벨과 페르소나에 따라 다른 스타일의 질문 생성
+
+- 단일 엔진: 프롬프트 조립 → 제공자 호출 → JSON 파싱/검증 → 선호도 반영이 하나의 경로
+- 제공자(OpenAI / Anthropic)는 PROVIDERS에 등록된 호출 함수로 교체 가능
+- 같은 프롬프트의 반복 요청은 응답 캐시에서 반환 (제공자와 무관하게 공유)
+- 페르소나 비교용 다중 세트는 전사/맥락을 한 번만 넣은 단일 호출로 생성 후 세트별로 분리
+- 프롬프트는 미리 파싱한 템플릿 + 캐시된 블록(페르소나/레벨/선호도/관계)으로 조립 (prompt_assembly)
 """
+from typing import List, Dict, Any, Optional, Awaitable, Callable
 import os
-from typing import List, Dict, Any, Optional
-from openai import AsyncOpenAI
+import copy
 import json
-
-# OpenAI 클라이언트
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+import hashlib
+import logging
+from app.services.json_parser import (
+    MULTI_PERSONA_QUESTIONS_SCHEMA,
+    PERSONALIZED_QUESTIONS_SCHEMA,
+    parse_llm_json,
+    record_structured_output,
+)
+from app.services.llm_gateway import anthropic_messages, openai_chat
+from app.services.model_router import FAST_CLAUDE_MODEL, FAST_OPENAI_MODEL, route
+from app.services.prompt_assembly import FragmentCache, PromptTemplate, assembly_timer
+from app.services.question_memory import format_suggested_section, get_question_memory
+from app.services.session_store import SessionStore
+from app.services.transcript_window import fit_transcript
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시 (같은 제공자/모델/프롬프트 → 같은 결과)
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("PERSONALIZED_CACHE_TTL_SECONDS", "120"))
+
+# 다중 페르소나 생성: 한 번에 요청할 수 있는 세트 수, 세트당 추가 출력 토큰, 출력 토큰 상한
+MAX_PERSONA_VARIANTS = 8
+TOKENS_PER_VARIANT = 600
+MAX_MULTI_PERSONA_TOKENS = 4000
+
+# 제공자를 지정했을 때 사용할 모델 (라우터 결정과 제공자가 다를 때)
+PROVIDER_MODELS = {
+    "openai": FAST_OPENAI_MODEL,
+    "anthropic": FAST_CLAUDE_MODEL,
+}
 
 # 페르소나별 스타일 정의
 PERSONA_STYLES = {
@@ -17,28 +50,32 @@ PERSONA_STYLES = {
         "description": "숫자와 데이터 중심의 질문",
         "focus": ["지표", "숫자", "벤치마크", "논리적 검증"],
         "tone": "직접적이고 분석적인",
-        "example": "MRR 성장률이 5%라고 하셨는데, 이는 MoM인가요 YoY인가요? 정확한 계산 방식을 확인해주세요."
+        "example": "MRR 성장률이 5%라고 하셨는데, 이는 MoM인가요 YoY인가요? 정확한 계산 방식을 확인해주세요.",
+        "guidelines": ["데이터와 지표 기반의 질문을 우선", "객관적이고 측정 가능한 정보 요청", "비교 분석과 벤치마크 관련 질문 포함"]
     },
     "BUDDY": {
         "name": "동료",
         "description": "협력적이고 공감 중심의 질문",
         "focus": ["팀", "관계", "어려움", "지원"],
         "tone": "따뜻하고 협력적인",
-        "example": "월 5% 성장 축하드립니다! 팀이 가장 어려워하는 부분은 무엇인가요?"
+        "example": "월 5% 성장 축하드립니다! 팀이 가장 어려워하는 부분은 무엇인가요?",
+        "guidelines": ["협력적이고 건설적인 톤의 질문", "어떻게 도와줄 수 있는지 관점의 질문", "팀과 문화에 대한 이해를 높이는 질문"]
     },
     "GUARDIAN": {
         "name": "수호자",
         "description": "리스크 관리 중심의 질문",
         "focus": ["리스크", "검증", "지속가능성", "방어"],
         "tone": "신중하고 보수적인",
-        "example": "5% 성장의 지속 가능성을 검증해야 합니다. Churn Rate와 비교했을 때 Net Growth는 얼마인가요?"
+        "example": "5% 성장의 지속 가능성을 검증해야 합니다. Churn Rate와 비교했을 때 Net Growth는 얼마인가요?",
+        "guidelines": ["리스크와 잠재적 문제에 집중", "대응 계획과 보호 장치 확인", "최악의 시나리오와 대비책 질문"]
     },
     "VISIONARY": {
         "name": "비전가",
         "description": "기회와 미래 중심의 질문",
         "focus": ["성장", "기회", "혁신", "확장"],
         "tone": "긍정적이고 미래지향적인",
-        "example": "5% 성장을 10%로 끌어올릴 수 있는 가장 큰 기회는 무엇이라고 보시나요?"
+        "example": "5% 성장을 10%로 끌어올릴 수 있는 가장 큰 기회는 무엇이라고 보시나요?",
+        "guidelines": ["큰 비전과 장기적 가능성에 집중", "혁신적 기회와 성장 잠재력 질문", "업계 변화와 트렌드에 대한 시각 확인"]
     }
 }
 
@@ -47,48 +84,63 @@ LEVEL_FEATURES = {
     1: {
         "name": "기본",
         "description": "범용 질문",
-        "capabilities": ["기본 질문 생성"]
+        "capabilities": ["기본 질문 생성"],
+        "guidelines": ["기본적이고 이해하기 쉬운 질문", "핵심 지표와 기본 정보 위주", "전문 용어 최소화"]
     },
     2: {
         "name": "나를 아는",
         "description": "과거 맥락 활용",
-        "capabilities": ["과거 회의 맥락 로드", "사용자 스타일 반영"]
+        "capabilities": ["과거 회의 맥락 로드", "사용자 스타일 반영"],
+        "guidelines": ["조금 더 상세한 질문 가능", "기본 지표 외 추가 분석 질문", "일부 전문 용어 사용"]
     },
     3: {
         "name": "깊이 있는",
         "description": "벤치마크 비교",
-        "capabilities": ["벤치마크 비교", "리스크 감지", "심화 질문"]
+        "capabilities": ["벤치마크 비교", "리스크 감지", "심화 질문"],
+        "guidelines": ["심화된 분석 질문 포함", "벤치마크와 비교 분석 질문", "업계 전문 용어 활용"]
     },
     4: {
         "name": "전문가",
         "description": "예측적 질문",
-        "capabilities": ["예측적 질문", "패턴 분석", "자기 개선 코칭"]
+        "capabilities": ["예측적 질문", "패턴 분석", "자기 개선 코칭"],
+        "guidelines": ["고급 전략적 질문 포함", "예측과 시나리오 분석 질문", "전문가 수준의 통찰 요청"]
     },
     5: {
         "name": "마스터",
         "description": "완전 개인화",
-        "capabilities": ["커스텀 템플릿", "팀 지식 공유", "AI 튜닝"]
+        "capabilities": ["커스텀 템플릿", "팀 지식 공유", "AI 튜닝"],
+        "guidelines": ["최고 수준의 복합적 질문", "다차원적 분석과 예측 질문", "업계 최고 수준의 통찰 요청"]
     }
 }
 
+# 도메인 한글 이름
+DOMAIN_LABELS = {
+    "INVESTMENT_SCREENING": "투자 심사",
+    "MENTORING": "멘토링",
+    "SALES": "세일즈",
+    "PRODUCT_REVIEW": "제품 리뷰",
+    "TEAM_MEETING": "팀 미팅",
+    "USER_INTERVIEW": "사용자 인터뷰",
+    "GENERAL": "일반",
+}
+
 # 기본 프롬프트 템플릿
 PERSONALIZED_PROMPT = """당신은 {persona_name} 스타일의 AI 질문 생성기입니다.
 
-## 당신의 스타일:
-- 설명: {persona_description}
-- 초점: {persona_focus}
-- 톤: {persona_tone}
-- 예시: {persona_example}
+{persona_block}
 
-## 사용자 레벨: {level} ({level_name})
-{level_description}
-{level_capabilities}
+{level_block}
+
+## 도메인: {domain}
+
+## 해금된 기능:
+{features}
 
 ## 사용자 선호도:
 {preferences}
 
 ## 현재 대화:
-{transcript}
+{transcript}{suggested_questions}
 
 {relationship_context}
 
@@ -115,11 +167,302 @@ PERSONALIZED_PROMPT = """당신은 {persona_name} 스타일의 AI 질문 생성
 
 질문은 3-5개 생성하세요. JSON만 출력하세요."""
 
+# 다중 페르소나 프롬프트 (전사/맥락은 한 번만, 세트별로 스타일/레벨 블록만 추가)
+MULTI_PERSONA_PROMPT = """당신은 여러 스타일의 질문 세트를 한 번에 만드는 AI 질문 생성기입니다.
+같은 대화에 대해 아래 {count}개 세트의 질문을 각각 생성하세요.
+
+## 도메인: {domain}
+
+## 해금된 기능:
+{features}
+
+## 사용자 선호도:
+{preferences}
+
+## 현재 대화:
+{transcript}
+
+{relationship_context}
+
+## 생성할 세트:
+{variant_blocks}
+
+## 질문 생성 지침:
+1. 각 세트는 해당 스타일과 레벨에 맞게 독립적으로 생성하세요
+2. 세트끼리 같은 질문을 반복하지 말고 스타일의 차이가 드러나게 하세요
+3. 선호도가 높은 카테고리를 우선적으로 다루세요
+4. 각 질문에 우선순위와 카테고리를 부여하세요 (insight는 레벨 3+ 세트에만)
+
+## 출력 형식 (JSON):
+{{
+    "sets": [
+        {{
+            "persona": "ANALYST|BUDDY|GUARDIAN|VISIONARY",
+            "level": 1-5,
+            "questions": [
+                {{
+                    "text": "질문 내용",
+                    "category": "BUSINESS_MODEL|TRACTION|TEAM|MARKET|TECHNOLOGY|FINANCIALS|RISKS",
+                    "priority": 1-10,
+                    "reasoning": "왜 이 질문이 중요한지",
+                    "insight": "관련 인사이트 (레벨 3+ 전용)"
+                }}
+            ]
+        }}
+    ],
+    "stage": "대화 단계",
+    "analysis": "대화 분석 요약"
+}}
+
+세트는 위 순서대로 {count}개, 세트마다 질문 3-5개를 생성하세요. JSON만 출력하세요."""
+
+
+_response_cache = SessionStore(
+    dict, ttl_seconds=RESPONSE_CACHE_TTL_SECONDS, max_sessions=500, name="personalized response"
+)
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+PERSONALIZED_TEMPLATE = PromptTemplate("personalized_questions", PERSONALIZED_PROMPT)
+MULTI_PERSONA_TEMPLATE = PromptTemplate("multi_persona_questions", MULTI_PERSONA_PROMPT)
+
+
+def _format_persona_block(persona: str) -> str:
+    """페르소나 스타일 블록"""
+    info = PERSONA_STYLES[persona]
+    return "\n".join([
+        "## 당신의 스타일:",
+        f"- 설명: {info['description']}",
+        f"- 초점: {', '.join(info['focus'])}",
+        f"- 톤: {info['tone']}",
+        f"- 예시: {info['example']}",
+        "- 질문 방향:",
+    ] + [f"  - {line}" for line in info["guidelines"]])
+
+
+def _format_level_block(level: int) -> str:
+    """레벨 블록 (알 수 없는 레벨은 레벨 1 내용)"""
+    info = LEVEL_FEATURES.get(level, LEVEL_FEATURES[1])
+    return "\n".join([
+        f"## 사용자 레벨: {level} ({info['name']})",
+        info["description"],
+        "- 가능 기능: " + ", ".join(info["capabilities"]),
+        "- 질문 복잡도:",
+    ] + [f"  - {line}" for line in info["guidelines"]])
+
+
+# 페르소나/레벨 블록은 모듈 로드 시 전부 조립
+PERSONA_BLOCKS = {persona: _format_persona_block(persona) for persona in PERSONA_STYLES}
+LEVEL_BLOCKS = {level: _format_level_block(level) for level in LEVEL_FEATURES}
+
+
+def render_persona_block(persona: str) -> str:
+    """페르소나 스타일 블록 (알 수 없는 페르소나는 ANALYST)"""
+    return PERSONA_BLOCKS.get(persona, PERSONA_BLOCKS["ANALYST"])
+
+
+def render_level_block(level: int) -> str:
+    """레벨 블록 (미리 조립된 블록, 알 수 없는 레벨만 그때 조립)"""
+    block = LEVEL_BLOCKS.get(level)
+    return block if block is not None else _format_level_block(level)
+
+
+def render_features(features: List[str]) -> str:
+    """해금된 기능 목록"""
+    return "- " + "\n- ".join(features) if features else "기본 기능만 해금됨"
+
+
+def _personalized_fields(
+    relationship: Optional[Dict[str, Any]],
+    personalization: Optional[Dict[str, Any]]
+) -> Dict[str, str]:
+    """개인화 프롬프트의 전사 외 필드"""
+    personalization = personalization or {}
+    level = personalization.get("level", 1)
+    persona = personalization.get("persona", "ANALYST")
+    persona_info = PERSONA_STYLES.get(persona, PERSONA_STYLES["ANALYST"])
+    return {
+        "persona_name": persona_info["name"],
+        "persona_block": render_persona_block(persona),
+        "level_block": render_level_block(level),
+        "domain": DOMAIN_LABELS.get(personalization.get("domain", "GENERAL"), "일반"),
+        "features": render_features(personalization.get("features") or []),
+        "preferences": _preference_blocks.get(personalization.get("preferences") or {}),
+        "relationship_context": _relationship_blocks.get(relationship) if relationship else "",
+    }
+
+
+def build_personalized_prompt(
+    transcript: str,
+    relationship: Optional[Dict[str, Any]],
+    personalization: Optional[Dict[str, Any]],
+    suggested_questions: str = ""
+) -> str:
+    """개인화 질문 프롬프트 조립 (제공자와 무관하게 같은 프롬프트)"""
+    with assembly_timer(PERSONALIZED_TEMPLATE.name):
+        return PERSONALIZED_TEMPLATE.render(
+            **_personalized_fields(relationship, personalization),
+            transcript=transcript,
+            suggested_questions=suggested_questions
+        )
+
+
+def bind_personalized_template(
+    relationship: Optional[Dict[str, Any]],
+    personalization: Optional[Dict[str, Any]]
+) -> PromptTemplate:
+    """관계/개인화 블록을 미리 채운 템플릿 (전사만 남음, 미팅 시작 준비용)"""
+    return PERSONALIZED_TEMPLATE.bind(**_personalized_fields(relationship, personalization))
+
+
+def build_multi_persona_prompt(
+    transcript: str,
+    relationship: Optional[Dict[str, Any]],
+    personalization: Optional[Dict[str, Any]],
+    variants: List[Dict[str, Any]]
+) -> str:
+    """다중 페르소나 프롬프트 조립 (공통 맥락 + 세트별 스타일/레벨 블록)"""
+    personalization = personalization or {}
+
+    with assembly_timer(MULTI_PERSONA_TEMPLATE.name):
+        blocks = []
+        for i, variant in enumerate(variants, 1):
+            persona_info = PERSONA_STYLES[variant["persona"]]
+            blocks.append("\n".join([
+                f"### 세트 {i}: {persona_info['name']} ({variant['persona']}) / 레벨 {variant['level']}",
+                render_persona_block(variant["persona"]),
+                render_level_block(variant["level"]),
+            ]))
+
+        return MULTI_PERSONA_TEMPLATE.render(
+            count=len(variants),
+            domain=DOMAIN_LABELS.get(personalization.get("domain", "GENERAL"), "일반"),
+            features=render_features(personalization.get("features") or []),
+            preferences=_preference_blocks.get(personalization.get("preferences") or {}),
+            transcript=transcript,
+            relationship_context=_relationship_blocks.get(relationship) if relationship else "",
+            variant_blocks="\n\n".join(blocks),
+        )
+
+
+async def _call_openai(prompt: str, decision: Dict[str, Any], schema: dict, name: str) -> Optional[Dict[str, Any]]:
+    """OpenAI 제공자 (json_schema 구조화 출력)"""
+    response = await openai_chat(
+        model=decision["model"],
+        messages=[
+            {"role": "system", "content": "You are a personalized question generation AI. Always respond in valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.7,
+        max_tokens=decision["max_tokens"],
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": name,
+                "schema": schema,
+            },
+        },
+        deadline=decision["deadline"],
+    )
+    content = response.choices[0].message.content or ""
+    return parse_llm_json(content, schema, f"openai_{name}")
+
+
+async def _call_anthropic(prompt: str, decision: Dict[str, Any], schema: dict, name: str) -> Optional[Dict[str, Any]]:
+    """Anthropic 제공자 (tool use로 스키마에 맞는 출력 강제, 텍스트 JSON 폴백)"""
+    tool = {
+        "name": f"submit_{name}",
+        "description": "생성한 질문 목록을 제출합니다.",
+        "input_schema": schema,
+    }
+    message = await anthropic_messages(
+        model=decision["model"],
+        max_tokens=decision["max_tokens"],
+        temperature=0.7,
+        tools=[tool],
+        tool_choice={"type": "tool", "name": tool["name"]},
+        messages=[{"role": "user", "content": prompt}],
+        deadline=decision["deadline"],
+    )
+
+    text_parts = []
+    for block in message.content:
+        if block.type == "tool_use":
+            payload = record_structured_output(f"claude_{name}", block.input, schema)
+            if payload is not None:
+                return payload
+        elif block.type == "text":
+            text_parts.append(block.text)
+    return parse_llm_json("".join(text_parts), schema, f"claude_{name}")
+
+
+# 제공자 이름 → 호출 함수 (프롬프트, 라우팅 결정, 스키마, 출력 이름) → 검증된 dict 또는 None
+PROVIDERS: Dict[str, Callable[[str, Dict[str, Any], dict, str], Awaitable[Optional[Dict[str, Any]]]]] = {
+    "openai": _call_openai,
+    "anthropic": _call_anthropic,
+}
+
+
+async def request_personalized(
+    prompt: str,
+    decision: Dict[str, Any],
+    schema: dict = PERSONALIZED_QUESTIONS_SCHEMA,
+    name: str = "personalized_questions"
+) -> Optional[Dict[str, Any]]:
+    """제공자 호출 (응답 캐시 경유, 캐시된 결과는 복사본 반환)"""
+    key = hashlib.sha256(
+        f"{decision['provider']}\n{decision['model']}\n{decision['max_tokens']}\n{name}\n{prompt}".encode("utf-8")
+    ).hexdigest()
+    cached = _response_cache.get(key)
+    if cached is not None:
+        _cache_stats["hits"] += 1
+        return copy.deepcopy(cached)
+
+    _cache_stats["misses"] += 1
+    result = await PROVIDERS[decision["provider"]](prompt, decision, schema, name)
+    if result is not None:
+        _response_cache.set(key, copy.deepcopy(result))
+    return result
+
+
+def _route_personalized(budget_ms: Optional[float], provider: Optional[str]) -> Dict[str, Any]:
+    """라우팅 결정 (제공자를 지정하면 해당 제공자의 모델로 교체)"""
+    decision = route("personalized_questions", None, budget_ms)
+    if provider and provider != decision["provider"]:
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unknown provider: {provider}")
+        decision = {**decision, "provider": provider, "model": PROVIDER_MODELS[provider]}
+    return decision
+
+
+def finalize_questions(
+    questions: List[Dict[str, Any]],
+    preferences: Dict[str, Any],
+    level: int
+) -> List[Dict[str, Any]]:
+    """선호도 기반 우선순위 조정 + 레벨별 인사이트 포함 여부"""
+    adjusted_questions = adjust_priorities_by_preferences(questions, preferences)
+
+    if level >= 3:
+        # 레벨 3+: 인사이트 포함
+        for q in adjusted_questions:
+            if not q.get("insight"):
+                q["insight"] = None
+    else:
+        # 레벨 1-2: 인사이트 제거
+        for q in adjusted_questions:
+            q.pop("insight", None)
+    return adjusted_questions
+
 
 async def generate_personalized_questions(
     transcript: str,
     relationship: Optional[Dict[str, Any]] = None,
-    personalization: Optional[Dict[str, Any]] = None
+    personalization: Optional[Dict[str, Any]] = None,
+    budget_ms: Optional[float] = None,
+    provider: Optional[str] = None,
+    template: Optional[PromptTemplate] = None,
+    meeting_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     개인화된 질문 생성
@@ -127,7 +470,11 @@ async def generate_personalized_questions(
     Args:
         transcript: 현재 대화 전사
         relationship: 관계 객체 정보
-        personalization: 개인화 정보 (레벨, 페르소나, 선호도)
+        personalization: 개인화 정보 (레벨, 페르소나, 도메인, 해금 기능, 선호도)
+        budget_ms: 지연 예산 (ms), 모델/토큰 선택에 사용
+        provider: openai | anthropic (None이면 라우터 결정)
+        template: bind_personalized_template 결과 (미팅 시작 시 준비, 있으면 블록 조립 생략)
+        meeting_id: 회의 ID (있으면 이미 제안한 질문을 프롬프트에 알리고 비슷한 질문 제외)
 
     Returns:
         생성된 질문들
@@ -136,89 +483,197 @@ async def generate_personalized_questions(
     level = personalization.get("level", 1) if personalization else 1
     persona = personalization.get("persona", "ANALYST") if personalization else "ANALYST"
     preferences = personalization.get("preferences", {}) if personalization else {}
-
-    # 페르소나 정보 가져오기
-    persona_info = PERSONA_STYLES.get(persona, PERSONA_STYLES["ANALYST"])
     level_info = LEVEL_FEATURES.get(level, LEVEL_FEATURES[1])
 
-    # 선호도 포맷팅
-    pref_text = format_preferences(preferences)
-
-    # 관계 맥락 포맷팅
-    relationship_text = ""
-    if relationship:
-        relationship_text = format_relationship_context(relationship)
-
-    # 프롬프트 생성
-    prompt = PERSONALIZED_PROMPT.format(
-        persona_name=persona_info["name"],
-        persona_description=persona_info["description"],
-        persona_focus=", ".join(persona_info["focus"]),
-        persona_tone=persona_info["tone"],
-        persona_example=persona_info["example"],
-        level=level,
-        level_name=level_info["name"],
-        level_description=level_info["description"],
-        level_capabilities="- " + "\n- ".join(level_info["capabilities"]),
-        preferences=pref_text,
-        transcript=transcript[:4000],
-        relationship_context=relationship_text,
-    )
+    decision = _route_personalized(budget_ms, provider)
 
-    try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a personalized question generation AI. Always respond in valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1500,
-        )
-
-        content = response.choices[0].message.content.strip()
-
-        # JSON 파싱
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
+    windowed_transcript = fit_transcript(transcript, decision["transcript_tokens"])
+    memory = get_question_memory(meeting_id) if meeting_id else None
+    suggested = format_suggested_section(memory) if memory else ""
+    if template is not None:
+        with assembly_timer(PERSONALIZED_TEMPLATE.name):
+            prompt = template.render(transcript=windowed_transcript, suggested_questions=suggested)
+    else:
+        prompt = build_personalized_prompt(windowed_transcript, relationship, personalization, suggested)
 
-        result = json.loads(content)
-
-        # 선호도 기반 우선순위 조정
-        questions = result.get("questions", [])
-        adjusted_questions = adjust_priorities_by_preferences(questions, preferences)
+    try:
+        result = await request_personalized(prompt, decision)
+        if result is None:
+            return generate_fallback_questions(transcript, persona, level)
 
-        # 레벨 기반 추가 정보
-        if level >= 3:
-            # 레벨 3+: 인사이트 포함
-            for q in adjusted_questions:
-                if not q.get("insight"):
-                    q["insight"] = None
-        else:
-            # 레벨 1-2: 인사이트 제거
-            for q in adjusted_questions:
-                q.pop("insight", None)
+        adjusted_questions = finalize_questions(result.get("questions", []), preferences, level)
 
-        return {
+        response = {
             "questions": adjusted_questions,
             "stage": result.get("stage", "unknown"),
             "analysis": result.get("analysis", ""),
             "personalization": {
                 "level": level,
                 "persona": persona,
-                "appliedFeatures": level_info["capabilities"]
+                "appliedFeatures": level_info["capabilities"],
+                "provider": decision["provider"],
             }
         }
+        # 회의 중 이미 제안한 질문과 비슷한 질문 제외 (우선순위 조정 후라 높은 우선순위 질문이 남음)
+        if memory is not None:
+            response["questions"], response["filtered_questions"] = memory.dedupe(adjusted_questions)
+        return response
 
-    except json.JSONDecodeError:
-        return generate_fallback_questions(transcript, persona, level)
     except Exception as e:
-        print(f"Personalized question generation error: {e}")
+        logger.error(f"Personalized question generation error ({decision['provider']}): {e}")
         return generate_fallback_questions(transcript, persona, level)
 
 
+def normalize_variants(
+    variants: List[Dict[str, Any]],
+    default_level: int = 1
+) -> List[Dict[str, Any]]:
+    """세트 목록 정리 (알 수 없는 페르소나는 ANALYST, 레벨 1-5, 중복 제거, 최대 MAX_PERSONA_VARIANTS개)"""
+    normalized = []
+    for variant in variants:
+        persona = variant.get("persona") or "ANALYST"
+        if persona not in PERSONA_STYLES:
+            persona = "ANALYST"
+        level = variant.get("level") or default_level
+        level = level if level in LEVEL_FEATURES else 1
+        item = {"persona": persona, "level": level}
+        if item not in normalized:
+            normalized.append(item)
+    if len(normalized) > MAX_PERSONA_VARIANTS:
+        logger.warning(f"Too many persona variants ({len(normalized)}), using first {MAX_PERSONA_VARIANTS}")
+    return normalized[:MAX_PERSONA_VARIANTS]
+
+
+def _match_sets(
+    sets: List[Dict[str, Any]],
+    variants: List[Dict[str, Any]]
+) -> List[Optional[Dict[str, Any]]]:
+    """응답 세트를 요청 세트에 매핑 ((페르소나, 레벨) 일치 우선, 없으면 같은 페르소나, 그다음 순서)"""
+    remaining = list(sets)
+    matched: List[Optional[Dict[str, Any]]] = [None] * len(variants)
+    for rule in (
+        lambda s, v: s.get("persona") == v["persona"] and s.get("level") == v["level"],
+        lambda s, v: s.get("persona") == v["persona"],
+        lambda s, v: True,
+    ):
+        for i, variant in enumerate(variants):
+            if matched[i] is not None:
+                continue
+            for item in remaining:
+                if rule(item, variant):
+                    matched[i] = item
+                    remaining.remove(item)
+                    break
+    return matched
+
+
+async def generate_multi_persona_questions(
+    transcript: str,
+    relationship: Optional[Dict[str, Any]] = None,
+    personalization: Optional[Dict[str, Any]] = None,
+    variants: Optional[List[Dict[str, Any]]] = None,
+    budget_ms: Optional[float] = None,
+    provider: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    여러 페르소나/레벨의 질문 세트를 한 번의 LLM 호출로 생성 (페르소나 비교용)
+
+    Args:
+        transcript: 현재 대화 전사
+        relationship: 관계 객체 정보
+        personalization: 공통 개인화 정보 (도메인, 해금 기능, 선호도, 기본 레벨)
+        variants: [{"persona", "level"(선택)}] 생성할 세트 목록 (없으면 전체 페르소나)
+        budget_ms: 지연 예산 (ms), 모델/토큰 선택에 사용
+        provider: openai | anthropic (None이면 라우터 결정)
+
+    Returns:
+        {"sets": [{"persona", "level", "questions", "personalization"}], "stage", "analysis"}
+        세트 순서는 요청 순서와 같음 (응답에 빠진 세트는 폴백 질문)
+    """
+    personalization = personalization or {}
+    preferences = personalization.get("preferences") or {}
+    variants = normalize_variants(
+        variants or [{"persona": persona} for persona in PERSONA_STYLES],
+        personalization.get("level", 1)
+    )
+
+    decision = _route_personalized(budget_ms, provider)
+    # 출력만 세트 수에 비례해 늘어남 (입력 맥락은 공유)
+    decision = {
+        **decision,
+        "max_tokens": min(
+            MAX_MULTI_PERSONA_TOKENS,
+            decision["max_tokens"] + TOKENS_PER_VARIANT * (len(variants) - 1)
+        ),
+    }
+
+    prompt = build_multi_persona_prompt(
+        fit_transcript(transcript, decision["transcript_tokens"]),
+        relationship,
+        personalization,
+        variants
+    )
+
+    result = None
+    try:
+        result = await request_personalized(
+            prompt, decision, MULTI_PERSONA_QUESTIONS_SCHEMA, "multi_persona_questions"
+        )
+    except Exception as e:
+        logger.error(f"Multi-persona question generation error ({decision['provider']}): {e}")
+
+    result = result or {}
+    matched = _match_sets(result.get("sets") or [], variants)
+    missing = sum(item is None for item in matched)
+    if missing:
+        logger.warning(f"Multi-persona response missing {missing}/{len(variants)} sets, using fallback questions")
+
+    sets = []
+    for variant, item in zip(variants, matched):
+        persona, level = variant["persona"], variant["level"]
+        if item is None:
+            fallback = generate_fallback_questions(transcript, persona, level)
+            sets.append({
+                "persona": persona,
+                "level": level,
+                "questions": fallback["questions"],
+                "personalization": fallback["personalization"],
+            })
+            continue
+        sets.append({
+            "persona": persona,
+            "level": level,
+            "questions": finalize_questions(item.get("questions", []), preferences, level),
+            "personalization": {
+                "level": level,
+                "persona": persona,
+                "appliedFeatures": LEVEL_FEATURES[level]["capabilities"],
+                "provider": decision["provider"],
+            },
+        })
+
+    return {
+        "sets": sets,
+        "stage": result.get("stage", "unknown"),
+        "analysis": result.get("analysis", "폴백 질문 생성됨" if missing == len(variants) else ""),
+    }
+
+
+def clear_response_cache():
+    """응답 캐시 비우기 (벤치마크/테스트용)"""
+    _response_cache.clear()
+
+
+def get_personalized_metrics() -> Dict[str, Any]:
+    """응답 캐시 적중률 (메트릭 엔드포인트용)"""
+    total = _cache_stats["hits"] + _cache_stats["misses"]
+    return {
+        **_cache_stats,
+        "hit_rate": round(_cache_stats["hits"] / total, 3) if total else 0.0,
+        "cached": len(_response_cache),
+    }
+
+
 def format_preferences(preferences: Dict[str, Any]) -> str:
     """선호도 정보 포맷팅"""
     if not preferences:
@@ -273,8 +728,12 @@ def format_relationship_context(relationship: Dict[str, Any]) -> str:
     if relationship.get('structured_data'):
         parts.append(f"- 주요 지표: {json.dumps(relationship['structured_data'], ensure_ascii=False)}")
 
+    # 관계 메모리 요약이 있으면 최근 미팅 대신 사용 (여러 미팅 누적, 고정 크기)
+    if relationship.get('memory_digest'):
+        parts.append("- 관계 메모리:")
+        parts.extend(f"  {line}" for line in relationship['memory_digest'].splitlines())
     # 최근 미팅
-    if relationship.get('recent_meetings'):
+    elif relationship.get('recent_meetings'):
         parts.append("- 최근 미팅:")
         for meeting in relationship['recent_meetings'][:3]:
             parts.append(f"  - {meeting.get('date', 'N/A')}: {meeting.get('summary', 'N/A')[:50]}")
@@ -282,6 +741,11 @@ def format_relationship_context(relationship: Dict[str, Any]) -> str:
     return "\n".join(parts)
 
 
+# 같은 선호도/관계 정보의 반복 요청은 포맷팅 없이 캐시된 블록 사용
+_preference_blocks = FragmentCache("personalized_preferences", format_preferences)
+_relationship_blocks = FragmentCache("personalized_relationship", format_relationship_context)
+
+
 def adjust_priorities_by_preferences(
     questions: List[Dict[str, Any]],
     preferences: Dict[str, Any]
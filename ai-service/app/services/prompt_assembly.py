@@ -0,0 +1,187 @@
+"""
+프롬프트 조립 (Prompt Assembly)
+- 프롬프트 템플릿은 모듈 로드 시 한 번만 (리터럴, 필드) 조각으로 파싱해 두고
+  요청마다 조각을 한 번의 join으로 연결 (str.format 재파싱 / 중간 문자열 복사 없음)
+- 요청마다 같은 내용이 반복되는 블록(관계 정보, 선호도 등)은 내용 기반 키로 LRU 캐시
+  → 같은 관계/선호도의 반복 요청은 포맷팅, json.dumps 없이 캐시된 조각 재사용
+  (키는 marshal 바이트: JSON 타입 전용 C 직렬화라 블록 포맷팅보다 수 배 빠름)
+- 템플릿별 조립 시간(최근/평균/최대)을 메트릭으로 보고
+"""
+
+import time
+import marshal
+import logging
+from collections import OrderedDict
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_CACHE_SIZE = 256  # 블록 종류별 캐시 항목 수
+MARSHAL_VERSION = 2        # 객체 참조(ref) 기록이 없는 버전 → 같은 내용이면 항상 같은 바이트
+
+_assembly_stats: Dict[str, Dict[str, float]] = {}
+_fragment_caches: List["FragmentCache"] = []
+
+
+class PromptTemplate:
+    """
+    미리 파싱한 프롬프트 템플릿 (str.format과 같은 문법, 단순 {필드}만 지원)
+
+    Args:
+        name: 메트릭용 템플릿 이름
+        template: str.format 형식 템플릿 ({{ }}는 리터럴 중괄호)
+    """
+
+    def __init__(self, name: str, template: str):
+        self.name = name
+        self.template = template
+        # 리터럴은 그대로, 필드는 필드 이름으로 저장 (render 시 값으로 치환)
+        parts: List[Tuple[bool, str]] = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if literal:
+                parts.append((False, literal))
+            if field is not None:
+                if not field or spec or conversion:
+                    raise ValueError(f"Unsupported placeholder in {name} template: {{{field}}}")
+                parts.append((True, field))
+        self.parts = tuple(parts)
+        self.fields = frozenset(value for is_field, value in parts if is_field)
+
+    def render(self, **values: Any) -> str:
+        """필드를 채운 프롬프트 (값은 str로 변환)"""
+        return "".join([str(values[value]) if is_field else value for is_field, value in self.parts])
+
+    def bind(self, **values: Any) -> "PromptTemplate":
+        """
+        일부 필드를 미리 채운 템플릿 (남은 필드만 render에서 채움)
+
+        이어지는 리터럴은 하나로 합치므로 전사만 남기면 (고정 앞부분, 전사, 고정 뒷부분) 세 조각
+        """
+        parts: List[Tuple[bool, str]] = []
+        for is_field, value in self.parts:
+            if is_field and value in values:
+                is_field, value = False, str(values[value])
+            if not is_field and parts and not parts[-1][0]:
+                parts[-1] = (False, parts[-1][1] + value)
+            else:
+                parts.append((is_field, value))
+
+        bound = PromptTemplate.__new__(PromptTemplate)
+        bound.name = self.name
+        bound.template = self.template
+        bound.parts = tuple(parts)
+        bound.fields = frozenset(value for is_field, value in parts if is_field)
+        return bound
+
+
+def content_key(value: Any) -> Optional[bytes]:
+    """
+    요청 payload(dict/list/str/숫자)의 내용 키 (JSON 타입이 아니면 None)
+
+    같은 내용이라도 dict 키 순서가 다르면 다른 키 (캐시 미스일 뿐 결과는 같음)
+    """
+    try:
+        return marshal.dumps(value, MARSHAL_VERSION)
+    except ValueError:
+        return None
+
+
+class FragmentCache:
+    """
+    내용 기반 LRU 블록 캐시
+
+    Args:
+        name: 메트릭용 블록 이름
+        render: 원본 값 → 블록 (문자열 또는 조각 dict)
+        max_entries: 최대 보관 개수 (넘으면 가장 오래 쓰이지 않은 항목 제거)
+    """
+
+    def __init__(self, name: str, render: Callable[[Any], Any], max_entries: int = FRAGMENT_CACHE_SIZE):
+        self.name = name
+        self.render = render
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[bytes, Any]" = OrderedDict()
+        _fragment_caches.append(self)
+
+    def get(self, value: Any) -> Any:
+        """캐시된 블록 (없으면 렌더링 후 저장)"""
+        key = content_key(value)
+        if key is None:
+            # JSON 타입이 아닌 값이 섞여 있으면 캐시 없이 렌더링
+            return self.render(value)
+
+        cached = self._items.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return cached
+
+        self.misses += 1
+        cached = self.render(value)
+        self._items[key] = cached
+        if len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+        return cached
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "cached": len(self._items),
+        }
+
+
+class assembly_timer:
+    """프롬프트 조립 구간 시간 기록 (요청 단위, with 문으로 사용)"""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000
+        stats = _assembly_stats.get(self.name)
+        if stats is None:
+            stats = _assembly_stats[self.name] = {"count": 0, "total_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0}
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["last_ms"] = elapsed_ms
+        if elapsed_ms > stats["max_ms"]:
+            stats["max_ms"] = elapsed_ms
+        return False
+
+
+def clear_fragment_caches():
+    """모든 블록 캐시 비우기 (벤치마크/테스트용)"""
+    for cache in _fragment_caches:
+        cache.clear()
+
+
+def get_assembly_metrics() -> Dict[str, Any]:
+    """템플릿별 조립 시간과 블록 캐시 적중률 (메트릭 엔드포인트용)"""
+    return {
+        "templates": {
+            name: {
+                "count": int(stats["count"]),
+                "avg_ms": round(stats["total_ms"] / stats["count"], 4) if stats["count"] else 0.0,
+                "last_ms": round(stats["last_ms"], 4),
+                "max_ms": round(stats["max_ms"], 4),
+            }
+            for name, stats in _assembly_stats.items()
+        },
+        "fragments": {cache.name: cache.stats() for cache in _fragment_caches},
+    }
@@ -1,23 +1,33 @@
-import os
-import json
-import re
 import logging
+from functools import lru_cache
 from typing import List, Optional
 from dotenv import load_dotenv
+from app.services.json_parser import (
+    QUESTIONS_SCHEMA,
+    parse_llm_json,
+    record_structured_output
+)
+from app.services.llm_gateway import anthropic_messages, get_sync_client
+from app.services.model_router import route
+from app.services.prompt_assembly import FragmentCache, PromptTemplate, assembly_timer
+from app.services.question_memory import (
+    format_suggested_lines,
+    format_suggested_section,
+    get_question_memory
+)
+from app.services.transcript_window import (
+    TranscriptWindow,
+    fit_transcript,
+    get_transcript_window
+)
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# Claude 클라이언트는 필요할 때만 초기화 (Mock 모드에서는 사용 안 함)
-_client = None
-
 def get_client():
-    global _client
-    if _client is None:
-        import anthropic
-        _client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-    return _client
+    """동기 Claude 클라이언트 (테스트 스크립트용, 서비스 호출은 llm_gateway 경유)"""
+    return get_sync_client("anthropic")
 
 # 기본 프롬프트
 QUESTION_GENERATION_PROMPT = """당신은 경험이 풍부한 VC(Venture Capital) 투자 심사 전문가입니다.
@@ -53,15 +63,19 @@ QUESTION_GENERATION_PROMPT = """당신은 경험이 풍부한 VC(Venture Capital
 - **follow_up**: 추가적인 디테일을 확인하는 질문"""
 
 
-def extract_json_from_response(text: str) -> dict:
+# 질문 제출용 도구 (tool use로 스키마에 맞는 출력 강제)
+QUESTIONS_TOOL = {
+    "name": "submit_questions",
+    "description": "생성한 질문 목록을 제출합니다.",
+    "input_schema": QUESTIONS_SCHEMA,
+}
+
+
+def extract_json_from_response(text: str, source: str = "claude_questions") -> dict:
     """Claude 응답에서 JSON 추출"""
-    # JSON 블록 찾기
-    json_match = re.search(r'\{[\s\S]*\}', text)
-    if json_match:
-        try:
-            return json.loads(json_match.group())
-        except json.JSONDecodeError:
-            pass
+    result = parse_llm_json(text, QUESTIONS_SCHEMA, source)
+    if result is not None:
+        return result
 
     # 실패 시 기본 응답
     return {
@@ -76,12 +90,53 @@ def extract_json_from_response(text: str) -> dict:
     }
 
 
-async def generate_questions(transcript: str):
+def parse_questions_message(message, source: str = "claude_questions") -> dict:
+    """Claude 메시지에서 질문 추출 (tool use 우선, 텍스트 JSON 폴백)"""
+    text_parts = []
+    for block in message.content:
+        if block.type == "tool_use":
+            payload = record_structured_output(source, block.input, QUESTIONS_SCHEMA)
+            if payload is not None:
+                return payload
+        elif block.type == "text":
+            text_parts.append(block.text)
+
+    return extract_json_from_response("".join(text_parts), source)
+
+
+async def request_questions(prompt: str, source: str, decision: dict) -> dict:
+    """
+    질문 생성 프롬프트로 Claude 호출 (llm_gateway 경유)
+
+    Args:
+        prompt: 완성된 프롬프트
+        source: 파싱 메트릭 구분용 이름
+        decision: model_router.route 결과 (model, max_tokens, deadline)
+    """
+    message = await anthropic_messages(
+        model=decision["model"],
+        max_tokens=decision["max_tokens"],
+        tools=[QUESTIONS_TOOL],
+        tool_choice={"type": "tool", "name": QUESTIONS_TOOL["name"]},
+        messages=[
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        deadline=decision["deadline"]
+    )
+
+    return parse_questions_message(message, source)
+
+
+async def generate_questions(transcript: str, budget_ms: Optional[float] = None):
     """
     대화 전사 내용을 분석하여 AI 질문 생성 (Claude API)
 
     Args:
         transcript: 대화 전사 텍스트
+        budget_ms: 지연 예산 (ms), 모델/토큰 선택에 사용
 
     Returns:
         dict: {
@@ -95,21 +150,12 @@ async def generate_questions(transcript: str):
             ]
         }
     """
-    client = get_client()
-
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1024,
-        messages=[
-            {
-                "role": "user",
-                "content": QUESTION_GENERATION_PROMPT.format(transcript=transcript)
-            }
-        ]
+    # 단일 청크만으로는 대화 단계를 알 수 없으므로 단계 없이 라우팅
+    decision = route("questions", None, budget_ms)
+    prompt = QUESTION_GENERATION_PROMPT.format(
+        transcript=fit_transcript(transcript, decision["transcript_tokens"])
     )
-
-    response_text = message.content[0].text
-    result = extract_json_from_response(response_text)
+    result = await request_questions(prompt, "claude_questions", decision)
 
     return result
 
@@ -154,7 +200,9 @@ CONTEXT_AWARE_PROMPT = """당신은 경험이 풍부한 VC(Venture Capital) 투
 
 async def generate_questions_with_context(
     transcript: str,
-    previous_transcripts: Optional[List[str]] = None
+    previous_transcripts: Optional[List[str]] = None,
+    meeting_id: Optional[str] = None,
+    budget_ms: Optional[float] = None
 ) -> dict:
     """
     맥락을 고려한 질문 생성
@@ -162,25 +210,41 @@ async def generate_questions_with_context(
     Args:
         transcript: 현재 전사 텍스트
         previous_transcripts: 이전 전사 텍스트 리스트
+        meeting_id: 회의 ID (있으면 회의별 전사 윈도우를 유지하며 증분 반영)
+        budget_ms: 지연 예산 (ms), 모델/토큰 선택에 사용
 
     Returns:
         dict: 생성된 질문 리스트
     """
     from app.services.context_analyzer import (
-        extract_mentioned_topics,
+        ContextSession,
         build_context_for_prompt,
-        filter_redundant_questions,
-        get_conversation_stage
+        filter_redundant_questions_with_reasons,
+        get_context_session
     )
 
     # 전체 전사 합치기
     all_transcripts = previous_transcripts or []
     all_transcripts.append(transcript)
 
-    # 맥락 추출
-    mentioned_context = extract_mentioned_topics(all_transcripts)
-    context_str = build_context_for_prompt(all_transcripts, mentioned_context)
-    stage = get_conversation_stage(all_transcripts)
+    # 맥락 추출 (회의 ID가 있으면 새 청크만 증분 분석)
+    session = get_context_session(meeting_id) if meeting_id else ContextSession()
+    session.sync(all_transcripts)
+    mentioned_context = session.mentioned_context()
+    stage = session.stage
+    context_str = build_context_for_prompt(all_transcripts, mentioned_context, stage, session.facts.latest())
+    memory = get_question_memory(meeting_id) if meeting_id else None
+    if memory:
+        # 이미 제안한 질문을 알려 같은 질문을 다시 만드는 데 토큰을 쓰지 않도록
+        context_str += f"\n이미 제안한 질문 (같은 의도의 질문은 다시 제안 금지):\n{format_suggested_lines(memory)}"
+    decision = route("questions", stage, budget_ms)
+
+    # 최근 대화는 원문, 이전 대화는 압축 다이제스트로
+    window = get_transcript_window(meeting_id) if meeting_id else TranscriptWindow()
+    window.sync(all_transcripts)
+    windowed_transcript = window.render(decision["transcript_tokens"])
+    if meeting_id:
+        window.schedule_summary()
 
     stage_descriptions = {
         'introduction': '초반 (회사 소개 단계) - 기본적인 회사 개요와 팀에 대해 질문하세요',
@@ -188,32 +252,24 @@ async def generate_questions_with_context(
         'closing': '후반 (마무리 단계) - 다음 단계, 투자 조건, 추가 자료에 대해 질문하세요',
     }
 
-    client = get_client()
-
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1024,
-        messages=[
-            {
-                "role": "user",
-                "content": CONTEXT_AWARE_PROMPT.format(
-                    transcript=transcript,
-                    mentioned_context=context_str,
-                    conversation_stage=stage_descriptions.get(stage, stage)
-                )
-            }
-        ]
+    prompt = CONTEXT_AWARE_PROMPT.format(
+        transcript=windowed_transcript,
+        mentioned_context=context_str,
+        conversation_stage=stage_descriptions.get(stage, stage)
     )
-
-    response_text = message.content[0].text
-    result = extract_json_from_response(response_text)
+    result = await request_questions(prompt, "claude_context_questions", decision)
 
     # 중복 질문 필터링 (이중 체크)
     if "questions" in result:
-        result["questions"] = filter_redundant_questions(
+        result["questions"], result["filtered_questions"] = filter_redundant_questions_with_reasons(
             result["questions"],
-            mentioned_context
+            index=session.redundancy_index(),
+            sentences=session.sentences
         )
+        # 회의 중 이미 제안한 질문과 비슷한 질문 제외
+        if memory is not None:
+            result["questions"], repeated = memory.dedupe(result["questions"])
+            result["filtered_questions"].extend(repeated)
 
     logger.info(f"Generated {len(result.get('questions', []))} context-aware questions")
 
@@ -235,7 +291,7 @@ RELATIONSHIP_AWARE_PROMPT = """당신은 경험이 풍부한 VC(Venture Capital)
 ## 현재 미팅 번호: {meeting_number}회차
 
 ## 현재 대화 전사:
-{transcript}
+{transcript}{suggested_questions}
 
 ## 질문 생성 가이드라인:
 
@@ -268,26 +324,31 @@ RELATIONSHIP_AWARE_PROMPT = """당신은 경험이 풍부한 VC(Venture Capital)
 
 **3개의 질문을 생성하세요.**"""
 
+RELATIONSHIP_TEMPLATE = PromptTemplate("relationship_questions", RELATIONSHIP_AWARE_PROMPT)
 
-def _get_type_specific_guidelines(relationship_type: str) -> str:
-    """관계 유형별 질문 가이드라인"""
-    guidelines = {
-        "STARTUP": """- 투자 적합성과 성장 가능성에 집중
+# 관계 유형별 질문 가이드라인
+TYPE_GUIDELINES = {
+    "STARTUP": """- 투자 적합성과 성장 가능성에 집중
 - 핵심 지표(MRR, CAC, LTV, Churn) 변화 추적
 - 팀 역량과 실행력 검증
 - 리스크 요인과 대응 방안 확인""",
-        "CLIENT": """- 프로젝트 진행 상황과 요구사항 변화에 집중
+    "CLIENT": """- 프로젝트 진행 상황과 요구사항 변화에 집중
 - 예산과 타임라인 준수 여부 확인
 - 이슈와 블로커 식별
 - 다음 단계 협의 사항 정리""",
-        "PARTNER": """- 파트너십 가치와 시너지에 집중
+    "PARTNER": """- 파트너십 가치와 시너지에 집중
 - 협업 진행 상황 확인
 - 상호 이익과 기대치 조율
 - 장기 관계 발전 방향 논의"""
-    }
-    return guidelines.get(relationship_type, guidelines["STARTUP"])
+}
+
 
+def _get_type_specific_guidelines(relationship_type: str) -> str:
+    """관계 유형별 질문 가이드라인"""
+    return TYPE_GUIDELINES.get(relationship_type, TYPE_GUIDELINES["STARTUP"])
 
+
+@lru_cache(maxsize=32)
 def _get_meeting_stage_guidelines(meeting_number: int) -> str:
     """미팅 회차별 가이드라인"""
     if meeting_number == 1:
@@ -344,319 +405,99 @@ def _format_recent_meetings(recent_meetings: list) -> str:
     return "\n".join(lines) if len(lines) > 1 else ""
 
 
-async def generate_questions_with_relationship(
-    transcript: str,
-    relationship: Optional[dict] = None
-) -> dict:
-    """
-    관계 객체 맥락을 활용한 질문 생성 (Phase 2 핵심 기능)
-
-    Args:
-        transcript: 현재 대화 전사 텍스트
-        relationship: 관계 객체 정보 {
-            name, type, industry, stage, notes,
-            structured_data, meeting_number, recent_meetings
-        }
+def _format_memory_digest(digest: str) -> str:
+    """관계 메모리 요약 (여러 미팅 누적, 고정 토큰 예산) - 이전 미팅 히스토리 대신 사용"""
+    return "- **관계 메모리 (이전 미팅 누적)**:\n" + "\n".join(f"  {line}" for line in digest.splitlines())
 
-    Returns:
-        dict: 생성된 질문 리스트
-    """
-    # 관계 정보가 없으면 기본 질문 생성으로 폴백
-    if not relationship:
-        logger.info("No relationship context provided, falling back to basic generation")
-        return await generate_questions(transcript)
 
-    # 관계 정보 추출
-    name = relationship.get("name", "알 수 없음")
-    rel_type = relationship.get("type", "STARTUP")
+def _format_relationship_fragments(relationship: dict) -> dict:
+    """관계 정보 → 프롬프트 필드별 조각 (전사 제외)"""
     industry = relationship.get("industry")
     stage = relationship.get("stage")
     notes = relationship.get("notes")
-    structured_data = relationship.get("structured_data", {})
+    rel_type = relationship.get("type", "STARTUP")
     meeting_number = relationship.get("meeting_number", 1)
-    recent_meetings = relationship.get("recent_meetings", [])
-
-    # 프롬프트 구성 요소 생성
-    industry_info = f"- **산업**: {industry}" if industry else ""
-    stage_info = f"- **단계**: {stage}" if stage else ""
-    structured_data_info = _format_structured_data(structured_data)
-    recent_meetings_info = _format_recent_meetings(recent_meetings)
-    notes_info = f"- **메모**: {notes}" if notes else ""
-
-    type_guidelines = _get_type_specific_guidelines(rel_type)
-    meeting_guidelines = _get_meeting_stage_guidelines(meeting_number)
-
-    # 최종 프롬프트 생성
-    prompt = RELATIONSHIP_AWARE_PROMPT.format(
-        relationship_name=name,
-        relationship_type=rel_type,
-        industry_info=industry_info,
-        stage_info=stage_info,
-        structured_data_info=structured_data_info,
-        recent_meetings_info=recent_meetings_info,
-        notes_info=notes_info,
-        meeting_number=meeting_number,
-        transcript=transcript,
-        type_specific_guidelines=type_guidelines,
-        meeting_stage_guidelines=meeting_guidelines
-    )
 
-    logger.info(f"Generating relationship-aware questions for {name} ({rel_type}), meeting #{meeting_number}")
-
-    client = get_client()
-
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1024,
-        messages=[
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-    )
-
-    response_text = message.content[0].text
-    result = extract_json_from_response(response_text)
-
-    logger.info(f"Generated {len(result.get('questions', []))} relationship-aware questions")
-
-    return result
-
-
-# 개인화 프롬프트 (Phase 6-1)
-PERSONALIZED_PROMPT = """당신은 경험이 풍부한 VC(Venture Capital) 투자 심사 전문가입니다.
-
-## 대화 전사:
-{transcript}
-
-## 사용자 프로필:
-- **레벨**: Lv.{level} ({level_description})
-- **페르소나**: {persona_description}
-- **도메인**: {domain}
-
-## 사용자 선호도:
-{preferences_info}
-
-## 해금된 기능:
-{features_info}
-
-## 질문 생성 가이드라인:
-
-### 페르소나별 톤:
-{persona_guidelines}
-
-### 레벨별 질문 복잡도:
-{level_guidelines}
-
-### 선호도 반영:
-- 선호도가 높은 카테고리({high_pref_categories})에서 더 많은 질문 생성
-- 선호도가 낮은 카테고리({low_pref_categories})는 최소화
-
-## 출력 형식:
-반드시 아래 JSON 형식으로만 응답하세요.
-
-{{
-  "questions": [
-    {{
-      "text": "구체적인 질문 텍스트 (한국어)",
-      "priority": "critical 또는 important 또는 follow_up",
-      "reason": "이 질문이 왜 중요한지 (1문장)",
-      "category": "business_model 또는 traction 또는 team 또는 market 또는 technology 또는 financials 또는 risks",
-      "explanation": "{explanation_instruction}"
-    }}
-  ]
-}}
-
-**3개의 질문을 생성하세요.**"""
-
-
-def _get_persona_description(persona: str) -> str:
-    """페르소나 설명"""
-    descriptions = {
-        "ANALYST": "분석가 - 데이터와 지표 중심의 객관적 접근",
-        "BUDDY": "동료 - 친근하고 협력적인 스타일",
-        "GUARDIAN": "보호자 - 리스크와 안전에 집중",
-        "VISIONARY": "비전가 - 큰 그림과 가능성에 집중"
-    }
-    return descriptions.get(persona, "분석가")
-
-
-def _get_persona_guidelines(persona: str) -> str:
-    """페르소나별 질문 가이드라인"""
-    guidelines = {
-        "ANALYST": """- 데이터와 지표 기반의 질문을 우선
-- 객관적이고 측정 가능한 정보 요청
-- 비교 분석과 벤치마크 관련 질문 포함""",
-        "BUDDY": """- 협력적이고 건설적인 톤의 질문
-- 어떻게 도와줄 수 있는지 관점의 질문
-- 팀과 문화에 대한 이해를 높이는 질문""",
-        "GUARDIAN": """- 리스크와 잠재적 문제에 집중
-- 대응 계획과 보호 장치 확인
-- 최악의 시나리오와 대비책 질문""",
-        "VISIONARY": """- 큰 비전과 장기적 가능성에 집중
-- 혁신적 기회와 성장 잠재력 질문
-- 업계 변화와 트렌드에 대한 시각 확인"""
-    }
-    return guidelines.get(persona, guidelines["ANALYST"])
-
-
-def _get_level_description(level: int) -> str:
-    """레벨 설명"""
-    descriptions = {
-        1: "입문자",
-        2: "견습생",
-        3: "숙련자",
-        4: "전문가",
-        5: "마스터"
-    }
-    return descriptions.get(level, "입문자")
-
-
-def _get_level_guidelines(level: int) -> str:
-    """레벨별 질문 복잡도 가이드라인"""
-    if level <= 1:
-        return """- 기본적이고 이해하기 쉬운 질문
-- 핵심 지표와 기본 정보 위주
-- 전문 용어 최소화"""
-    elif level <= 2:
-        return """- 조금 더 상세한 질문 가능
-- 기본 지표 외 추가 분석 질문
-- 일부 전문 용어 사용"""
-    elif level <= 3:
-        return """- 심화된 분석 질문 포함
-- 벤치마크와 비교 분석 질문
-- 업계 전문 용어 활용"""
-    elif level <= 4:
-        return """- 고급 전략적 질문 포함
-- 예측과 시나리오 분석 질문
-- 전문가 수준의 통찰 요청"""
-    else:
-        return """- 최고 수준의 복합적 질문
-- 다차원적 분석과 예측 질문
-- 업계 최고 수준의 통찰 요청"""
-
-
-def _format_preferences_for_prompt(preferences: dict) -> tuple:
-    """선호도를 프롬프트용으로 포맷"""
-    category_map = {
-        "businessModelPref": ("business_model", "비즈니스 모델"),
-        "tractionPref": ("traction", "트랙션"),
-        "teamPref": ("team", "팀"),
-        "marketPref": ("market", "시장"),
-        "technologyPref": ("technology", "기술"),
-        "financialsPref": ("financials", "재무"),
-        "risksPref": ("risks", "리스크")
+    return {
+        "relationship_name": relationship.get("name", "알 수 없음"),
+        "relationship_type": rel_type,
+        "industry_info": f"- **산업**: {industry}" if industry else "",
+        "stage_info": f"- **단계**: {stage}" if stage else "",
+        "structured_data_info": _format_structured_data(relationship.get("structured_data", {})),
+        "recent_meetings_info": _format_memory_digest(relationship["memory_digest"])
+        if relationship.get("memory_digest")
+        else _format_recent_meetings(relationship.get("recent_meetings", [])),
+        "notes_info": f"- **메모**: {notes}" if notes else "",
+        "meeting_number": meeting_number,
+        "type_specific_guidelines": _get_type_specific_guidelines(rel_type),
+        "meeting_stage_guidelines": _get_meeting_stage_guidelines(meeting_number),
     }
 
-    pref_items = []
-    high_prefs = []
-    low_prefs = []
 
-    for key, (cat, label) in category_map.items():
-        value = preferences.get(key, 0.5)
-        pref_items.append(f"- {label}: {value:.0%}")
+# 같은 관계 정보의 반복 요청(회의 중 매 질문 생성)은 조각을 다시 만들지 않음
+_relationship_fragments = FragmentCache("relationship_questions", _format_relationship_fragments)
 
-        if value >= 0.7:
-            high_prefs.append(label)
-        elif value <= 0.3:
-            low_prefs.append(label)
 
-    pref_info = "\n".join(pref_items)
-    high_cats = ", ".join(high_prefs) if high_prefs else "없음"
-    low_cats = ", ".join(low_prefs) if low_prefs else "없음"
+def bind_relationship_template(relationship: dict) -> PromptTemplate:
+    """관계 정보를 미리 채운 템플릿 (전사만 남음, 미팅 시작 준비용)"""
+    return RELATIONSHIP_TEMPLATE.bind(**_relationship_fragments.get(relationship))
 
-    return pref_info, high_cats, low_cats
 
-
-async def generate_personalized_questions(
+async def generate_questions_with_relationship(
     transcript: str,
-    personalization: Optional[dict] = None
+    relationship: Optional[dict] = None,
+    budget_ms: Optional[float] = None,
+    template: Optional[PromptTemplate] = None,
+    stage: Optional[str] = None,
+    meeting_id: Optional[str] = None
 ) -> dict:
     """
-    개인화된 질문 생성 (Phase 6-1)
+    관계 객체 맥락을 활용한 질문 생성 (Phase 2 핵심 기능)
 
     Args:
-        transcript: 대화 전사 텍스트
-        personalization: 개인화 컨텍스트 {
-            level, persona, domain, features, preferences
+        transcript: 현재 대화 전사 텍스트
+        relationship: 관계 객체 정보 {
+            name, type, industry, stage, notes,
+            structured_data, meeting_number, recent_meetings
         }
+        budget_ms: 지연 예산 (ms), 모델/토큰 선택에 사용
+        template: bind_relationship_template 결과 (미팅 시작 시 준비, 있으면 관계 블록 조립 생략)
+        stage: 대화 단계 (모델 라우팅용, 없으면 단계 없이 라우팅)
+        meeting_id: 회의 ID (있으면 이미 제안한 질문을 프롬프트에 알리고 비슷한 질문 제외)
 
     Returns:
         dict: 생성된 질문 리스트
     """
-    # 개인화 정보가 없으면 기본 질문 생성으로 폴백
-    if not personalization:
-        logger.info("No personalization context provided, falling back to basic generation")
-        return await generate_questions(transcript)
-
-    # 개인화 정보 추출
-    level = personalization.get("level", 1)
-    persona = personalization.get("persona", "ANALYST")
-    domain = personalization.get("domain", "GENERAL")
-    features = personalization.get("features", [])
-    preferences = personalization.get("preferences", {})
-
-    # 프롬프트 구성 요소 생성
-    level_desc = _get_level_description(level)
-    persona_desc = _get_persona_description(persona)
-    persona_guidelines = _get_persona_guidelines(persona)
-    level_guidelines = _get_level_guidelines(level)
-
-    pref_info, high_cats, low_cats = _format_preferences_for_prompt(preferences)
-
-    features_info = "- " + "\n- ".join(features) if features else "기본 기능만 해금됨"
-
-    # 설명 포함 여부
-    include_explanation = preferences.get("includeExplanation", True)
-    explanation_instruction = "이 질문에 대한 간단한 설명 (선택사항)" if include_explanation else "(생략)"
-
-    # 도메인 한글화
-    domain_labels = {
-        "INVESTMENT_SCREENING": "투자 심사",
-        "MENTORING": "멘토링",
-        "SALES": "세일즈",
-        "PRODUCT_REVIEW": "제품 리뷰",
-        "TEAM_MEETING": "팀 미팅",
-        "USER_INTERVIEW": "사용자 인터뷰",
-        "GENERAL": "일반"
-    }
-    domain_label = domain_labels.get(domain, "일반")
-
-    # 최종 프롬프트 생성
-    prompt = PERSONALIZED_PROMPT.format(
-        transcript=transcript,
-        level=level,
-        level_description=level_desc,
-        persona_description=persona_desc,
-        domain=domain_label,
-        preferences_info=pref_info,
-        features_info=features_info,
-        persona_guidelines=persona_guidelines,
-        level_guidelines=level_guidelines,
-        high_pref_categories=high_cats,
-        low_pref_categories=low_cats,
-        explanation_instruction=explanation_instruction
-    )
-
-    logger.info(f"Generating personalized questions for Lv.{level} {persona} in {domain}")
-
-    client = get_client()
-
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1024,
-        messages=[
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-    )
+    # 관계 정보가 없으면 기본 질문 생성으로 폴백
+    if not relationship and template is None:
+        logger.info("No relationship context provided, falling back to basic generation")
+        return await generate_questions(transcript, budget_ms)
+
+    decision = route("questions", stage, budget_ms)
+    windowed_transcript = fit_transcript(transcript, decision["transcript_tokens"])
+    memory = get_question_memory(meeting_id) if meeting_id else None
+    suggested = format_suggested_section(memory) if memory else ""
+
+    # 최종 프롬프트 생성 (관계 블록은 캐시 또는 미리 채운 템플릿, 전사만 요청마다 채움)
+    with assembly_timer(RELATIONSHIP_TEMPLATE.name):
+        if template is not None:
+            prompt = template.render(transcript=windowed_transcript, suggested_questions=suggested)
+        else:
+            fragments = _relationship_fragments.get(relationship)
+            prompt = RELATIONSHIP_TEMPLATE.render(
+                **fragments, transcript=windowed_transcript, suggested_questions=suggested
+            )
+
+    if relationship:
+        logger.info(
+            f"Generating relationship-aware questions for {relationship.get('name')} "
+            f"({relationship.get('type')}), meeting #{relationship.get('meeting_number', 1)}"
+        )
 
-    response_text = message.content[0].text
-    result = extract_json_from_response(response_text)
+    result = await request_questions(prompt, "claude_relationship_questions", decision)
+    if memory is not None and "questions" in result:
+        result["questions"], result["filtered_questions"] = memory.dedupe(result["questions"])
 
-    logger.info(f"Generated {len(result.get('questions', []))} personalized questions")
+    logger.info(f"Generated {len(result.get('questions', []))} relationship-aware questions")
 
-    return result
\ No newline at end of file
+    return result
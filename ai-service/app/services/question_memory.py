@@ -0,0 +1,240 @@
+"""
+회의별 제안 질문 기억 (Question Memory)
+- 질문 생성 요청은 서로 독립적이라 전사가 늘어날수록 같은 질문("CAC는 얼마인가요?")이 반복 제안됨
+- 회의마다 이미 제안한 질문을 문자 n-gram 해싱 벡터(text_vectors)로 보관
+  - 질문별 희소 벡터 항목을 특징 순으로 정렬한 배열 3개에 보관 (역색인) → 질문당 1KB 미만
+  - 새 후보는 겹치는 특징의 항목만 읽어 저장된 전체 질문과 코사인 유사도를 한 번의 bincount로 계산
+  - 벡터는 질문 어미/부사/조사를 뗀 핵심 부분으로 계산 ("현재 ARR은 얼마인가요?" → "ARR")
+    (모든 질문에 공통인 어미가 점수를 채워 ARR/MRR처럼 대상만 다른 질문이 중복으로 걸리지 않도록)
+- 비슷한 후보는 제외하고 기존 질문의 반복 횟수만 증가 (필터링 이유는 filtered_questions 형식)
+- 최근 제안 질문 목록을 프롬프트에 전달해 중복 질문 생성에 쓰이는 토큰 자체를 줄임
+"""
+
+import re
+import time
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.services.sentence_index import question_core
+from app.services.session_store import SessionStore
+from app.services.text_vectors import sparse_rows
+
+logger = logging.getLogger(__name__)
+
+VECTOR_DIM = 2 ** 14
+NGRAM_RANGE = (2, 3)           # 한 글자 n-gram은 변별력이 낮아 제외
+# 핵심 부분 기준: 대상만 다른 질문("ARR"/"MRR", "MRR"/"MRR 성장률")은 0.43~0.68,
+# 조사/어순만 다른 질문은 0.8 이상
+DUPLICATE_THRESHOLD = 0.75
+MAX_SUGGESTED = 400            # 회의별 보관 질문 수 (넘으면 오래된 질문부터 제거)
+MAX_PROMPT_QUESTIONS = 10      # 프롬프트에 알려줄 최근 질문 수
+MAX_PROMPT_CHARS = 80
+
+# question_core가 남기는 의문사 + 보조 용언 ("팀 구성은 어떻게 되어 있나요?" → "팀 구성은 어떻게 되어")
+_TRAILING_RE = re.compile(r'\s*(어떻게|얼마나|얼마|어느\s*정도|무엇|언제|몇)?\s*(되어|돼|되|남았|걸리)?\s*$')
+_PARTICLE_RE = re.compile(r'(은|는|이|가|을|를|의|와|과|에서|에)$')
+_FILLER_WORDS = {"현재", "지금", "최근", "혹시", "대략"}
+
+_stats = {"checked": 0, "duplicates": 0, "total_us": 0.0, "max_us": 0.0}
+
+
+def question_key(text: str) -> str:
+    """중복 비교용 질문 핵심 부분 ("CAC는 현재 얼마인가요?" → "CAC")"""
+    core = question_core(text)
+    core = _TRAILING_RE.sub("", core) or core
+    words = []
+    for word in core.split():
+        if len(word) > 2:
+            word = _PARTICLE_RE.sub("", word)
+        if word not in _FILLER_WORDS:
+            words.append(word)
+    return " ".join(words) or core
+
+
+class QuestionMemory:
+    """
+    회의에서 이미 제안한 질문
+
+    희소 벡터 항목을 특징(열) 순으로 정렬해 보관 (열, 질문 번호, 값) → 역색인처럼 후보와 겹치는 특징의
+    항목만 읽어 유사도 계산 (비용이 저장된 질문 수가 아니라 겹치는 n-gram 수에 비례)
+    질문 번호는 추가 순서의 절대 번호 (오래된 질문을 제거해도 남은 항목의 번호를 고치지 않음)
+    """
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.repeats: List[int] = []
+        self._columns = np.zeros(0, dtype=np.int32)
+        self._rows = np.zeros(0, dtype=np.int32)
+        self._values = np.zeros(0, dtype=np.float32)
+        self._base = 0  # texts[0]의 질문 번호
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _similarity(self, rows: np.ndarray, indices: np.ndarray, values: np.ndarray, count: int) -> np.ndarray:
+        """(후보 수, 저장된 질문 수) 코사인 유사도"""
+        stored = len(self.texts)
+        lo = np.searchsorted(self._columns, indices, side="left")
+        lengths = np.searchsorted(self._columns, indices, side="right") - lo
+        total = int(lengths.sum())
+        if not total:
+            return np.zeros((count, stored), dtype=np.float32)
+
+        # 후보 특징마다 같은 특징을 가진 저장 항목 구간 [lo, lo + length)을 이어 붙인 위치
+        positions = np.repeat(lo - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+        target = np.repeat(rows, lengths) * stored + (self._rows[positions] - self._base)
+        weights = np.repeat(values, lengths) * self._values[positions]
+        return np.bincount(target, weights=weights, minlength=count * stored).reshape(count, stored)
+
+    def _append(
+        self,
+        row_start: np.ndarray,
+        indices: np.ndarray,
+        values: np.ndarray,
+        keep: List[int],
+        texts: List[str]
+    ):
+        """유지한 후보의 항목을 열 순서를 유지하며 병합 (상한을 넘으면 오래된 질문 제거)"""
+        lengths = np.diff(row_start)[keep]
+        selected = np.concatenate([np.arange(row_start[i], row_start[i + 1]) for i in keep])
+        numbers = np.repeat(np.arange(len(keep)), lengths) + self._base + len(self.texts)
+        order = np.argsort(indices[selected], kind="stable")
+        columns = indices[selected][order].astype(np.int32)
+
+        # 새 항목이 들어갈 위치 (기존 배열의 삽입 지점 + 앞서 삽입된 새 항목 수)
+        slots = np.searchsorted(self._columns, columns) + np.arange(len(columns))
+        old = np.ones(len(self._columns) + len(columns), dtype=bool)
+        old[slots] = False
+        self._columns = _merge(self._columns, old, slots, columns)
+        self._rows = _merge(self._rows, old, slots, numbers[order].astype(np.int32))
+        self._values = _merge(self._values, old, slots, values[selected][order])
+        self.texts.extend(texts[i] for i in keep)
+        self.repeats.extend(0 for _ in keep)
+
+        overflow = len(self.texts) - MAX_SUGGESTED
+        if overflow > 0:
+            # 한 번에 1/4씩 제거해 배열 복사 횟수를 줄임
+            drop = max(overflow, MAX_SUGGESTED // 4)
+            self._base += drop
+            alive = self._rows >= self._base
+            self._columns = self._columns[alive]
+            self._rows = self._rows[alive]
+            self._values = self._values[alive]
+            del self.texts[:drop]
+            del self.repeats[:drop]
+
+    def dedupe(self, questions: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        이미 제안한 질문과 비슷한 후보 제외 후 남은 질문 기록
+
+        Args:
+            questions: 생성된 질문 리스트 [{"text", ...}]
+
+        Returns:
+            (남은 질문 리스트, [{"question": 질문, "reason": {"type": "suggested", "matched", "similarity"}}, ...])
+        """
+        texts = [str(q.get("text") or "") for q in questions]
+        if not texts:
+            return [], []
+        start = time.perf_counter()
+
+        rows, indices, values = sparse_rows([question_key(text) for text in texts], VECTOR_DIM, NGRAM_RANGE)
+        row_start = np.searchsorted(rows, np.arange(len(texts) + 1))
+        stored = self._similarity(rows, indices, values, len(texts))
+        # 같은 응답 안의 후보끼리 (후보 수가 적으므로 밀집 행렬에서 gather)
+        candidates = np.zeros((len(texts), VECTOR_DIM), dtype=np.float32)
+        candidates[rows, indices] = values
+        batch = np.add.reduceat(candidates[:, indices] * values, row_start[:-1], axis=1)
+
+        kept: List[Dict[str, Any]] = []
+        keep: List[int] = []
+        filtered: List[Dict[str, Any]] = []
+        for i, question in enumerate(questions):
+            if stored.shape[1]:
+                j = int(stored[i].argmax())
+                if stored[i, j] >= DUPLICATE_THRESHOLD:
+                    self.repeats[j] += 1
+                    filtered.append(_duplicate(question, self.texts[j], stored[i, j]))
+                    continue
+            k = next((k for k in keep if batch[i, k] >= DUPLICATE_THRESHOLD), None)
+            if k is not None:
+                filtered.append(_duplicate(question, texts[k], batch[i, k]))
+                continue
+            keep.append(i)
+            kept.append(question)
+
+        if keep:
+            self._append(row_start, indices, values, keep, texts)
+
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        _stats["checked"] += len(questions)
+        _stats["duplicates"] += len(filtered)
+        _stats["total_us"] += elapsed_us
+        _stats["max_us"] = max(_stats["max_us"], elapsed_us)
+        if filtered:
+            logger.info(f"Filtered {len(filtered)} already suggested questions ({elapsed_us:.0f}us)")
+        return kept, filtered
+
+    def recent(self, limit: int = MAX_PROMPT_QUESTIONS) -> List[str]:
+        """최근 제안한 질문 (최신 순)"""
+        return self.texts[::-1][:limit]
+
+
+def _merge(array: np.ndarray, old: np.ndarray, slots: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """정렬된 배열에 새 항목 병합 (old: 결과에서 기존 항목 자리, slots: 새 항목 자리)"""
+    merged = np.empty(len(old), dtype=array.dtype)
+    merged[old] = array
+    merged[slots] = new
+    return merged
+
+
+def _duplicate(question: Dict[str, Any], matched: str, similarity: float) -> Dict[str, Any]:
+    return {
+        "question": question,
+        "reason": {"type": "suggested", "matched": matched, "similarity": round(float(similarity), 3)},
+    }
+
+
+def _clip(text: str) -> str:
+    return text if len(text) <= MAX_PROMPT_CHARS else text[:MAX_PROMPT_CHARS - 1].rstrip() + "…"
+
+
+def format_suggested_lines(memory: QuestionMemory) -> str:
+    """최근 제안한 질문 목록 ("- 질문" 줄, 없으면 빈 문자열)"""
+    return "\n".join(f"- {_clip(text)}" for text in memory.recent())
+
+
+def format_suggested_section(memory: QuestionMemory) -> str:
+    """
+    질문 프롬프트의 전사 뒤에 붙일 이미 제안한 질문 섹션 (없으면 빈 문자열)
+
+    전사 바로 뒤에 이어 붙이므로 앞에 빈 줄 포함
+    """
+    lines = format_suggested_lines(memory)
+    if not lines:
+        return ""
+    return f"\n\n## 이미 제안한 질문 (같은 의도의 질문은 다시 제안하지 마세요):\n{lines}"
+
+
+# 회의별 제안 질문
+_memories = SessionStore(QuestionMemory, name="question memory")
+
+
+def get_question_memory(meeting_id: str) -> QuestionMemory:
+    """회의 ID에 해당하는 제안 질문 기억 (없으면 생성)"""
+    return _memories.get_or_create(meeting_id)
+
+
+def get_question_memory_metrics() -> Dict[str, Any]:
+    """중복 제외 통계 (메트릭 엔드포인트용)"""
+    checked = _stats["checked"]
+    return {
+        "checked": checked,
+        "duplicates": _stats["duplicates"],
+        "duplicate_rate": round(_stats["duplicates"] / checked, 3) if checked else 0.0,
+        "avg_us_per_question": round(_stats["total_us"] / checked, 1) if checked else 0.0,
+        "max_us": round(_stats["max_us"], 1),
+        "meetings": len(_memories),
+    }
@@ -0,0 +1,284 @@
+"""
+관계 메모리 요약 (Relationship Digest)
+- 관계별로 여러 미팅에 걸친 누적 기억을 압축 보관, /api/summary/generate 후 증분 갱신
+  - 최신 지표 값 (지표별 마지막 값 + 날짜)
+  - 미해결 후속 조치 (이후 미팅의 결정 사항과 비슷하면 해결된 것으로 제거, 이번 후속 조치에 다시 나오면 유지)
+  - 열린 질문 (이후 미팅에서 물어본 질문과 비슷하면 제거, 비슷한 질문은 하나로 합침)
+  - 최근 미팅 한 줄 요약
+- 프롬프트용 블록은 갱신 시 한 번만 렌더링해 고정 토큰 예산(DIGEST_TOKEN_BUDGET) 안에 보관
+  → 질문 프롬프트 크기가 관계 히스토리 길이와 무관
+- 문장 유사도는 문자 n-gram 해싱 벡터(text_vectors)의 코사인
+"""
+
+import os
+import time
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.relationship_registry import (
+    RELATIONSHIP_REGISTRY_MAX,
+    load_relationship_file,
+    save_relationship_file
+)
+from app.services.session_store import SessionStore
+from app.services.text_vectors import dense_matrix
+from app.services.transcript_window import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+DIGEST_TOKEN_BUDGET = int(os.getenv("RELATIONSHIP_DIGEST_TOKENS", "400"))
+DIGEST_TTL_SECONDS = 7 * 24 * 60 * 60
+MAX_DIGEST_ITEMS = 15         # 목록별 보관 개수 (최신 순)
+MAX_DIGEST_MEETINGS = 3       # 한 줄 요약을 보관할 최근 미팅 수
+MAX_ITEM_CHARS = 100
+# 짧은 질문은 어미("얼마인가요?", "리스크는?")만으로도 0.5~0.65가 나오므로 질문 비교는 높게
+DUPLICATE_THRESHOLD = 0.7     # 이 이상 비슷하면 같은 항목(같은 질문)으로 합침
+RESOLVED_THRESHOLD = 0.45     # 후속 조치가 이후 미팅의 결정 사항과 이 이상 비슷하면 해결된 것으로 간주
+                              # (핵심 포인트는 미해결 항목을 다시 언급한 것일 수 있어 근거로 쓰지 않음)
+MAX_SEEN_MEETINGS = 5         # 항목별로 기록하는 등장 미팅 수 (반복 횟수 표시용)
+VECTOR_DIM = 2 ** 12
+NGRAM_RANGE = (2, 3)
+DIGEST_FILE_SUFFIX = ".digest"
+
+_digests = SessionStore(
+    dict,
+    ttl_seconds=DIGEST_TTL_SECONDS,
+    max_sessions=RELATIONSHIP_REGISTRY_MAX,
+    name="relationship digest"
+)
+
+
+def _clip(text: str, limit: int = MAX_ITEM_CHARS) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def _similarity(items: List[str], others: List[str]) -> np.ndarray:
+    """(len(items), len(others)) 코사인 유사도"""
+    if not items or not others:
+        return np.zeros((len(items), len(others)), dtype=np.float32)
+    matrix = dense_matrix(items + others, VECTOR_DIM, NGRAM_RANGE)
+    return matrix[:len(items)] @ matrix[len(items):].T
+
+
+def _drop_resolved(
+    items: List[Dict[str, Any]],
+    evidence: List[str],
+    threshold: float,
+    reopened: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    이번 미팅 내용과 비슷한 기존 항목 제거
+
+    Args:
+        reopened: 이번 미팅에서 다시 나온 항목 (이와 같은 항목은 근거와 비슷해도 유지 → 등장 미팅 기록 보존)
+    """
+    if not items or not evidence:
+        return items
+    texts = [item["text"] for item in items]
+    best = _similarity(texts, evidence).max(axis=1)
+    reopened = [str(text) for text in reopened or [] if text and str(text).strip()]
+    if reopened:
+        kept = _similarity(texts, reopened).max(axis=1) >= DUPLICATE_THRESHOLD
+        best = np.where(kept, 0.0, best)
+    return [item for item, score in zip(items, best) if score < threshold]
+
+
+def _merge_items(
+    items: List[Dict[str, Any]],
+    new_texts: List[str],
+    meeting_key: str,
+    meeting_date: str
+) -> List[Dict[str, Any]]:
+    """
+    새 항목을 앞에 추가 (기존/새 항목끼리 비슷하면 하나로 합치고 등장 미팅 기록)
+
+    같은 미팅을 다시 반영해도 등장 미팅이 중복 기록되지 않음
+
+    Returns:
+        최신 순 항목 리스트 (최대 MAX_DIGEST_ITEMS개)
+    """
+    new_texts = [_clip(text) for text in new_texts if text and str(text).strip()]
+    if not new_texts:
+        return items[:MAX_DIGEST_ITEMS]
+
+    texts = new_texts + [item["text"] for item in items]
+    sims = _similarity(texts, texts)
+    merged: List[Dict[str, Any]] = []
+    kept: List[int] = []
+    for i, text in enumerate(texts):
+        item = {"text": text, "date": meeting_date, "seen": [meeting_key]} if i < len(new_texts) \
+            else items[i - len(new_texts)]
+        duplicate = next((j for j, k in enumerate(kept) if sims[i, k] >= DUPLICATE_THRESHOLD), None)
+        if duplicate is None:
+            kept.append(i)
+            merged.append({**item, "seen": list(item["seen"])})
+            continue
+        # 먼저 나온(더 최신) 항목에 등장 미팅만 합침
+        seen = merged[duplicate]["seen"]
+        seen.extend(key for key in item["seen"] if key not in seen)
+        del seen[:-MAX_SEEN_MEETINGS]
+    return merged[:MAX_DIGEST_ITEMS]
+
+
+def _update_metrics(metrics: Dict[str, Any], summary: Dict[str, Any], meeting_date: str):
+    """회의에서 확인된 지표 값으로 최신 값 갱신 (모순 항목은 제외)"""
+    for delta in summary.get("dataDeltas") or []:
+        if delta.get("status") == "contradiction" or delta.get("current") is None:
+            continue
+        metrics[delta["field"]] = {
+            "label": delta.get("label") or delta["field"],
+            "value": delta["current"],
+            "date": meeting_date,
+        }
+    for field, value in (summary.get("suggestedDataUpdates") or {}).items():
+        if field in metrics and metrics[field]["date"] == meeting_date:
+            continue
+        if isinstance(value, (int, float, str)) and not isinstance(value, bool) and len(str(value)) <= 40:
+            metrics[field] = {"label": field.upper(), "value": value, "date": meeting_date}
+
+
+def render_digest(digest: Dict[str, Any], budget: int = DIGEST_TOKEN_BUDGET) -> str:
+    """
+    프롬프트용 관계 메모리 블록 (토큰 예산 안에서 섹션별로 번갈아 최신 항목부터 포함)
+    """
+    metrics = sorted(digest.get("metrics", {}).values(), key=lambda m: m["date"], reverse=True)
+    sections = [
+        ("최근 지표:", [f"- {m['label']}: {m['value']} ({m['date']})" for m in metrics]),
+        ("미해결 후속 조치:", [f"- {item['text']} ({item['date']})" for item in digest.get("action_items", [])]),
+        ("열린 질문:", [
+            f"- {item['text']}" + (f" ({len(item['seen'])}회 미팅에서 미답변)" if len(item["seen"]) > 1 else "")
+            for item in digest.get("open_questions", [])
+        ]),
+        ("이전 미팅:", [f"- [{m['date']}] {m['summary']}" for m in digest.get("meetings", [])]),
+    ]
+
+    used = 0
+    included: List[List[str]] = [[] for _ in sections]
+    depth = 0
+    progressed = True
+    while progressed:
+        progressed = False
+        for i, (heading, lines) in enumerate(sections):
+            if depth >= len(lines):
+                continue
+            cost = estimate_tokens(lines[depth]) + (estimate_tokens(heading) if depth == 0 else 0)
+            if used + cost > budget:
+                continue
+            included[i].append(lines[depth])
+            used += cost
+            progressed = True
+        depth += 1
+
+    blocks = [
+        "\n".join([heading] + lines)
+        for (heading, _), lines in zip(sections, included)
+        if lines
+    ]
+    return "\n".join(blocks)
+
+
+def _lookup(relationship_id: str) -> Optional[Dict[str, Any]]:
+    digest = _digests.get(relationship_id)
+    if digest is None:
+        digest = load_relationship_file(relationship_id, DIGEST_FILE_SUFFIX)
+        if digest is not None:
+            _digests.set(relationship_id, digest)
+    return digest
+
+
+def update_relationship_digest(
+    relationship_id: str,
+    summary: Dict[str, Any],
+    meeting_id: Optional[str] = None,
+    meeting_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    회의 요약을 관계 메모리에 반영 (요약 생성 직후 호출)
+
+    Args:
+        relationship_id: 관계 객체 ID
+        summary: generate_meeting_summary 결과 (summary, keyPoints, decisions, actionItems,
+            keyQuestions, missedQuestions, suggestedDataUpdates, dataDeltas)
+        meeting_id: 회의 ID (같은 회의를 다시 요약하면 미팅 요약을 교체)
+        meeting_date: 회의 날짜 (YYYY-MM-DD, 없으면 오늘)
+
+    Returns:
+        갱신 상태 {"relationship_id", "meeting_count", "metrics", "open_questions", "action_items", "tokens", "updated_at"}
+    """
+    meeting_date = meeting_date or date.today().isoformat()
+    meeting_key = meeting_id or meeting_date
+    digest = _lookup(relationship_id) or {
+        "relationship_id": relationship_id,
+        "meetings": [],
+        "meeting_count": 0,
+        "metrics": {},
+        "open_questions": [],
+        "action_items": [],
+    }
+
+    # 이번 미팅에서 다룬 내용으로 기존 항목 해결 처리
+    new_questions = summary.get("missedQuestions") or []
+    new_actions = summary.get("actionItems") or []
+    asked = [str(q) for q in summary.get("keyQuestions") or []]
+    decided = [str(text) for text in summary.get("decisions") or []]
+    open_questions = _drop_resolved(digest["open_questions"], asked, DUPLICATE_THRESHOLD)
+    action_items = _drop_resolved(digest["action_items"], decided, RESOLVED_THRESHOLD, new_actions)
+
+    digest["open_questions"] = _merge_items(open_questions, new_questions, meeting_key, meeting_date)
+    digest["action_items"] = _merge_items(action_items, new_actions, meeting_key, meeting_date)
+    _update_metrics(digest["metrics"], summary, meeting_date)
+
+    meetings = [m for m in digest["meetings"] if not meeting_id or m.get("meeting_id") != meeting_id]
+    if len(meetings) == len(digest["meetings"]):
+        digest["meeting_count"] += 1
+    meetings.insert(0, {
+        "meeting_id": meeting_id,
+        "date": meeting_date,
+        "summary": _clip(summary.get("summary", ""), MAX_ITEM_CHARS * 2),
+    })
+    digest["meetings"] = meetings[:MAX_DIGEST_MEETINGS]
+    digest["updated_at"] = time.time()
+    digest["rendered"] = render_digest(digest)
+
+    _digests.set(relationship_id, digest)
+    save_relationship_file(relationship_id, digest, DIGEST_FILE_SUFFIX)
+
+    status = digest_status(digest)
+    logger.info(
+        f"Relationship digest updated: {relationship_id} ({status['meeting_count']} meetings, {status['tokens']} tokens)"
+    )
+    return status
+
+
+def digest_status(digest: Dict[str, Any]) -> Dict[str, Any]:
+    """관계 메모리 상태 (외부 응답용)"""
+    return {
+        "relationship_id": digest["relationship_id"],
+        "meeting_count": digest["meeting_count"],
+        "metrics": len(digest["metrics"]),
+        "open_questions": len(digest["open_questions"]),
+        "action_items": len(digest["action_items"]),
+        "tokens": estimate_tokens(digest.get("rendered", "")),
+        "updated_at": digest.get("updated_at"),
+    }
+
+
+def get_digest_block(relationship_id: str) -> str:
+    """프롬프트용 관계 메모리 블록 (없으면 빈 문자열)"""
+    digest = _lookup(relationship_id)
+    return digest.get("rendered", "") if digest else ""
+
+
+def get_relationship_digest(relationship_id: str) -> Optional[Dict[str, Any]]:
+    """관계 메모리 전체 (없으면 None)"""
+    digest = _lookup(relationship_id)
+    if digest is None:
+        return None
+    result = digest_status(digest)
+    result["digest"] = digest.get("rendered", "")
+    result["data"] = {key: digest[key] for key in ("metrics", "open_questions", "action_items", "meetings")}
+    return result
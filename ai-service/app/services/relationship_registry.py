@@ -0,0 +1,170 @@
+"""
+관계 맥락 레지스트리 (Relationship Registry)
+- 백엔드가 관계 맥락(이름, 구조화 데이터, 이전 미팅 히스토리)을 ID + 버전으로 한 번 등록하면
+  질문 요청은 relationship_id + 버전만 전송 (요청 크기 / 검증 비용이 히스토리 길이와 무관)
+- 메모리는 TTL + LRU로 상한 유지, RELATIONSHIP_REGISTRY_DIR을 지정하면 로컬 파일에도 저장해
+  재시작/제거 후에도 다시 로드
+- 버전이 일치하지 않으면 캐시 미스 → 호출자는 요청에 포함된 전체 payload로 대체
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+RELATIONSHIP_REGISTRY_MAX = int(os.getenv("RELATIONSHIP_REGISTRY_MAX", "1000"))
+RELATIONSHIP_REGISTRY_TTL_SECONDS = 24 * 60 * 60
+# 비어 있으면 메모리에만 보관
+RELATIONSHIP_REGISTRY_DIR = os.getenv("RELATIONSHIP_REGISTRY_DIR", "")
+
+
+class StaleRelationshipVersion(Exception):
+    """등록된 버전보다 오래된 버전으로 갱신 시도"""
+
+
+_registry = SessionStore(
+    dict,
+    ttl_seconds=RELATIONSHIP_REGISTRY_TTL_SECONDS,
+    max_sessions=RELATIONSHIP_REGISTRY_MAX,
+    name="relationship registry"
+)
+_stats = {"hits": 0, "misses": 0, "version_mismatches": 0, "registered": 0, "disk_loads": 0}
+
+
+def _entry_path(relationship_id: str, suffix: str = "") -> Optional[Path]:
+    """저장 파일 경로 (ID는 해시해서 파일 이름으로 사용)"""
+    if not RELATIONSHIP_REGISTRY_DIR:
+        return None
+    name = hashlib.sha256(relationship_id.encode("utf-8")).hexdigest()[:32]
+    return Path(RELATIONSHIP_REGISTRY_DIR) / f"{name}{suffix}.json"
+
+
+def save_relationship_file(relationship_id: str, data: Dict[str, Any], suffix: str = ""):
+    """관계별 데이터를 로컬 파일에 저장 (RELATIONSHIP_REGISTRY_DIR 미지정 시 무시)"""
+    path = _entry_path(relationship_id, suffix)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Relationship file save failed ({relationship_id}{suffix}): {e}")
+
+
+def load_relationship_file(relationship_id: str, suffix: str = "") -> Optional[Dict[str, Any]]:
+    """save_relationship_file로 저장한 데이터 (없거나 읽을 수 없으면 None)"""
+    path = _entry_path(relationship_id, suffix)
+    if path is None or not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Relationship file load failed ({relationship_id}{suffix}): {e}")
+        return None
+    return data if data.get("relationship_id") == relationship_id else None
+
+
+def _load(relationship_id: str) -> Optional[Dict[str, Any]]:
+    entry = load_relationship_file(relationship_id)
+    if entry is None:
+        return None
+    _stats["disk_loads"] += 1
+    _registry.set(relationship_id, entry)
+    return entry
+
+
+def _lookup(relationship_id: str) -> Optional[Dict[str, Any]]:
+    entry = _registry.get(relationship_id)
+    return entry if entry is not None else _load(relationship_id)
+
+
+def register_relationship(relationship_id: str, version: int, relationship: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    관계 맥락 등록/갱신
+
+    Args:
+        relationship_id: 관계 객체 ID
+        version: 관계 맥락 버전 (변경될 때마다 증가)
+        relationship: 검증된 관계 맥락 {name, type, industry, stage, notes,
+            structured_data, meeting_number, recent_meetings}
+
+    Returns:
+        {"relationship_id", "version", "updated"} (같은 버전 재등록이면 updated=False)
+
+    Raises:
+        StaleRelationshipVersion: 등록된 버전보다 오래된 버전
+    """
+    current = _lookup(relationship_id)
+    if current is not None:
+        if version < current["version"]:
+            raise StaleRelationshipVersion(
+                f"relationship {relationship_id} is at version {current['version']} (got {version})"
+            )
+        if version == current["version"] and current["relationship"] == relationship:
+            return {"relationship_id": relationship_id, "version": version, "updated": False}
+
+    entry = {
+        "relationship_id": relationship_id,
+        "version": version,
+        "relationship": relationship,
+        "registered_at": time.time(),
+    }
+    _registry.set(relationship_id, entry)
+    save_relationship_file(relationship_id, entry)
+    _stats["registered"] += 1
+    logger.info(f"Relationship registered: {relationship_id} v{version}")
+    return {"relationship_id": relationship_id, "version": version, "updated": True}
+
+
+def get_relationship(relationship_id: str, version: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    등록된 관계 맥락 조회
+
+    Args:
+        relationship_id: 관계 객체 ID
+        version: 기대하는 버전 (None이면 최신)
+
+    Returns:
+        관계 맥락 dict (없거나 버전이 다르면 None)
+    """
+    entry = _lookup(relationship_id)
+    if entry is None:
+        _stats["misses"] += 1
+        return None
+    if version is not None and entry["version"] != version:
+        _stats["version_mismatches"] += 1
+        return None
+    _stats["hits"] += 1
+    return entry["relationship"]
+
+
+def relationship_status(relationship_id: str) -> Optional[Dict[str, Any]]:
+    """등록 상태 (버전, 등록 시각), 없으면 None"""
+    entry = _lookup(relationship_id)
+    if entry is None:
+        return None
+    return {
+        "relationship_id": relationship_id,
+        "version": entry["version"],
+        "registered_at": entry["registered_at"],
+    }
+
+
+def get_registry_metrics() -> Dict[str, Any]:
+    """레지스트리 적중률 (메트릭 엔드포인트용)"""
+    lookups = _stats["hits"] + _stats["misses"] + _stats["version_mismatches"]
+    return {
+        **_stats,
+        "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        "cached": len(_registry),
+        "persistent": bool(RELATIONSHIP_REGISTRY_DIR),
+    }
@@ -0,0 +1,222 @@
+"""
+화자 역할 분류기 (Role Classifier)
+- 문자 n-gram 해싱 벡터 + 로지스틱 회귀 (투자자 vs 창업자)
+- 가중치는 작은 .npz 파일 하나로 저장, 서비스 시작 시 로드하고 NumPy만으로 추론
+- speaker_analyzer는 정규식 점수로 판정되지 않은 발화에만 사용 (확신이 낮거나 모델 파일이 없으면 None)
+- 편향(bias)은 학습 데이터의 클래스 비율로 고정 → 학습 데이터와 겹치는 n-gram이 적은 발화
+  ("오늘 날씨가 참 좋네요")는 0.5 근처로 남아 판단 보류
+- 학습 데이터: mock_data 세그먼트 + 라벨링된 시드 발화 + 내보낸 회의 전사 (text, speakerRole)
+
+학습 방법:
+    cd ai-service
+    python -m app.services.role_classifier [exported_transcripts.jsonl ...]
+"""
+
+import os
+import sys
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.text_vectors import DEFAULT_DIM, DEFAULT_NGRAM_RANGE, dense_matrix, sparse_rows, sparse_vector
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = Path(__file__).parent.parent / "models"
+MODEL_PATH = os.getenv("ROLE_CLASSIFIER_PATH", str(MODELS_DIR / "role_classifier.npz"))
+SEED_PATH = MODELS_DIR / "role_training_seed.jsonl"
+
+# 투자자 확률이 이 값 이상이면 investor, 1 - 이 값 이하이면 founder, 그 사이는 판단 보류
+CONFIDENCE_THRESHOLD = float(os.getenv("ROLE_CLASSIFIER_THRESHOLD", "0.75"))
+
+# 학습 하이퍼파라미터 (학습 데이터가 작아 규제를 강하게: 어미 n-gram 하나로 확신하지 않도록)
+TRAIN_EPOCHS = 400
+LEARNING_RATE = 2.0
+L2_PENALTY = 7e-3
+
+# 라벨 (speakerRole 값 → 투자자 여부)
+ROLE_LABELS = {"INVESTOR": 1, "FOUNDER": 0}
+
+# mock_data 화자 이름 → 라벨
+MOCK_SPEAKER_LABELS = {"투자자": 1, "대표": 0, "화자1": 1, "화자2": 0}
+
+
+# ============ 추론 ============
+
+def load_model(path: str = MODEL_PATH) -> Optional[Dict]:
+    """저장된 가중치 로드 (없거나 읽을 수 없으면 None)"""
+    try:
+        with np.load(path) as data:
+            model = {
+                "weights": data["weights"].astype(np.float32),
+                "bias": float(data["bias"]),
+                "dim": int(data["dim"]),
+                "ngram_range": tuple(int(n) for n in data["ngram_range"]),
+            }
+    except FileNotFoundError:
+        logger.warning(f"Role classifier model not found: {path} (regex heuristic only)")
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load role classifier model: {e}")
+        return None
+
+    logger.info(f"Role classifier loaded: dim={model['dim']}, ngram_range={model['ngram_range']}")
+    return model
+
+
+_model = load_model()
+
+
+def predict_investor_proba(text: str, model: Optional[Dict] = None) -> Optional[float]:
+    """
+    발화가 투자자 발화일 확률
+
+    Returns:
+        0~1 확률, 모델이 없으면 None
+    """
+    model = model or _model
+    if model is None:
+        return None
+    indices, values = sparse_vector(text, model["dim"], model["ngram_range"])
+    z = float(model["weights"][indices] @ values) + model["bias"]
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def predict_investor_proba_batch(texts: List[str], model: Optional[Dict] = None) -> Optional[np.ndarray]:
+    """
+    여러 발화의 투자자 확률 (한 번의 벡터화로 계산, 긴 전사 배치 분석용)
+
+    Returns:
+        (len(texts),) 확률 배열, 모델이 없으면 None
+    """
+    model = model or _model
+    if model is None:
+        return None
+    rows, indices, values = sparse_rows(texts, model["dim"], model["ngram_range"])
+    z = np.bincount(rows, weights=model["weights"][indices] * values, minlength=len(texts)) + model["bias"]
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def classify_role(text: str, model: Optional[Dict] = None) -> Optional[str]:
+    """
+    분류기 기반 역할
+
+    Returns:
+        'investor' | 'founder', 확신이 낮거나 모델이 없으면 None
+    """
+    proba = predict_investor_proba(text, model)
+    if proba is None:
+        return None
+    if proba >= CONFIDENCE_THRESHOLD:
+        return "investor"
+    if proba <= 1.0 - CONFIDENCE_THRESHOLD:
+        return "founder"
+    return None
+
+
+# ============ 학습 ============
+
+def load_samples(paths: List[str]) -> List[Tuple[str, int]]:
+    """
+    내보낸 전사 파일에서 (텍스트, 라벨) 로드
+
+    JSON 배열 또는 JSONL, 각 항목은 {"text": ..., "speakerRole": "INVESTOR" | "FOUNDER"}
+    (UNKNOWN 등 다른 역할은 제외)
+    """
+    samples = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            content = f.read().strip()
+        if content.startswith("["):
+            items = json.loads(content)
+        else:
+            items = [json.loads(line) for line in content.splitlines() if line.strip()]
+
+        for item in items:
+            label = ROLE_LABELS.get(str(item.get("speakerRole") or item.get("speaker_role") or "").upper())
+            text = (item.get("text") or "").strip()
+            if label is not None and text:
+                samples.append((text, label))
+    return samples
+
+
+def builtin_samples() -> List[Tuple[str, int]]:
+    """저장소에 포함된 학습 데이터 (mock_data 세그먼트 + 시드 발화)"""
+    from app.services.mock_data import MOCK_TRANSCRIPT_SEGMENTS
+
+    samples = []
+    for sample in MOCK_TRANSCRIPT_SEGMENTS:
+        for segment in sample["segments"]:
+            label = MOCK_SPEAKER_LABELS.get(segment.get("speaker"))
+            if label is not None:
+                samples.append((segment["text"], label))
+
+    if SEED_PATH.exists():
+        samples.extend(load_samples([str(SEED_PATH)]))
+    return samples
+
+
+def train(
+    samples: List[Tuple[str, int]],
+    dim: int = DEFAULT_DIM,
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+    epochs: int = TRAIN_EPOCHS,
+    learning_rate: float = LEARNING_RATE,
+    l2: float = L2_PENALTY
+) -> Dict:
+    """
+    로지스틱 회귀 학습 (전체 배치 경사 하강법, NumPy, 편향은 클래스 비율의 로그 오즈로 고정)
+
+    Args:
+        samples: [(텍스트, 1=투자자 | 0=창업자), ...]
+
+    Returns:
+        load_model과 같은 형식의 모델 dict
+    """
+    texts = [text for text, _ in samples]
+    y = np.array([label for _, label in samples], dtype=np.float32)
+    X = dense_matrix(texts, dim, ngram_range)
+
+    weights = np.zeros(dim, dtype=np.float32)
+    positive = float(np.clip(y.mean(), 0.01, 0.99))
+    bias = float(np.log(positive / (1.0 - positive)))
+    for _ in range(epochs):
+        p = 1.0 / (1.0 + np.exp(-(X @ weights + bias)))
+        error = p - y
+        weights -= learning_rate * (X.T @ error / len(y) + l2 * weights)
+
+    return {"weights": weights, "bias": bias, "dim": dim, "ngram_range": tuple(ngram_range)}
+
+
+def save_model(model: Dict, path: str = MODEL_PATH):
+    """가중치를 압축 .npz 파일로 저장"""
+    np.savez_compressed(
+        path,
+        weights=model["weights"].astype(np.float32),
+        bias=np.float32(model["bias"]),
+        dim=np.int32(model["dim"]),
+        ngram_range=np.array(model["ngram_range"], dtype=np.int32),
+    )
+
+
+def main(export_paths: List[str]):
+    samples = builtin_samples() + load_samples(export_paths)
+    investors = sum(label for _, label in samples)
+    print(f"Training on {len(samples)} samples ({investors} investor, {len(samples) - investors} founder)")
+
+    model = train(samples)
+    correct = sum(
+        (predict_investor_proba(text, model) >= 0.5) == bool(label)
+        for text, label in samples
+    )
+    print(f"Training accuracy: {correct / len(samples):.1%}")
+
+    save_model(model)
+    print(f"Saved: {MODEL_PATH} ({os.path.getsize(MODEL_PATH):,} bytes)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,217 @@
+"""
+회의 중 누적 요약 (Rolling Summary)
+- 회의 진행 중 전사를 받아 일정 분량(시간/토큰)이 쌓일 때마다 새 구간만 백그라운드로 요약에 반영
+- 회의 종료 시 최종 요약은 누적 요약 + 아직 반영되지 않은 짧은 꼬리 원문만 사용
+  → 종료 시 요약 지연이 회의 길이와 무관하게 거의 일정
+- 갱신 실패 시 해당 구간은 꼬리 원문으로 남아 최종 요약에서 처리됨
+"""
+
+import os
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.json_parser import CHUNK_SUMMARY_SCHEMA, parse_llm_json
+from app.services.llm_gateway import openai_chat
+from app.services.model_router import route
+from app.services.session_store import SessionStore
+from app.services.transcript_window import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 이만큼 새 전사가 쌓이면 누적 요약 갱신 (전사 시간 기준, 시간 정보가 없으면 토큰 기준)
+ROLLING_SUMMARY_INTERVAL_SECONDS = float(os.getenv("ROLLING_SUMMARY_INTERVAL_SECONDS", "300"))
+ROLLING_SUMMARY_INTERVAL_TOKENS = int(os.getenv("ROLLING_SUMMARY_INTERVAL_TOKENS", "1500"))
+MAX_STATE_ITEMS = 10  # 누적 요약 항목별 최대 개수
+
+ROLLING_SUMMARY_PROMPT = """진행 중인 투자 미팅의 누적 요약을 갱신하세요.
+
+## 지금까지의 누적 요약:
+{previous}
+
+## 새로 진행된 대화:
+{transcript}
+
+## 출력 형식 (JSON):
+{{
+    "summary": "지금까지 회의 전체 요약 (3-4문장, 언급된 숫자/지표는 그대로 유지)",
+    "key_points": ["핵심 포인트", ...],
+    "decisions": ["결정 사항", ...],
+    "action_items": ["후속 조치", ...],
+    "open_questions": ["아직 답변되지 않은 질문", ...]
+}}
+
+주의사항:
+1. 기존 요약 내용을 유지하면서 새 대화 내용을 반영하세요
+2. 새 대화에서 답변된 질문은 open_questions에서 제거하세요
+3. 각 목록은 중요한 순서로 최대 {max_items}개까지만 작성하세요
+
+JSON만 출력하세요."""
+
+
+class RollingSummary:
+    """
+    회의별 누적 요약 상태
+
+    전사는 도착 순서대로 쌓고, 앞에서부터 summarized개의 발화는 state에 반영된 상태
+    """
+
+    def __init__(self):
+        self.lines: deque = deque()  # 아직 요약에 반영되지 않은 (발화, 토큰, 시작 시간)
+        self.pending_tokens = 0
+        self.received = 0
+        self.summarized = 0
+        self.last_summarized_line = ""
+        self.state: Dict[str, Any] = {}
+        self.updates = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def ingest(self, lines: List[str], start_times: Optional[List[Optional[float]]] = None):
+        """
+        새 발화 추가 (회의 진행 중 증분 전송)
+
+        Args:
+            lines: "[화자]: 발화" 형식의 새 발화 리스트
+            start_times: 발화별 시작 시간 (초, 선택)
+        """
+        start_times = start_times or [None] * len(lines)
+        for line, start_time in zip(lines, start_times):
+            tokens = estimate_tokens(line)
+            self.lines.append((line, tokens, start_time))
+            self.pending_tokens += tokens
+            self.received += 1
+
+    def needs_update(self) -> bool:
+        """새 구간이 갱신 간격을 넘었는지 (전사 시간 우선, 없으면 토큰 수)"""
+        if not self.lines:
+            return False
+        first, last = self.lines[0][2], self.lines[-1][2]
+        if first is not None and last is not None and last - first >= ROLLING_SUMMARY_INTERVAL_SECONDS:
+            return True
+        return self.pending_tokens >= ROLLING_SUMMARY_INTERVAL_TOKENS
+
+    def schedule_update(self):
+        """필요 시 백그라운드로 누적 요약 갱신 (요청 경로를 막지 않음, 동시에 하나만)"""
+        if not self.needs_update():
+            return
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self.update())
+
+    async def update(self):
+        """대기 중인 발화(갱신 구간 크기까지)를 누적 요약에 반영"""
+        decision = route("summary_chunk", "deep_dive")
+        batch = []
+        used = 0
+        for line, tokens, _ in self.lines:
+            if batch and used + tokens > decision["transcript_tokens"]:
+                break
+            batch.append(line)
+            used += tokens
+        if not batch:
+            return
+
+        prompt = ROLLING_SUMMARY_PROMPT.format(
+            previous=render_state(self.state) or "없음",
+            transcript="\n".join(batch),
+            max_items=MAX_STATE_ITEMS,
+        )
+        try:
+            response = await openai_chat(
+                model=decision["model"],
+                messages=[
+                    {"role": "system", "content": "You are a meeting summarization expert. Always respond in valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=decision["max_tokens"],
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "rolling_meeting_summary",
+                        "schema": CHUNK_SUMMARY_SCHEMA,
+                    },
+                },
+                deadline=decision["deadline"],
+            )
+            state = parse_llm_json(response.choices[0].message.content or "", CHUNK_SUMMARY_SCHEMA, "openai_rolling_summary")
+        except Exception as e:
+            logger.warning(f"Rolling summary update failed: {e}")
+            return
+        if state is None:
+            return
+
+        # 갱신 중 도착한 발화는 그대로 두고 반영된 구간만 제거
+        for _ in batch:
+            _, tokens, _ = self.lines.popleft()
+            self.pending_tokens -= tokens
+        self.state = {
+            key: value[:MAX_STATE_ITEMS] if isinstance(value, list) else value
+            for key, value in state.items()
+        }
+        self.summarized += len(batch)
+        self.last_summarized_line = batch[-1]
+        self.updates += 1
+        logger.info(f"Rolling summary updated: {self.summarized} utterances summarized, {len(self.lines)} pending")
+
+        # 밀린 구간이 남아 있으면 이어서 갱신
+        self._task = None
+        self.schedule_update()
+
+    def split(self, lines: List[str]) -> Tuple[str, List[str]]:
+        """
+        최종 요약용 (누적 요약 텍스트, 아직 반영되지 않은 꼬리 발화)
+
+        전달된 전체 전사가 누적 상태와 맞지 않으면 (재시작, 누락 등) 누적 요약 없이 전체 반환
+        (진행 중인 갱신은 기다리지 않음 - 해당 구간은 꼬리 원문에 포함됨)
+        """
+        if not self.summarized or len(lines) < self.summarized:
+            return "", lines
+        if lines[self.summarized - 1] != self.last_summarized_line:
+            logger.warning("Rolling summary does not match transcripts, summarizing from scratch")
+            return "", lines
+        return render_state(self.state), lines[self.summarized:]
+
+    def status(self) -> Dict[str, Any]:
+        """누적 요약 진행 상태"""
+        return {
+            "received": self.received,
+            "summarized": self.summarized,
+            "pending": len(self.lines),
+            "pending_tokens": self.pending_tokens,
+            "updates": self.updates,
+            "updating": bool(self._task and not self._task.done()),
+        }
+
+
+def render_state(state: Dict[str, Any]) -> str:
+    """누적 요약 상태를 프롬프트용 텍스트로 변환"""
+    if not state:
+        return ""
+    lines = [state.get("summary", "")]
+    for key, label in [
+        ("key_points", "핵심"),
+        ("decisions", "결정"),
+        ("action_items", "후속 조치"),
+        ("open_questions", "미해결 질문"),
+    ]:
+        items = state.get(key) or []
+        if items:
+            lines.append(f"{label}: " + " / ".join(items))
+    return "\n".join(lines)
+
+
+# 회의별 누적 요약
+_rolling = SessionStore(RollingSummary, name="rolling summary")
+
+
+def get_rolling_summary(meeting_id: str) -> RollingSummary:
+    """회의 ID에 해당하는 누적 요약 (없으면 생성)"""
+    return _rolling.get_or_create(meeting_id)
+
+
+def peek_rolling_summary(meeting_id: str) -> Optional[RollingSummary]:
+    """회의 ID에 해당하는 누적 요약 (없으면 None)"""
+    return _rolling.get(meeting_id)
+
@@ -0,0 +1,214 @@
+"""
+전사 문장 인덱스 (Transcript Sentence Index)
+- 키워드/지표 필터(RedundancyIndex)는 질문에 용어가 그대로 있어야만 걸러짐
+  → "고객 획득 비용은 얼마인가요?"처럼 표현이 달라도 전사에 이미 답이 있는 질문을 로컬에서 제외
+- 답변 쪽 문장만 색인: 질문/요청 문장, 투자자 발화, 답을 미루는 문장("아직 정하지 못했습니다")은 제외
+  (질문을 그대로 색인하면 질문을 한 번 물어본 것만으로 답변된 것으로 걸러짐)
+- 회의별로 전사 문장의 문자 n-gram 해싱 벡터(text_vectors)를 증분으로 추가하는 비트 행렬
+  - (특징, 문장) 방향으로 문장 8개당 1바이트로 보관 → 질문의 특징 행만 풀어 행렬곱 한 번에 전체 문장 점수 계산
+  - 용량은 두 배씩 늘리고, 상한을 넘으면 오래된 문장부터 제거
+  - 문장 수 상한은 프로세스 전체 메모리 예산(INDEX_MEMORY_MB)을 회의 세션 상한(MAX_INDEXES)으로 나눠 정함
+- 점수는 질문 포괄률: 질문 어미("~은 얼마인가요?")를 뗀 핵심 n-gram 가중치 중 문장에 있는 비율
+  (질문과 답변 문장은 길이/어미가 달라 코사인 유사도로는 답변 여부가 잘 구분되지 않음)
+"""
+
+import os
+import re
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.speaker_analyzer import estimate_speaker_role
+from app.services.text_vectors import sparse_rows
+
+logger = logging.getLogger(__name__)
+
+VECTOR_DIM = 2 ** 12           # 2 ** 11은 긴 문장의 해시 충돌로 무관한 질문 점수가 올라감
+NGRAM_RANGE = (2, 3)
+MIN_SENTENCE_CHARS = 8         # 이보다 짧은 문장("네.", "감사합니다.")은 제외
+MAX_SENTENCE_CHARS = 150       # 문장부호 없는 긴 전사는 이 길이 단위로 나눔 (긴 문장일수록 포괄률이 쉽게 높아짐)
+MIN_QUESTION_CHARS = 4         # 어미를 뗀 핵심 부분이 이보다 짧으면 ("LTV") 키워드 필터에 맡김
+MAX_INDEXES = 500              # 동시에 보관하는 인덱스 수 (context_analyzer의 회의 세션 상한)
+INDEX_MEMORY_MB = int(os.getenv("SENTENCE_INDEX_MEMORY_MB", "512"))  # 전체 인덱스 합계 상한
+# 회의별 보관 문장 수 (8의 배수, 기본 2096 ≈ 1MB, 답변 문장 기준 3시간 이상 분량)
+MAX_SENTENCES = max(64, INDEX_MEMORY_MB * 2 ** 20 * 8 // (VECTOR_DIM * MAX_INDEXES) // 8 * 8)
+INITIAL_CAPACITY = 256         # 8의 배수
+ANSWERED_THRESHOLD = 0.5       # 질문 포괄률이 이 이상인 문장이 있으면 이미 답변된 질문
+TOP_K = 3
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+# 질문 어미 (조사 + 의문사 + 의문형 어미) - 모든 질문에 공통이라 답변 여부와 무관
+_QUESTION_ENDING_RE = re.compile(
+    r'(은|는|이|가|을|를|의|에|에서|으로|로)?\s*'
+    r'(얼마나|얼마|어떻게|어느\s*정도|무엇|언제|누구|어디에|어디|몇)?\s*'
+    r'(\S*(나요|까요|가요|세요|니까|인지|는지))?\s*\?*\s*$'
+)
+# 질문/요청으로 끝나는 문장 ("?" 없이 전사된 질문 포함)
+_QUESTION_SENTENCE_RE = re.compile(
+    r'(\?|(나요|까요|가요|니까|는지요|인지요|주세요|주시겠어요|궁금합니다|궁금해요)[.!]?)\s*$'
+)
+# 답을 미루거나 정해지지 않았다는 문장 ("지금 고민하고 있는 게 가격 정책인데요")
+_NON_ANSWER_RE = re.compile(
+    r'고민(하고|하는|중|이)|검토\s*중|검토하고\s*있|미정|아직\s*(안\s*)?(정하|정해|결정|확정|모르|없)|'
+    r'(정하|결정하)지\s*못|모르겠|(추후|나중)에?\s*(공유|말씀|안내|알려)|확인해\s*(보고|드리)'
+)
+
+_stats = {"checked": 0, "answered": 0, "total_us": 0.0, "max_us": 0.0}
+
+
+def split_sentences(text: str) -> List[str]:
+    """전사 텍스트를 문장 단위로 분리 (짧은 문장 제외, 긴 문장은 단어 경계에서 나눔)"""
+    sentences = []
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        sentence = sentence.strip()
+        while len(sentence) > MAX_SENTENCE_CHARS:
+            cut = sentence.rfind(" ", 0, MAX_SENTENCE_CHARS)
+            cut = cut if cut > MAX_SENTENCE_CHARS // 2 else MAX_SENTENCE_CHARS
+            sentences.append(sentence[:cut])
+            sentence = sentence[cut:].strip()
+        if len(sentence) >= MIN_SENTENCE_CHARS:
+            sentences.append(sentence)
+    return sentences
+
+
+def is_answer_sentence(sentence: str) -> bool:
+    """답변으로 색인할 문장인지 (질문/요청, 투자자 발화, 답을 미루는 문장 제외)"""
+    if _QUESTION_SENTENCE_RE.search(sentence) or _NON_ANSWER_RE.search(sentence):
+        return False
+    return estimate_speaker_role(sentence, use_classifier=False) != "investor"
+
+
+def question_core(question: str) -> str:
+    """질문 어미를 뗀 핵심 부분 ("CAC 회수 기간은 얼마나 되나요?" → "CAC 회수 기간")"""
+    question = question.strip()
+    return _QUESTION_ENDING_RE.sub("", question) or question
+
+
+class SentenceIndex:
+    """
+    회의 전사 문장 인덱스
+
+    문장마다 해싱 n-gram 존재 여부(0/1)를 (특징, 문장) 비트 행렬의 열로 보관 (문장 축으로 8비트씩 압축)
+    질문 점수 = 질문 벡터 제곱 가중치(합 1) @ 문장 열 → 질문 n-gram 중 문장에 있는 비율
+    """
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self._bits = np.zeros((VECTOR_DIM, INITIAL_CAPACITY // 8), dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bits.nbytes
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, text: str):
+        """전사 청크의 답변 문장 추가"""
+        sentences = [s for s in split_sentences(text) if is_answer_sentence(s)][-MAX_SENTENCES:]
+        if not sentences:
+            return
+
+        overflow = len(self.texts) + len(sentences) - MAX_SENTENCES
+        if overflow > 0:
+            # 한 번에 1/4씩 제거해 행렬 이동 횟수를 줄임
+            self._drop_oldest(max(overflow, MAX_SENTENCES // 4))
+
+        size = len(self.texts)
+        if size + len(sentences) > self._bits.shape[1] * 8:
+            capacity = self._bits.shape[1] * 8
+            while capacity < size + len(sentences):
+                capacity *= 2
+            grown = np.zeros((VECTOR_DIM, min(capacity, MAX_SENTENCES) // 8), dtype=np.uint8)
+            grown[:, :self._bits.shape[1]] = self._bits
+            self._bits = grown
+
+        rows, indices, _ = sparse_rows(sentences, VECTOR_DIM, NGRAM_RANGE)
+        columns = size + rows
+        np.bitwise_or.at(self._bits, (indices, columns >> 3), (128 >> (columns & 7)).astype(np.uint8))
+        self.texts.extend(sentences)
+
+    def _drop_oldest(self, count: int):
+        """오래된 문장 제거 (바이트 단위로 옮기도록 8의 배수로 올림)"""
+        size = len(self.texts)
+        count = min(-(-count // 8) * 8, size)
+        used = -(-size // 8)
+        shift = count // 8
+        self._bits[:, :used - shift] = self._bits[:, shift:used]
+        self._bits[:, used - shift:used] = 0
+        del self.texts[:count]
+
+    def search(self, questions: List[str], k: int = TOP_K) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        질문별 포괄률 상위 k개 문장
+
+        Returns:
+            (점수 (질문 수, k), 문장 번호 (질문 수, k)) - 점수 내림차순, 문장이 k개보다 적으면 그만큼만
+        """
+        size = len(self.texts)
+        k = min(k, size)
+        if not questions or not k:
+            return np.zeros((len(questions), 0), dtype=np.float32), np.zeros((len(questions), 0), dtype=np.intp)
+
+        cores = [question_core(q) for q in questions]
+        rows, indices, values = sparse_rows(cores, VECTOR_DIM, NGRAM_RANGE)
+        short = np.fromiter((len(c) < MIN_QUESTION_CHARS for c in cores), dtype=bool, count=len(cores))
+        # 질문들이 쓰는 특징 행만 모아 (질문 수, 특징 수) @ (특징 수, 문장 수)
+        columns, inverse = np.unique(indices, return_inverse=True)
+        weights = np.zeros((len(questions), len(columns)), dtype=np.float32)
+        weights[rows, inverse] = values * values
+        weights[short] = 0
+        present = np.unpackbits(self._bits[columns, :-(-size // 8)], axis=1, count=size)
+        scores = weights @ present.astype(np.float32)
+
+        if k < size:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(size), (len(questions), size))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        return np.take_along_axis(top_scores, order, axis=1), np.take_along_axis(top, order, axis=1)
+
+    def answered(self, questions: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        질문별 답변 여부 확인
+
+        Returns:
+            질문별 {"type": "answered", "matched": 답변 문장, "similarity": 포괄률} 또는 None
+        """
+        if not questions or not self.texts:
+            return [None] * len(questions)
+        start = time.perf_counter()
+
+        scores, top = self.search([str(q.get("text") or "") for q in questions], k=1)
+        reasons: List[Optional[Dict[str, Any]]] = []
+        for score, sentence in zip(scores[:, 0], top[:, 0]):
+            if score >= ANSWERED_THRESHOLD:
+                reasons.append({
+                    "type": "answered",
+                    "matched": self.texts[sentence],
+                    "similarity": round(float(score), 3),
+                })
+            else:
+                reasons.append(None)
+
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        _stats["checked"] += len(questions)
+        _stats["answered"] += sum(reason is not None for reason in reasons)
+        _stats["total_us"] += elapsed_us
+        _stats["max_us"] = max(_stats["max_us"], elapsed_us)
+        return reasons
+
+
+def get_answered_check_metrics() -> Dict[str, Any]:
+    """답변 여부 확인 통계 (메트릭 엔드포인트용)"""
+    checked = _stats["checked"]
+    return {
+        "checked": checked,
+        "answered": _stats["answered"],
+        "answered_rate": round(_stats["answered"] / checked, 3) if checked else 0.0,
+        "avg_us_per_question": round(_stats["total_us"] / checked, 1) if checked else 0.0,
+        "max_us": round(_stats["max_us"], 1),
+    }
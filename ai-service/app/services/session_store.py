@@ -0,0 +1,130 @@
+"""
+회의별 인메모리 상태 저장소
+- 회의 ID 기준으로 상태 객체 보관
+- TTL 만료 + 최대 개수(LRU) 기반 제거로 메모리 상한 유지
+- 회의 상태에 이미 반영한 전사 청크 판별 (마지막으로 반영한 청크 위치 기준)
+"""
+
+import time
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CHUNK_CURSOR_CONTEXT = 8  # 반영 위치를 맞출 때 비교하는 최근 청크 수
+
+
+class SessionStore:
+    """
+    TTL + LRU 기반 회의 상태 저장소
+
+    Args:
+        factory: 새 상태 객체 생성 함수 (get_or_create에서 사용)
+        ttl_seconds: 마지막 접근 후 만료까지의 시간 (초)
+        max_sessions: 동시에 보관할 최대 상태 개수
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        ttl_seconds: float = 3 * 60 * 60,
+        max_sessions: int = 500,
+        name: str = "session"
+    ):
+        self.factory = factory
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.name = name
+        self._items: "OrderedDict[str, list]" = OrderedDict()  # key -> [value, last_access]
+
+    def _evict(self):
+        """만료된 항목과 상한을 넘는 오래된 항목 제거"""
+        now = time.monotonic()
+        expired = [k for k, (_, ts) in self._items.items() if now - ts > self.ttl_seconds]
+        for key in expired:
+            del self._items[key]
+
+        while len(self._items) > self.max_sessions:
+            key, _ = self._items.popitem(last=False)
+            expired.append(key)
+
+        if expired:
+            logger.info(f"Evicted {len(expired)} {self.name} entries")
+
+    def get(self, key: str) -> Optional[Any]:
+        """상태 조회 (없거나 만료되었으면 None)"""
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() - entry[1] > self.ttl_seconds:
+            del self._items[key]
+            return None
+
+        entry[1] = time.monotonic()
+        self._items.move_to_end(key)
+        return entry[0]
+
+    def get_or_create(self, key: str) -> Any:
+        """상태 조회, 없으면 factory로 생성"""
+        value = self.get(key)
+        if value is None:
+            value = self.factory()
+            self.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any):
+        """상태 저장"""
+        self._items[key] = [value, time.monotonic()]
+        self._items.move_to_end(key)
+        self._evict()
+
+    def pop(self, key: str) -> Optional[Any]:
+        """상태 제거 후 반환"""
+        entry = self._items.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self):
+        """모든 상태 제거"""
+        self._items.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class ChunkCursor:
+    """
+    회의 상태에 마지막으로 반영한 전사 청크 위치
+
+    클라이언트는 누적 리스트, 고정 크기 윈도우, 현재 청크만 등 여러 형태로 전사를 보내므로
+    리스트 길이 대신 마지막으로 반영한 청크들(최근 CHUNK_CURSOR_CONTEXT개)과 맞춰 그 뒤 청크만 새 청크로 판별
+    (같은 내용의 짧은 청크 "네."가 반복되어도 앞 청크들로 위치를 구분, 비용은 새 청크 수에 비례)
+    현재 청크만 보낼 때 직전 청크와 똑같은 청크는 재전송으로 간주
+    """
+
+    def __init__(self, context: int = CHUNK_CURSOR_CONTEXT):
+        self._last: deque = deque(maxlen=context)
+
+    def take_new(self, transcripts: List[str]) -> List[str]:
+        """마지막으로 반영한 청크 이후의 청크 (순서 유지, 반환한 청크는 반영한 것으로 기록)"""
+        new = transcripts[self._position(transcripts):]
+        self._last.extend(new)
+        return new
+
+    def _position(self, transcripts: List[str]) -> int:
+        """마지막으로 반영한 청크 바로 다음 위치 (리스트에 없으면 0 → 전부 새 청크)"""
+        if not self._last:
+            return 0
+        last = self._last[-1]
+        for end in range(len(transcripts) - 1, -1, -1):
+            if transcripts[end] != last:
+                continue
+            # 리스트에 함께 남아 있는 앞 청크들도 반영한 순서와 같아야 같은 위치
+            depth = min(end + 1, len(self._last))
+            if all(transcripts[end - i] == self._last[-1 - i] for i in range(1, depth)):
+                return end + 1
+        return 0
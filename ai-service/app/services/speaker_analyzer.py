@@ -2,12 +2,31 @@
 Speaker Role Analyzer - 발화 패턴 기반 화자 역할 추정
 """
 
-import re
+import os
+import asyncio
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.pattern_engine import PatternEngine
+from app.services.role_classifier import CONFIDENCE_THRESHOLD, classify_role, predict_investor_proba_batch
+from app.services.session_store import SessionStore
 
 logger = logging.getLogger(__name__)
 
+# 역할 코드 (배열 집계용 인덱스)
+ROLES = ("investor", "founder", "unknown")
+INVESTOR, FOUNDER, UNKNOWN = range(3)
+
+MIN_TEXT_LENGTH = 5      # 이보다 짧은 발화는 unknown
+MIN_ROLE_SCORE = 2       # 역할 판정 최소 점수
+QUESTION_BONUS = 2       # '?' 포함 시 투자자 점수 가산
+
+# 세그먼트가 이보다 많으면 스레드에서 분석 (이벤트 루프 블로킹 방지)
+ROLE_OFFLOAD_THRESHOLD = int(os.getenv("ROLE_OFFLOAD_THRESHOLD", "2000"))
+
 # 투자자 발화 패턴
 INVESTOR_PATTERNS = [
     # 질문 패턴
@@ -47,53 +66,117 @@ FOUNDER_PATTERNS = [
     r"소개드리",
 ]
 
+# 투자자/창업자 패턴을 한 번의 스캔으로 매칭
+ROLE_ENGINE = PatternEngine({
+    "investor": dict(enumerate(INVESTOR_PATTERNS)),
+    "founder": dict(enumerate(FOUNDER_PATTERNS)),
+})
 
-def estimate_speaker_role(text: str) -> Optional[str]:
+
+def estimate_speaker_role(text: str, use_classifier: bool = True) -> Optional[str]:
     """
     발화 텍스트를 분석하여 화자 역할 추정
 
+    정규식 점수로 판정되면 그대로 사용하고, 판정되지 않은 발화만 학습된 분류기로 판단
+    (분류기 결과가 정규식 점수가 기운 쪽과 반대면 판단 보류)
+
     Args:
         text: 발화 텍스트
+        use_classifier: False면 정규식 휴리스틱만 사용
 
     Returns:
         'investor' | 'founder' | 'unknown'
     """
-    if not text or len(text.strip()) < 5:
+    if not text or len(text.strip()) < MIN_TEXT_LENGTH:
         return "unknown"
 
-    text_lower = text.lower()
+    investor_score, founder_score = role_scores(text)
 
-    # 투자자 패턴 매칭
-    investor_score = 0
-    for pattern in INVESTOR_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            investor_score += 1
+    # 점수 비교
+    if investor_score > founder_score and investor_score >= MIN_ROLE_SCORE:
+        return "investor"
+    elif founder_score > investor_score and founder_score >= MIN_ROLE_SCORE:
+        return "founder"
+
+    role = classify_role(text) if use_classifier else None
+    if role and _agrees_with_scores(role, investor_score, founder_score):
+        return role
+    return "unknown"
+
+
+def _agrees_with_scores(role: str, investor_score: int, founder_score: int) -> bool:
+    """분류기 역할이 (판정 기준에 못 미친) 정규식 점수가 기운 쪽과 같거나 동점인지"""
+    if role == "investor":
+        return investor_score >= founder_score
+    return founder_score >= investor_score
 
-    # 창업자 패턴 매칭
+
+def role_scores(text: str) -> Tuple[int, int]:
+    """
+    발화의 (투자자 점수, 창업자 점수)
+
+    패턴별 매칭 여부로 1점씩 (두 패턴 테이블을 한 번의 스캔으로 확인), 질문이면 투자자 가산
+    """
+    investor_score = 0
     founder_score = 0
-    for pattern in FOUNDER_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
+    for table, *_ in ROLE_ENGINE.scan(text, first_only=True):
+        if table == "investor":
+            investor_score += 1
+        else:
             founder_score += 1
 
     # 질문 여부 확인 (? 포함)
     if "?" in text:
-        investor_score += 2
+        investor_score += QUESTION_BONUS
 
-    # 점수 비교
-    if investor_score > founder_score and investor_score >= 2:
-        return "investor"
-    elif founder_score > investor_score and founder_score >= 2:
-        return "founder"
-    else:
-        return "unknown"
+    return investor_score, founder_score
 
 
-def analyze_conversation_roles(segments: list) -> list:
+def classify_segments(texts: List[str], use_classifier: bool = True) -> np.ndarray:
+    """
+    발화 리스트의 역할 코드 배열 (estimate_speaker_role과 같은 기준)
+
+    정규식 점수로 판정되지 않은 발화만 모아 분류기로 한 번에 계산
+
+    Args:
+        texts: 발화 텍스트 리스트
+        use_classifier: False면 정규식 휴리스틱만 사용
+
+    Returns:
+        np.ndarray[int8]: INVESTOR | FOUNDER | UNKNOWN
+    """
+    codes = np.full(len(texts), UNKNOWN, dtype=np.int8)
+    pending = np.flatnonzero(np.fromiter(
+        (bool(text) and len(text.strip()) >= MIN_TEXT_LENGTH for text in texts),
+        dtype=bool,
+        count=len(texts)
+    ))
+
+    scores = np.array([role_scores(texts[i]) for i in pending], dtype=np.int32).reshape(-1, 2)
+    investor, founder = scores[:, 0], scores[:, 1]
+    is_investor = (investor > founder) & (investor >= MIN_ROLE_SCORE)
+    is_founder = (founder > investor) & (founder >= MIN_ROLE_SCORE)
+    codes[pending[is_investor]] = INVESTOR
+    codes[pending[is_founder]] = FOUNDER
+
+    undecided = ~(is_investor | is_founder)
+    if use_classifier and undecided.any():
+        rest = pending[undecided]
+        proba = predict_investor_proba_batch([texts[i] for i in rest])
+        if proba is not None:
+            investor, founder = investor[undecided], founder[undecided]
+            codes[rest[(proba >= CONFIDENCE_THRESHOLD) & (investor >= founder)]] = INVESTOR
+            codes[rest[(proba <= 1.0 - CONFIDENCE_THRESHOLD) & (founder >= investor)]] = FOUNDER
+    return codes
+
+
+def analyze_conversation_roles(segments: list, use_classifier: bool = True) -> list:
     """
     전체 대화 세그먼트를 분석하여 화자 역할 추정
 
     Args:
         segments: [{speaker, text, startTime}, ...]
+        use_classifier: False면 정규식 휴리스틱만 사용
 
     Returns:
         segments with speakerRole added
@@ -101,51 +184,63 @@ def analyze_conversation_roles(segments: list) -> list:
     if not segments:
         return segments
 
-    # 각 세그먼트에 역할 추정
-    for segment in segments:
-        role = estimate_speaker_role(segment.get("text", ""))
-        segment["speakerRole"] = role
-
-    # 화자별 역할 통계
-    speaker_roles = {}
-    for segment in segments:
-        speaker = segment.get("speaker", "")
-        role = segment.get("speakerRole", "unknown")
+    # 각 세그먼트에 역할 추정 (세그먼트당 한 번의 스캔)
+    codes = classify_segments([segment.get("text", "") for segment in segments], use_classifier)
 
-        if speaker not in speaker_roles:
-            speaker_roles[speaker] = {"investor": 0, "founder": 0, "unknown": 0}
-
-        speaker_roles[speaker][role] += 1
+    # 화자별 역할 통계 (화자 인덱스 x 역할 코드 배열 집계)
+    speaker_index = {}
+    speaker_ids = np.fromiter(
+        (speaker_index.setdefault(segment.get("speaker", ""), len(speaker_index)) for segment in segments),
+        dtype=np.intp,
+        count=len(segments)
+    )
+    counts = np.bincount(
+        speaker_ids * len(ROLES) + codes,
+        minlength=len(speaker_index) * len(ROLES)
+    ).reshape(-1, len(ROLES))
 
     # 화자별 최종 역할 결정
-    speaker_final_role = {}
-    for speaker, counts in speaker_roles.items():
-        if counts["investor"] > counts["founder"]:
-            speaker_final_role[speaker] = "investor"
-        elif counts["founder"] > counts["investor"]:
-            speaker_final_role[speaker] = "founder"
-        else:
-            speaker_final_role[speaker] = "unknown"
+    final = np.full(len(speaker_index), UNKNOWN, dtype=np.int8)
+    final[counts[:, INVESTOR] > counts[:, FOUNDER]] = INVESTOR
+    final[counts[:, FOUNDER] > counts[:, INVESTOR]] = FOUNDER
+    speaker_final_role = {speaker: ROLES[final[index]] for speaker, index in speaker_index.items()}
 
     # 세그먼트에 최종 역할 적용
-    for segment in segments:
-        speaker = segment.get("speaker", "")
-        segment["speakerRole"] = speaker_final_role.get(speaker, "unknown")
+    roles = [ROLES[code] for code in final[speaker_ids]]
+    for segment, role in zip(segments, roles):
+        segment["speakerRole"] = role
 
     logger.info(f"Speaker roles analyzed: {speaker_final_role}")
 
     return segments
 
 
+async def analyze_conversation_roles_async(segments: list) -> list:
+    """
+    analyze_conversation_roles의 비동기 버전
+
+    세그먼트가 ROLE_OFFLOAD_THRESHOLD보다 많으면 스레드에서 실행해 이벤트 루프를 막지 않음
+    """
+    if len(segments) > ROLE_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(analyze_conversation_roles, segments)
+    return analyze_conversation_roles(segments)
+
+
 def estimate_single_utterance_role(
     text: str,
-    previous_context: list = None
+    previous_context: list = None,
+    meeting_id: Optional[str] = None,
+    speaker: Optional[str] = None
 ) -> str:
     """
     단일 발화에 대한 역할 추정 (실시간용)
 
     이전 맥락을 고려하여 더 정확한 추정
+    meeting_id가 있으면 회의별 RoleTracker에 누적해 화자별 안정된 역할 반환
     """
+    if meeting_id:
+        return get_role_tracker(meeting_id).observe(text, speaker)
+
     # 기본 추정
     role = estimate_speaker_role(text)
 
@@ -157,3 +252,138 @@ def estimate_single_utterance_role(
                 return "founder"
 
     return role
+
+
+# ============ 회의별 실시간 역할 추적 ============
+
+ANSWER_WINDOW = 3              # 질문 후 이 발화 수 안의 unknown 발화는 답변(창업자)으로 간주
+STABLE_MIN_VOTES = 3           # 역할 확정에 필요한 최소 투자자+창업자 표 수
+STABLE_CONFIDENCE = 0.7        # 역할 확정 신뢰도 (해당 역할 표 비율)
+MAX_SPEAKERS_PER_MEETING = 32  # 회의당 추적할 최대 화자 수 (오래 말하지 않은 화자부터 제거)
+DEFAULT_SPEAKER = "화자"        # 화자 분리가 없는 STT 결과의 화자 이름
+
+
+class RoleTracker:
+    """
+    회의별 화자 역할 추적기
+
+    발화마다 화자별 역할 표와 질문-답변 인접 관계를 O(1)로 갱신하고,
+    표가 충분히 쌓여 한쪽으로 수렴하면 화자 역할을 확정 (재계산 없이 조회 가능)
+    """
+
+    def __init__(self):
+        self.speakers: "OrderedDict[str, Dict]" = OrderedDict()
+        self.utterances = 0
+        self._last_question_at: Optional[int] = None
+        self._last_question_speaker: Optional[str] = None
+
+    def observe(self, text: str, speaker: Optional[str] = None) -> str:
+        """
+        발화 반영 후 역할 반환
+
+        Returns:
+            화자 역할이 확정되었으면 화자 역할, 아니면 이 발화의 추정 역할
+            (화자 분리가 없는 DEFAULT_SPEAKER는 여러 사람의 발화이므로 항상 이 발화의 추정 역할)
+        """
+        speaker = speaker or DEFAULT_SPEAKER
+        role = estimate_speaker_role(text)
+        self.utterances += 1
+
+        # 다른 화자(또는 화자 분리 없음)의 최근 질문 뒤에 오는 발화는 답변
+        answered = (
+            self._last_question_at is not None
+            and self.utterances - self._last_question_at <= ANSWER_WINDOW
+            and (self._last_question_speaker != speaker or speaker == DEFAULT_SPEAKER)
+        )
+        inferred = role == "unknown" and answered
+        if inferred:
+            role = "founder"
+        if "?" in text:
+            self._last_question_at = self.utterances
+            self._last_question_speaker = speaker
+
+        if speaker == DEFAULT_SPEAKER:
+            # 표를 모으면 한 역할로 확정되어 이후 모든 발화가 같은 역할이 됨
+            return role
+
+        state = self._state(speaker)
+        if inferred:
+            state["answers"] += 1
+        if "?" in text:
+            state["questions"] += 1
+
+        state["votes"][role] += 1
+        self._update_role(state)
+
+        if state["stable"]:
+            return state["role"]
+        return role
+
+    def _state(self, speaker: str) -> Dict:
+        """화자 상태 (없으면 생성, 최근 화자를 뒤로)"""
+        state = self.speakers.get(speaker)
+        if state is None:
+            state = {
+                "votes": {"investor": 0, "founder": 0, "unknown": 0},
+                "questions": 0,
+                "answers": 0,
+                "role": "unknown",
+                "confidence": 0.0,
+                "stable": False,
+            }
+            self.speakers[speaker] = state
+            while len(self.speakers) > MAX_SPEAKERS_PER_MEETING:
+                evicted, _ = self.speakers.popitem(last=False)
+                logger.info(f"RoleTracker evicted speaker: {evicted}")
+        else:
+            self.speakers.move_to_end(speaker)
+        return state
+
+    @staticmethod
+    def _update_role(state: Dict):
+        """표 비율로 역할/신뢰도 갱신 (확정 후에는 반대 역할이 기준을 넘을 때만 변경)"""
+        votes = state["votes"]
+        decided = votes["investor"] + votes["founder"]
+        if not decided:
+            return
+
+        leader = "investor" if votes["investor"] >= votes["founder"] else "founder"
+        confidence = votes[leader] / decided
+        converged = decided >= STABLE_MIN_VOTES and confidence >= STABLE_CONFIDENCE
+
+        if state["stable"] and leader != state["role"] and not converged:
+            # 확정된 역할 유지, 신뢰도만 갱신
+            state["confidence"] = round(votes[state["role"]] / decided, 3)
+            return
+
+        state["role"] = leader if (converged or votes["investor"] != votes["founder"]) else "unknown"
+        state["confidence"] = round(confidence, 3)
+        state["stable"] = state["stable"] or converged
+
+    def roles(self) -> Dict[str, Dict]:
+        """화자별 현재 역할 {"화자1": {"role", "confidence", "stable", "votes", "questions", "answers"}}"""
+        return {
+            speaker: {
+                "role": state["role"],
+                "confidence": state["confidence"],
+                "stable": state["stable"],
+                "votes": dict(state["votes"]),
+                "questions": state["questions"],
+                "answers": state["answers"],
+            }
+            for speaker, state in self.speakers.items()
+        }
+
+
+# 회의별 역할 추적기
+_trackers = SessionStore(RoleTracker, name="role tracker")
+
+
+def get_role_tracker(meeting_id: str) -> RoleTracker:
+    """회의 ID에 해당하는 역할 추적기 (없으면 생성)"""
+    return _trackers.get_or_create(meeting_id)
+
+
+def peek_role_tracker(meeting_id: str) -> Optional[RoleTracker]:
+    """회의 ID에 해당하는 역할 추적기 (없으면 None, 새로 만들지 않음)"""
+    return _trackers.get(meeting_id)
@@ -6,13 +6,13 @@ https://developers.daglo.ai/guide/STT-Async.html
 import time
 import os
 import asyncio
-import httpx
 import logging
 import tempfile
 import subprocess
 import io
 from typing import BinaryIO, Optional
 from dotenv import load_dotenv
+from app.services.llm_gateway import daglo_request, get_sync_client, openai_transcribe
 
 load_dotenv()
 
@@ -21,6 +21,11 @@ def get_speaker_analyzer():
     from app.services.speaker_analyzer import estimate_single_utterance_role
     return estimate_single_utterance_role
 
+
+def get_conversation_analyzer():
+    from app.services.speaker_analyzer import analyze_conversation_roles_async
+    return analyze_conversation_roles_async
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -46,17 +51,9 @@ HALLUCINATION_PATTERNS = [
     "SBS 뉴스",
 ]
 
-# Whisper fallback용 OpenAI 클라이언트 (필요시)
-_openai_client = None
-
-
 def get_openai_client():
-    """OpenAI 클라이언트 (Whisper fallback용)"""
-    global _openai_client
-    if _openai_client is None:
-        from openai import OpenAI
-        _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    return _openai_client
+    """동기 OpenAI 클라이언트 (테스트 스크립트용, 서비스 호출은 llm_gateway 경유)"""
+    return get_sync_client("openai")
 
 
 def convert_webm_to_wav(webm_content: bytes) -> bytes:
@@ -179,27 +176,27 @@ async def transcribe_audio_daglo_sync(audio_content: bytes, is_wav: bool = False
 
     logger.info(f"Audio content size: {len(audio_content)} bytes, is_wav: {is_wav}")
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        if is_wav:
-            files = {"file": ("audio.wav", audio_content, "audio/wav")}
-        else:
-            files = {"file": ("audio.webm", audio_content, "audio/webm")}
-
-        logger.info(f"Sending request to Daglo: {DAGLO_SYNC_URL}")
-        response = await client.post(
-            DAGLO_SYNC_URL,
-            headers=headers,
-            files=files
-        )
+    if is_wav:
+        files = {"file": ("audio.wav", audio_content, "audio/wav")}
+    else:
+        files = {"file": ("audio.webm", audio_content, "audio/webm")}
+
+    logger.info(f"Sending request to Daglo: {DAGLO_SYNC_URL}")
+    response = await daglo_request(
+        "POST",
+        DAGLO_SYNC_URL,
+        headers=headers,
+        files=files
+    )
 
-        logger.info(f"Daglo response status: {response.status_code}")
+    logger.info(f"Daglo response status: {response.status_code}")
 
-        if response.status_code != 200:
-            logger.error(f"Daglo API error: {response.status_code} - {response.text}")
-            raise Exception(f"Daglo API error: {response.status_code} - {response.text}")
+    if response.status_code != 200:
+        logger.error(f"Daglo API error: {response.status_code} - {response.text}")
+        raise Exception(f"Daglo API error: {response.status_code} - {response.text}")
 
-        result = response.json()
-        logger.info(f"Daglo response: {result}")
+    result = response.json()
+    logger.info(f"Daglo response: {result}")
 
     latency = time.time() - start_time
 
@@ -262,91 +259,100 @@ async def transcribe_audio_daglo_async(audio_url: str) -> dict:
         }
     }
 
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        # 1. 전사 작업 제출
-        response = await client.post(
-            DAGLO_ASYNC_URL,
-            headers=headers,
-            json=payload
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Daglo API error: {response.status_code} - {response.text}")
-
-        result = response.json()
-        rid = result.get("rid")
-
-        if not rid:
-            raise Exception("No request ID returned from Daglo API")
-
-        # 2. 결과 폴링
-        max_attempts = 60  # 최대 5분 대기
-        poll_interval = 5  # 5초 간격
-
-        for attempt in range(max_attempts):
-            await asyncio.sleep(poll_interval)
-
-            status_response = await client.get(
-                f"{DAGLO_ASYNC_URL}/{rid}",
-                headers={"Authorization": f"Bearer {DAGLO_API_TOKEN}"}
-            )
-
-            if status_response.status_code != 200:
-                continue
-
-            status_result = status_response.json()
-            status = status_result.get("status")
-
-            if status == "transcribed":
-                # 전사 완료
-                latency = time.time() - start_time
+    # 1. 전사 작업 제출
+    response = await daglo_request(
+        "POST",
+        DAGLO_ASYNC_URL,
+        headers=headers,
+        json=payload
+    )
 
-                # 결과 파싱
-                stt_result = status_result.get("sttResult", {})
-                transcript = stt_result.get("transcript", "")
-                words = stt_result.get("words", [])
+    if response.status_code != 200:
+        raise Exception(f"Daglo API error: {response.status_code} - {response.text}")
 
-                # 화자별 세그먼트 구성
-                segments = []
-                current_segment = None
+    result = response.json()
+    rid = result.get("rid")
 
-                for word in words:
-                    speaker_id = word.get("speakerId", 0)
-                    speaker_name = f"화자{speaker_id + 1}"
-                    word_text = word.get("word", "")
-                    start = word.get("startTime", {})
-                    start_seconds = float(start.get("seconds", 0)) + float(start.get("nanos", 0)) / 1e9
+    if not rid:
+        raise Exception("No request ID returned from Daglo API")
 
-                    if current_segment is None or current_segment["speaker"] != speaker_name:
-                        if current_segment:
-                            segments.append(current_segment)
-                        current_segment = {
-                            "speaker": speaker_name,
-                            "text": word_text,
-                            "startTime": start_seconds
-                        }
-                    else:
-                        current_segment["text"] += " " + word_text
+    # 2. 결과 폴링
+    max_attempts = 60  # 최대 5분 대기
+    poll_interval = 5  # 5초 간격
 
-                if current_segment:
-                    segments.append(current_segment)
+    for attempt in range(max_attempts):
+        await asyncio.sleep(poll_interval)
 
-                # 포맷된 텍스트 생성
-                formatted_text = format_transcript_with_speakers(segments)
+        status_response = await daglo_request(
+            "GET",
+            f"{DAGLO_ASYNC_URL}/{rid}",
+            headers={"Authorization": f"Bearer {DAGLO_API_TOKEN}"},
+            retry=True
+        )
 
-                return {
-                    "text": transcript,
-                    "formatted_text": formatted_text,
-                    "segments": segments,
-                    "duration": 0,
-                    "latency": latency,
-                    "provider": "daglo_async"
-                }
+        if status_response.status_code != 200:
+            continue
+
+        status_result = status_response.json()
+        status = status_result.get("status")
+
+        if status == "transcribed":
+            # 전사 완료
+            latency = time.time() - start_time
+
+            # 결과 파싱
+            stt_result = status_result.get("sttResult", {})
+            transcript = stt_result.get("transcript", "")
+            words = stt_result.get("words", [])
+
+            # 화자별 세그먼트 구성
+            segments = []
+            current_segment = None
+
+            for word in words:
+                speaker_id = word.get("speakerId", 0)
+                speaker_name = f"화자{speaker_id + 1}"
+                word_text = word.get("word", "")
+                start = word.get("startTime", {})
+                start_seconds = float(start.get("seconds", 0)) + float(start.get("nanos", 0)) / 1e9
+
+                if current_segment is None or current_segment["speaker"] != speaker_name:
+                    if current_segment:
+                        segments.append(current_segment)
+                    current_segment = {
+                        "speaker": speaker_name,
+                        "text": word_text,
+                        "startTime": start_seconds
+                    }
+                else:
+                    current_segment["text"] += " " + word_text
+
+            if current_segment:
+                segments.append(current_segment)
+
+            # 화자별 역할 추정 (긴 회의는 스레드에서 처리)
+            try:
+                analyze_roles = get_conversation_analyzer()
+                segments = await analyze_roles(segments)
+            except Exception as e:
+                logger.warning(f"Failed to analyze speaker roles: {e}")
+
+            # 포맷된 텍스트 생성
+            formatted_text = format_transcript_with_speakers(segments)
+
+            return {
+                "text": transcript,
+                "formatted_text": formatted_text,
+                "segments": segments,
+                "duration": 0,
+                "latency": latency,
+                "provider": "daglo_async"
+            }
 
-            elif status in ["failed", "error"]:
-                raise Exception(f"Daglo transcription failed: {status_result}")
+        elif status in ["failed", "error"]:
+            raise Exception(f"Daglo transcription failed: {status_result}")
 
-        raise Exception("Daglo transcription timeout")
+    raise Exception("Daglo transcription timeout")
 
 
 def is_hallucination(text: str) -> bool:
@@ -374,10 +380,18 @@ async def transcribe_audio_whisper(audio_file: BinaryIO) -> dict:
     start_time = time.time()
     logger.info("Starting Whisper STT...")
 
-    client = get_openai_client()
-    response = client.audio.transcriptions.create(
+    # 재시도 시 같은 스트림을 다시 읽지 않도록 바이트로 보관
+    audio_content = audio_file.read()
+    audio_name = getattr(audio_file, "name", "audio.webm")
+
+    def make_file():
+        file_like = io.BytesIO(audio_content)
+        file_like.name = audio_name
+        return file_like
+
+    response = await openai_transcribe(
+        make_file,
         model="whisper-1",
-        file=audio_file,
         language="ko",
         response_format="verbose_json"
     )
@@ -420,7 +434,22 @@ async def transcribe_audio_whisper(audio_file: BinaryIO) -> dict:
     }
 
 
-async def transcribe_audio(audio_file: BinaryIO) -> dict:
+def apply_role_tracker(result: dict, meeting_id: Optional[str]) -> dict:
+    """회의별 역할 추적기에 세그먼트를 반영하고 speakerRole을 누적 추정 결과로 교체"""
+    if not meeting_id:
+        return result
+    from app.services.speaker_analyzer import get_role_tracker
+
+    try:
+        tracker = get_role_tracker(meeting_id)
+        for segment in result.get("segments", []):
+            segment["speakerRole"] = tracker.observe(segment.get("text", ""), segment.get("speaker"))
+    except Exception as e:
+        logger.warning(f"Failed to track speaker role: {e}")
+    return result
+
+
+async def transcribe_audio(audio_file: BinaryIO, meeting_id: Optional[str] = None) -> dict:
     """
     음성 파일을 텍스트로 전사 (메인 함수)
 
@@ -431,6 +460,7 @@ async def transcribe_audio(audio_file: BinaryIO) -> dict:
 
     Args:
         audio_file: 업로드된 오디오 파일
+        meeting_id: 회의 ID (있으면 회의별 역할 추적기로 화자 역할 누적 추정)
 
     Returns:
         dict: {
@@ -472,7 +502,7 @@ async def transcribe_audio(audio_file: BinaryIO) -> dict:
             # 빈 결과가 아니면 성공
             if result.get("text", "").strip():
                 logger.info(f"Whisper STT success: {result.get('text', '')[:50]}...")
-                return result
+                return apply_role_tracker(result, meeting_id)
             else:
                 logger.warning("Whisper returned empty transcript")
 
@@ -488,7 +518,7 @@ async def transcribe_audio(audio_file: BinaryIO) -> dict:
 
             if result.get("text", "").strip():
                 logger.info(f"Daglo STT success: {result.get('text', '')[:50]}...")
-                return result
+                return apply_role_tracker(result, meeting_id)
             else:
                 logger.warning("Daglo returned empty transcript")
 
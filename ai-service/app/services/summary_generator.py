@@ -1,18 +1,39 @@
 """
 Phase 3: 회의 자동 요약 생성기
 """
-import os
 from typing import List, Dict, Any, Optional
-from openai import AsyncOpenAI
+import os
 import json
+import time
+import asyncio
+import logging
+from app.services.data_delta import detect_data_updates_from_transcripts, get_structured_data
+from app.services.extractive_summary import extractive_summary
+from app.services.json_parser import CHUNK_SUMMARY_SCHEMA, SUMMARY_SCHEMA, parse_llm_json
+from app.services.llm_gateway import openai_chat
+from app.services.model_router import route
+from app.services.rolling_summary import peek_rolling_summary, render_state
+from app.services.transcript_window import estimate_tokens, fit_transcript, split_tail_by_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryGenerationError(Exception):
+    """LLM 요약 실패 (fallback_on_error=False일 때만 발생)"""
 
-# OpenAI 클라이언트
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# 긴 회의 계층 요약 (map-reduce)
+SUMMARY_MAP_CONCURRENCY = int(os.getenv("SUMMARY_MAP_CONCURRENCY", "8"))  # 동시 구간 요약 호출 수
+MAP_BUDGET_SHARE = 0.6            # 지연 예산 중 구간 요약(map)에 배정할 비율
+CHUNK_FALLBACK_TOKENS = 400       # 구간 요약 실패 시 대체 다이제스트 크기
+
+# 지연 예산이 이보다 작으면 LLM 호출 없이 추출 요약만 반환 (ms)
+EXTRACTIVE_ONLY_BUDGET_MS = float(os.getenv("EXTRACTIVE_ONLY_BUDGET_MS", "1500"))
 
 SUMMARY_PROMPT = """당신은 회의 내용을 분석하고 요약하는 AI 전문가입니다.
 주어진 회의 전사 내용을 분석하여 구조화된 요약을 생성하세요.
 
-## 회의 전사 내용:
+## {transcript_heading}:
 {transcript}
 
 ## 논의된 질문들:
@@ -42,6 +63,27 @@ SUMMARY_PROMPT = """당신은 회의 내용을 분석하고 요약하는 AI 전
 
 JSON만 출력하세요."""
 
+CHUNK_SUMMARY_PROMPT = """다음은 긴 투자 미팅 전사의 {index}/{total}번째 구간입니다.
+이 구간에서 논의된 내용만 요약하세요.
+
+## 전사 구간:
+{transcript}
+
+## 출력 형식 (JSON):
+{{
+    "summary": "구간 요약 (2-3문장, 언급된 숫자/지표는 그대로 유지)",
+    "key_points": ["핵심 포인트", ...],
+    "decisions": ["결정 사항", ...],
+    "action_items": ["후속 조치", ...],
+    "open_questions": ["답변되지 않은 질문", ...]
+}}
+
+JSON만 출력하세요."""
+
+FULL_TRANSCRIPT_HEADING = "회의 전사 내용"
+CHUNK_SUMMARIES_HEADING = "구간별 회의 요약 (긴 회의를 시간 순으로 나눠 요약한 내용)"
+ROLLING_SUMMARY_HEADING = "회의 내용 (회의 중 누적 요약 + 이후 대화)"
+
 RELATIONSHIP_CONTEXT_TEMPLATE = """
 ## 관계 정보:
 - 이름: {name}
@@ -56,7 +98,10 @@ RELATIONSHIP_CONTEXT_TEMPLATE = """
 async def generate_meeting_summary(
     transcripts: List[Dict[str, Any]],
     questions: List[Dict[str, Any]],
-    relationship_context: Optional[Dict[str, Any]] = None
+    relationship_context: Optional[Dict[str, Any]] = None,
+    budget_ms: Optional[float] = None,
+    meeting_id: Optional[str] = None,
+    fallback_on_error: bool = True
 ) -> Dict[str, Any]:
     """
     회의 요약 생성
@@ -65,15 +110,24 @@ async def generate_meeting_summary(
         transcripts: 전사 항목 리스트
         questions: 질문 리스트
         relationship_context: 관계 객체 정보 (선택)
+        budget_ms: 지연 예산 (ms), 모델/토큰 선택에 사용
+        meeting_id: 회의 ID (선택, 회의 중 누적 요약이 있으면 재사용)
+        fallback_on_error: False면 LLM 호출/파싱 실패 시 추출 요약 대신 SummaryGenerationError
+            (재시도하는 백그라운드 작업용)
 
     Returns:
         요약 데이터
     """
+    # 수치 변화는 LLM 없이 먼저 계산 (LLM 실패/폴백 시에도 유지)
+    structured_data = get_structured_data(relationship_context)
+    data_updates = detect_data_updates_from_transcripts([t['text'] for t in transcripts], structured_data)
+
+    # LLM 호출이 예산 안에 끝날 수 없으면 로컬 추출 요약
+    if budget_ms is not None and budget_ms < EXTRACTIVE_ONLY_BUDGET_MS:
+        return generate_fallback_summary(transcripts, questions, data_updates)
+
     # 전사 텍스트 결합
-    transcript_text = "\n".join([
-        f"[{t.get('speaker', '화자')}]: {t['text']}"
-        for t in transcripts
-    ])
+    transcript_lines = [format_transcript_line(t) for t in transcripts]
 
     # 질문 분류
     used_questions = [q['text'] for q in questions if q.get('is_used')]
@@ -87,39 +141,71 @@ async def generate_meeting_summary(
             type=relationship_context.get('type', 'N/A'),
             industry=relationship_context.get('industry', 'N/A'),
             stage=relationship_context.get('stage', 'N/A'),
-            structured_data=json.dumps(relationship_context.get('structuredData', {}), ensure_ascii=False),
+            structured_data=json.dumps(structured_data, ensure_ascii=False),
             notes=relationship_context.get('notes', 'N/A'),
         )
 
+    # 회의 중 누적 요약이 있으면 아직 반영되지 않은 꼬리 발화만 원문으로 사용
+    rolling = peek_rolling_summary(meeting_id) if meeting_id else None
+    rolling_text, transcript_lines = rolling.split(transcript_lines) if rolling else ("", transcript_lines)
+    transcript_text = "\n".join(transcript_lines)
+    transcript_heading = FULL_TRANSCRIPT_HEADING
+
+    # 회의 종료 시점이므로 마무리 단계로 라우팅
+    decision = route("summary", "closing", budget_ms)
+
+    # 한 번의 호출에 담기지 않는 긴 회의는 구간별 요약(map) 후 종합(reduce)
+    if estimate_tokens(transcript_text) + estimate_tokens(rolling_text) > decision["transcript_tokens"]:
+        started = time.monotonic()
+        transcript_heading = CHUNK_SUMMARIES_HEADING
+        transcript_text = await summarize_chunks(
+            transcript_lines,
+            budget_ms * MAP_BUDGET_SHARE if budget_ms is not None else None
+        )
+        if budget_ms is not None:
+            budget_ms = max(0.0, budget_ms - (time.monotonic() - started) * 1000)
+        decision = route("summary", "closing", budget_ms)
+
+    if rolling_text:
+        transcript_heading = ROLLING_SUMMARY_HEADING
+        transcript_text = f"[회의 중 누적 요약]\n{rolling_text}\n\n[이후 대화]\n{transcript_text or '없음'}"
+
     # 프롬프트 생성
     prompt = SUMMARY_PROMPT.format(
-        transcript=transcript_text[:8000],  # 토큰 제한
+        transcript_heading=transcript_heading,
+        transcript=fit_transcript(transcript_text, decision["transcript_tokens"]),  # 토큰 제한
         used_questions="\n".join(used_questions[:10]) if used_questions else "없음",
         unused_questions="\n".join(unused_questions[:10]) if unused_questions else "없음",
         relationship_context=relationship_text,
     )
 
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
+        response = await openai_chat(
+            model=decision["model"],
             messages=[
                 {"role": "system", "content": "You are a meeting summarization expert. Always respond in valid JSON."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
-            max_tokens=2000,
+            max_tokens=decision["max_tokens"],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "meeting_summary",
+                    "schema": SUMMARY_SCHEMA,
+                },
+            },
+            deadline=decision["deadline"],
         )
 
-        content = response.choices[0].message.content.strip()
+        content = response.choices[0].message.content or ""
 
-        # JSON 파싱
-        # ```json 블록 제거
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-
-        summary = json.loads(content)
+        # JSON 파싱 + 스키마 검증
+        summary = parse_llm_json(content, SUMMARY_SCHEMA, "openai_summary")
+        if summary is None:
+            if not fallback_on_error:
+                raise SummaryGenerationError("summary response did not match the schema")
+            return generate_fallback_summary(transcripts, questions, data_updates)
 
         return {
             "summary": summary.get("summary", "요약을 생성할 수 없습니다."),
@@ -128,47 +214,181 @@ async def generate_meeting_summary(
             "actionItems": summary.get("action_items", []),
             "keyQuestions": summary.get("key_questions", used_questions[:5]),
             "missedQuestions": summary.get("missed_questions", unused_questions[:5]),
-            "suggestedDataUpdates": summary.get("suggested_data_updates", {}),
+            "suggestedDataUpdates": merge_data_updates(summary.get("suggested_data_updates") or {}, data_updates),
+            "dataDeltas": data_updates["deltas"],
             "nextMeetingAgenda": summary.get("next_meeting_agenda", []),
         }
 
-    except json.JSONDecodeError:
-        # JSON 파싱 실패 시 폴백
-        return generate_fallback_summary(transcripts, questions)
+    except SummaryGenerationError:
+        raise
     except Exception as e:
+        if not fallback_on_error:
+            raise SummaryGenerationError(str(e)) from e
         print(f"Summary generation error: {e}")
-        return generate_fallback_summary(transcripts, questions)
+        return generate_fallback_summary(transcripts, questions, data_updates)
 
 
-def generate_fallback_summary(
-    transcripts: List[Dict[str, Any]],
-    questions: List[Dict[str, Any]]
+def format_transcript_line(item: Dict[str, Any]) -> str:
+    """전사 항목 → "[화자]: 발화" (누적 요약과 최종 요약이 같은 형식을 사용)"""
+    return f"[{item.get('speaker') or '화자'}]: {item['text']}"
+
+
+def chunk_transcript_lines(lines: List[str], max_tokens: int) -> List[str]:
+    """
+    전사 발화를 화자 턴 경계에 맞춰 토큰 예산 이내 구간으로 분할
+
+    연속된 발화를 예산까지 묶고, 한 발화가 예산을 넘으면 문장 단위로 나눔
+
+    Args:
+        lines: "[화자]: 발화" 형식의 발화 리스트
+        max_tokens: 구간당 토큰 상한
+
+    Returns:
+        구간 텍스트 리스트 (시간 순)
+    """
+    chunks = []
+    current = []
+    used = 0
+    for line in lines:
+        pieces = [line] if estimate_tokens(line) <= max_tokens else _split_long_turn(line, max_tokens)
+        for piece in pieces:
+            tokens = estimate_tokens(piece)
+            if current and used + tokens > max_tokens:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+            current.append(piece)
+            used += tokens
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _split_long_turn(text: str, max_tokens: int) -> List[str]:
+    """예산을 넘는 단일 발화를 뒤에서부터 예산 단위로 잘라 앞에서부터 반환"""
+    pieces = []
+    while text:
+        text, tail = split_tail_by_tokens(text, max_tokens)
+        pieces.append(tail)
+    pieces.reverse()
+    return pieces
+
+
+async def summarize_chunks(lines: List[str], budget_ms: Optional[float] = None) -> str:
+    """
+    긴 회의의 구간별 요약 (map 단계)
+
+    구간은 동시에 요약하되 SUMMARY_MAP_CONCURRENCY로 동시 호출 수를 제한
+    (구간 수가 상한 이하면 전체 소요 시간은 LLM 호출 1회 수준)
+
+    Args:
+        lines: "[화자]: 발화" 형식의 발화 리스트
+        budget_ms: map 단계 지연 예산 (ms)
+
+    Returns:
+        종합(reduce) 프롬프트에 넣을 구간별 요약 텍스트
+    """
+    decision = route("summary_chunk", "closing", budget_ms)
+    chunks = chunk_transcript_lines(lines, decision["transcript_tokens"])
+    semaphore = asyncio.Semaphore(SUMMARY_MAP_CONCURRENCY)
+    logger.info(f"Hierarchical summary: {len(chunks)} chunks, concurrency={SUMMARY_MAP_CONCURRENCY}")
+
+    results = await asyncio.gather(*[
+        summarize_chunk(chunk, i, len(chunks), decision, semaphore)
+        for i, chunk in enumerate(chunks)
+    ])
+    return "\n\n".join(
+        render_chunk_summary(result, i, len(chunks))
+        for i, result in enumerate(results)
+    )
+
+
+async def summarize_chunk(
+    chunk: str,
+    index: int,
+    total: int,
+    decision: Dict[str, Any],
+    semaphore: asyncio.Semaphore
 ) -> Dict[str, Any]:
-    """폴백 요약 생성"""
-    transcript_text = " ".join([t['text'] for t in transcripts])
+    """
+    단일 구간 요약
+
+    실패하거나 응답이 스키마에 맞지 않으면 LLM 없이 추출 다이제스트로 대체
+    (한 구간의 실패로 전체 요약이 폴백되지 않도록)
+    """
+    prompt = CHUNK_SUMMARY_PROMPT.format(index=index + 1, total=total, transcript=chunk)
+    async with semaphore:
+        try:
+            response = await openai_chat(
+                model=decision["model"],
+                messages=[
+                    {"role": "system", "content": "You are a meeting summarization expert. Always respond in valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=decision["max_tokens"],
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "meeting_chunk_summary",
+                        "schema": CHUNK_SUMMARY_SCHEMA,
+                    },
+                },
+                deadline=decision["deadline"],
+            )
+            content = response.choices[0].message.content or ""
+            parsed = parse_llm_json(content, CHUNK_SUMMARY_SCHEMA, "openai_summary_chunk")
+            if parsed is not None:
+                return parsed
+        except Exception as e:
+            logger.warning(f"Chunk summary failed ({index + 1}/{total}): {e}")
+
+    return {"summary": fit_transcript(chunk, CHUNK_FALLBACK_TOKENS)}
 
-    # 간단한 키워드 추출
-    key_points = []
-    keywords = ['MRR', 'CAC', 'LTV', 'Churn', '매출', '투자', '성장률', '팀', '기술', '고객']
 
-    for keyword in keywords:
-        if keyword in transcript_text:
-            sentences = transcript_text.split('.')
-            for s in sentences:
-                if keyword in s and len(s.strip()) > 10:
-                    key_points.append(s.strip()[:100])
-                    break
+def render_chunk_summary(result: Dict[str, Any], index: int, total: int) -> str:
+    """구간 요약 결과를 reduce 프롬프트용 텍스트로 변환"""
+    return f"### 구간 {index + 1}/{total}\n" + render_state(result)
+
+
+def merge_data_updates(llm_updates: Dict[str, Any], data_updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    LLM 제안과 로컬 변화 감지 결과 병합
+
+    로컬에서 계산한 필드는 로컬 값을 우선하고, 모순으로 표시된 필드는 LLM 제안에서도 제외
+    (제안 값은 백엔드에서 바로 반영되므로 확인이 필요한 값은 넣지 않음)
+    """
+    flagged = {item["field"].lower() for item in data_updates["contradictions"]}
+    local = {key.lower() for key in data_updates["updates"]}
+    merged = {
+        key: value for key, value in llm_updates.items()
+        if key.lower() not in flagged and key.lower() not in local
+    }
+    merged.update(data_updates["updates"])
+    return merged
+
+
+def generate_fallback_summary(
+    transcripts: List[Dict[str, Any]],
+    questions: List[Dict[str, Any]],
+    data_updates: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """폴백 요약 생성 (LLM 없이 추출 요약, 수치 변화는 로컬 감지 결과 사용)"""
+    extracted = extractive_summary(transcripts)
 
     used_questions = [q['text'] for q in questions if q.get('is_used')][:5]
     unused_questions = [q['text'] for q in questions if not q.get('is_used')][:5]
 
     return {
-        "summary": f"회의가 {len(transcripts)}개의 발화로 진행되었습니다. {len(key_points)}개의 주요 키워드가 논의되었습니다.",
-        "keyPoints": key_points[:5],
-        "decisions": [],
-        "actionItems": [],
+        "summary": " ".join(
+            [f"회의가 {len(transcripts)}개의 발화로 진행되었습니다."] + extracted["summary_sentences"]
+        ),
+        "keyPoints": extracted["key_points"],
+        "decisions": extracted["decisions"],
+        "actionItems": extracted["action_items"],
         "keyQuestions": used_questions,
         "missedQuestions": unused_questions,
-        "suggestedDataUpdates": {},
+        "suggestedDataUpdates": data_updates["updates"] if data_updates else {},
+        "dataDeltas": data_updates["deltas"] if data_updates else [],
         "nextMeetingAgenda": unused_questions[:3],
     }
@@ -0,0 +1,262 @@
+"""
+회의 요약 백그라운드 작업 큐 (Summary Jobs)
+- 요약 요청은 job_id를 즉시 반환하고, 결과는 폴링 또는 완료 콜백(로컬 URL)으로 전달
+- 고정 개수 워커가 우선순위 큐에서 작업을 꺼내 처리 (동시 요약 호출 수 상한)
+- 실패 시 지수 백오프로 재시도, 재시도를 모두 실패하면 대체 작업(추출 요약) 결과를 fallback으로 표시
+- 대기/실행 중인 작업은 LRU 제거 대상이 아닌 별도 dict에 보관하고, 끝난 작업만 TTL 저장소로 옮김
+- 같은 회의 + 같은 내용(해시)의 중복 요청은 하나의 작업으로 합침
+"""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_WORKERS = int(os.getenv("SUMMARY_WORKERS", "2"))
+SUMMARY_QUEUE_MAX = int(os.getenv("SUMMARY_QUEUE_MAX", "100"))
+SUMMARY_JOB_RETRIES = int(os.getenv("SUMMARY_JOB_RETRIES", "2"))
+SUMMARY_JOB_TTL_SECONDS = 60 * 60
+RETRY_BACKOFF_BASE = 2.0      # 초
+DEFAULT_PRIORITY = 5          # 낮을수록 먼저 처리 (0~9)
+
+# 완료 콜백은 내부 백엔드로만 전송
+CALLBACK_HOSTS = {
+    host.strip() for host in os.getenv("SUMMARY_CALLBACK_HOSTS", "localhost,127.0.0.1,backend").split(",")
+    if host.strip()
+}
+CALLBACK_TIMEOUT = 10.0
+CALLBACK_RETRIES = 2
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 상한에 도달"""
+
+
+_pending: Dict[str, Dict[str, Any]] = {}  # 대기/실행 중 (SUMMARY_QUEUE_MAX로 상한, 제거하지 않음)
+_jobs = SessionStore(dict, ttl_seconds=SUMMARY_JOB_TTL_SECONDS, max_sessions=2000, name="summary job")
+_job_keys = SessionStore(str, ttl_seconds=SUMMARY_JOB_TTL_SECONDS, max_sessions=2000, name="summary job key")
+_queue: Optional[asyncio.PriorityQueue] = None
+_workers: list = []
+_sequence = 0
+_callback_client: Optional[httpx.AsyncClient] = None
+
+
+def content_hash(meeting_id: Optional[str], payload: Dict[str, Any]) -> str:
+    """중복 판정 키 (회의 ID + 요청 내용)"""
+    body = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(f"{meeting_id or ''}\n{body}".encode("utf-8")).hexdigest()
+
+
+def validate_callback_url(url: Optional[str]) -> Optional[str]:
+    """콜백 URL 검증 (허용된 로컬 호스트의 http(s)만), 통과하지 못하면 ValueError"""
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or parsed.hostname not in CALLBACK_HOSTS:
+        raise ValueError(f"callback_url must point to one of {sorted(CALLBACK_HOSTS)}")
+    return url
+
+
+def _find_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """대기/실행 중 작업 우선, 없으면 끝난 작업 저장소에서 조회"""
+    return _pending.get(job_id) or _jobs.get(job_id)
+
+
+def _ensure_workers():
+    """첫 작업 제출 시 현재 이벤트 루프에서 워커 시작"""
+    global _queue
+    alive = [w for w in _workers if not w.done()]
+    if _queue is None or not alive:
+        # 이전 이벤트 루프가 종료되었으면 큐도 새로 생성
+        _queue = asyncio.PriorityQueue()
+    _workers[:] = alive
+    for i in range(len(alive), SUMMARY_WORKERS):
+        _workers.append(asyncio.create_task(_worker(i)))
+
+
+def _enqueue(job_id: str, priority: int):
+    global _sequence
+    _sequence += 1
+    _queue.put_nowait((priority, _sequence, job_id))
+
+
+def submit_summary_job(
+    meeting_id: Optional[str],
+    payload: Dict[str, Any],
+    run: Callable[[], Awaitable[dict]],
+    priority: int = DEFAULT_PRIORITY,
+    callback_url: Optional[str] = None,
+    fallback: Optional[Callable[[], Awaitable[dict]]] = None
+) -> Dict[str, Any]:
+    """
+    요약 작업 제출
+
+    Args:
+        meeting_id: 회의 ID (선택, 중복 판정/콜백에 사용)
+        payload: 요청 내용 (중복 판정용 해시 계산)
+        run: 요약 코루틴 생성 함수 (재시도마다 새로 호출, 실패는 예외로 전달해야 재시도됨)
+        priority: 0~9, 낮을수록 먼저 처리
+        callback_url: 완료 시 결과를 POST할 로컬 URL (선택)
+        fallback: 재시도를 모두 실패했을 때 대신 실행할 코루틴 생성 함수 (선택)
+
+    Returns:
+        {"job_id", "status", "deduplicated"}
+    """
+    key = content_hash(meeting_id, payload)
+    existing_id = _job_keys.get(key)
+    existing = _find_job(existing_id) if existing_id else None
+    if existing and existing["status"] != "failed":
+        if callback_url and callback_url not in existing["callbacks"]:
+            existing["callbacks"].append(callback_url)
+        logger.info(f"Summary job deduplicated: {existing_id} (meeting={meeting_id})")
+        return {"job_id": existing_id, "status": existing["status"], "deduplicated": True}
+
+    _ensure_workers()
+    if len(_pending) >= SUMMARY_QUEUE_MAX:
+        raise JobQueueFull(f"summary queue is full ({SUMMARY_QUEUE_MAX})")
+
+    job_id = uuid.uuid4().hex
+    _pending[job_id] = {
+        "job_id": job_id,
+        "meeting_id": meeting_id,
+        "status": "queued",
+        "priority": priority,
+        "attempts": 0,
+        "result": None,
+        "error": None,
+        "fallback": False,
+        "created": time.time(),
+        "finished": None,
+        "callbacks": [callback_url] if callback_url else [],
+        "run": run,
+        "fallback_run": fallback,
+        "done": asyncio.Event(),
+    }
+    _job_keys.set(key, job_id)
+    _enqueue(job_id, priority)
+    logger.info(f"Summary job queued: {job_id} (meeting={meeting_id}, priority={priority}, queued={_queue.qsize()})")
+    return {"job_id": job_id, "status": "queued", "deduplicated": False}
+
+
+async def _worker(index: int):
+    while True:
+        _, _, job_id = await _queue.get()
+        try:
+            job = _pending.get(job_id)
+            if job is not None:
+                await _process(job)
+        except Exception as e:
+            logger.error(f"Summary worker {index} error: {e}")
+        finally:
+            _queue.task_done()
+
+
+async def _process(job: Dict[str, Any]):
+    """작업 1회 시도 (실패 시 백오프 후 다시 큐에 넣음)"""
+    job["status"] = "running"
+    job["attempts"] += 1
+    try:
+        job["result"] = await job["run"]()
+        job["status"] = "done"
+    except Exception as e:
+        job["error"] = str(e)
+        if job["attempts"] <= SUMMARY_JOB_RETRIES:
+            delay = RETRY_BACKOFF_BASE ** job["attempts"]
+            logger.warning(f"Summary job {job['job_id']} failed (attempt {job['attempts']}), retrying in {delay:.0f}s: {e}")
+            job["status"] = "queued"
+            asyncio.get_running_loop().call_later(delay, _enqueue, job["job_id"], job["priority"])
+            return
+        logger.error(f"Summary job {job['job_id']} failed: {e}")
+        job["status"] = "failed"
+        if job["fallback_run"] is not None:
+            try:
+                job["result"] = await job["fallback_run"]()
+                job["status"] = "done"
+                job["fallback"] = True
+            except Exception as fallback_error:
+                logger.error(f"Summary job {job['job_id']} fallback failed: {fallback_error}")
+
+    job["finished"] = time.time()
+    _jobs.set(job["job_id"], _pending.pop(job["job_id"]))
+    job["done"].set()
+    if job["callbacks"]:
+        asyncio.create_task(_send_callbacks(job))
+
+
+async def _send_callbacks(job: Dict[str, Any]):
+    """완료 콜백 전송 (실패는 기록만, 결과는 폴링으로도 조회 가능)"""
+    global _callback_client
+    if _callback_client is None:
+        _callback_client = httpx.AsyncClient(timeout=CALLBACK_TIMEOUT)
+
+    body = job_status(job)
+    for url in job["callbacks"]:
+        for attempt in range(CALLBACK_RETRIES + 1):
+            try:
+                response = await _callback_client.post(url, json=body)
+                response.raise_for_status()
+                break
+            except Exception as e:
+                if attempt == CALLBACK_RETRIES:
+                    logger.warning(f"Summary job callback failed: {url} ({e})")
+                else:
+                    await asyncio.sleep(RETRY_BACKOFF_BASE ** attempt)
+
+
+def job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    """외부 응답용 작업 상태"""
+    return {
+        "job_id": job["job_id"],
+        "meeting_id": job["meeting_id"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "result": job["result"],
+        "fallback": job["fallback"],
+        "error": job["error"] if job["status"] == "failed" or job["fallback"] else None,
+    }
+
+
+def get_summary_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    요약 작업 상태 조회
+
+    Returns:
+        {"job_id", "meeting_id", "status": queued | running | done | failed, "attempts", "result",
+         "fallback": 재시도를 모두 실패해 대체 결과인지, "error"}
+        또는 None (없거나 만료)
+    """
+    job = _find_job(job_id)
+    return job_status(job) if job else None
+
+
+async def wait_summary_job(job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """작업이 끝날 때까지 대기 (timeout 초과 시 현재 상태 반환)"""
+    job = _find_job(job_id)
+    if job is None:
+        return None
+    try:
+        await asyncio.wait_for(job["done"].wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    return job_status(job)
+
+
+def get_job_metrics() -> Dict[str, Any]:
+    """큐 상태 (메트릭 엔드포인트용)"""
+    return {
+        "workers": SUMMARY_WORKERS,
+        "queued": _queue.qsize() if _queue else 0,
+        "pending": len(_pending),
+        "jobs": len(_jobs),
+    }
@@ -0,0 +1,107 @@
+"""
+텍스트 벡터화 (Text Vectors)
+- 문자 n-gram 해싱 벡터 (사전 없이 고정 차원, 한국어 띄어쓰기/조사 변화에 강함)
+- 해시는 NumPy 배열 연산으로 계산 (프로세스마다 바뀌는 Python hash() 대신 고정 다항식 해시)
+- 여러 텍스트를 하나의 배열로 이어 붙여 한 번에 벡터화 (텍스트당 NumPy 호출 비용 제거)
+- 학습/추론에서 같은 함수를 사용하므로 저장된 가중치와 항상 같은 특징 공간
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+DEFAULT_DIM = 2 ** 12
+DEFAULT_NGRAM_RANGE = (1, 3)
+
+_MASK = (1 << 64) - 1
+_PRIME = np.uint64(1_000_003)
+_MIX = 0x9E3779B97F4A7C15
+_SHIFT_A = np.uint64(29)
+_SHIFT_B = np.uint64(32)
+
+
+def _normalize(text: str) -> str:
+    """소문자화, 연속 공백 정리, 앞뒤 공백 추가 (단어 시작/끝 n-gram 구분)"""
+    return " " + " ".join(text.lower().split()) + " "
+
+
+def sparse_rows(
+    texts: List[str],
+    dim: int = DEFAULT_DIM,
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    텍스트 리스트의 L2 정규화 희소 행렬 (COO 형식) - 값은 1 + log(빈도)
+
+    Returns:
+        (행 번호, 열 인덱스, 값) - 행 번호 순으로 정렬
+    """
+    normalized = [_normalize(text) for text in texts]
+    lengths = np.fromiter((len(t) for t in normalized), dtype=np.intp, count=len(normalized))
+    codes = np.frombuffer("".join(normalized).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    row_of = np.repeat(np.arange(len(texts), dtype=np.intp), lengths)
+
+    keys = []
+    low, high = ngram_range
+    h = None
+    for n in range(1, high + 1):
+        # n-gram 해시를 (n-1)-gram 해시에서 갱신
+        h = codes.copy() if h is None else h[:-1] * _PRIME + codes[n - 1:]
+        if not len(h):
+            break
+        if n < low:
+            continue
+        # 텍스트 경계를 넘는 n-gram 제외
+        rows = row_of[:len(h)]
+        valid = rows == row_of[n - 1:]
+        hashed = h[valid] + np.uint64((n * _MIX) & _MASK)
+        hashed ^= hashed >> _SHIFT_A
+        hashed *= np.uint64(_MIX)
+        hashed ^= hashed >> _SHIFT_B
+        keys.append(rows[valid] * dim + (hashed % np.uint64(dim)).astype(np.intp))
+
+    if not keys:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty, np.zeros(0, dtype=np.float32)
+
+    unique_keys, counts = np.unique(np.concatenate(keys), return_counts=True)
+    rows, indices = np.divmod(unique_keys, dim)
+    values = (1.0 + np.log(counts)).astype(np.float32)
+    norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(texts)))
+    values /= norms[rows].astype(np.float32)
+    return rows, indices, values
+
+
+def sparse_vector(
+    text: str,
+    dim: int = DEFAULT_DIM,
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    단일 텍스트의 희소 벡터 (인덱스, 값)
+
+    가중치 벡터와의 내적은 weights[indices] @ values
+    """
+    _, indices, values = sparse_rows([text], dim, ngram_range)
+    return indices, values
+
+
+def dense_matrix(
+    texts: List[str],
+    dim: int = DEFAULT_DIM,
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE
+) -> np.ndarray:
+    """텍스트 리스트의 밀집 행렬 (len(texts), dim) - 행마다 L2 정규화 (코사인 유사도 = 내적)"""
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    rows, indices, values = sparse_rows(texts, dim, ngram_range)
+    matrix[rows, indices] = values
+    return matrix
+
+
+def dense_vector(
+    text: str,
+    dim: int = DEFAULT_DIM,
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE
+) -> np.ndarray:
+    """L2 정규화된 밀집 벡터 (dim,)"""
+    return dense_matrix([text], dim, ngram_range)[0]
@@ -0,0 +1,302 @@
+"""
+전사 윈도우 (Transcript Window)
+- 토큰 수 기준으로 최근 대화는 원문 그대로 유지
+- 오래된 대화는 추출된 사실 + 주기적 LLM 미니 요약으로 압축
+- 회의 길이와 무관하게 프롬프트 크기 일정 유지
+"""
+
+import re
+import asyncio
+import logging
+from collections import deque
+from typing import List, Optional, Tuple
+
+from app.services.session_store import ChunkCursor, SessionStore
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트별 전사 토큰 예산
+QUESTION_TOKEN_BUDGET = 3000
+SUMMARY_TOKEN_BUDGET = 6000
+SUMMARY_CHUNK_TOKEN_BUDGET = 3000  # 긴 회의 계층 요약의 구간 크기
+
+# 윈도우 기본 설정
+DEFAULT_RECENT_TOKENS = 2500      # 원문 유지 구간
+DIGEST_TOKEN_BUDGET = 500         # 압축 다이제스트 상한
+SUMMARY_INTERVAL_TOKENS = 2000    # 이만큼 밀려나면 LLM 미니 요약 갱신
+MAX_PENDING_SUMMARY_TOKENS = 6000 # 요약 대기 텍스트 상한
+MAX_DIGEST_FACTS = 30             # 보관할 수치 정보 개수
+
+# 한글/한자는 대략 글자당 1토큰, 그 외는 4글자당 1토큰
+_WIDE_CHAR_RE = re.compile(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u4e00-\u9fff]')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+
+MINI_SUMMARY_PROMPT = """다음은 진행 중인 투자 미팅의 앞부분입니다.
+이전 요약과 새 대화를 합쳐, 이후 질문 생성에 필요한 사실만 5문장 이내로 요약하세요.
+숫자/지표, 결정 사항, 미해결 질문을 우선 포함하세요.
+
+## 이전 요약:
+{previous_summary}
+
+## 새 대화:
+{text}
+
+요약만 출력하세요."""
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 토큰 수 추정
+
+    한국어 위주 전사에서 실제 토큰 수보다 약간 크게 잡히도록 보수적으로 계산
+    """
+    if not text:
+        return 0
+    wide = len(_WIDE_CHAR_RE.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+
+def split_tail_by_tokens(text: str, max_tokens: int) -> Tuple[str, str]:
+    """
+    텍스트를 (앞부분, 토큰 예산 내 뒷부분)으로 분리
+
+    문장 경계를 우선 사용하고, 한 문장이 예산을 넘으면 글자 단위로 자름
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return "", text
+
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(text) if s]
+    tail = []
+    used = 0
+    for sentence in reversed(sentences):
+        tokens = estimate_tokens(sentence)
+        if used + tokens > max_tokens:
+            break
+        tail.append(sentence)
+        used += tokens
+
+    if tail:
+        tail.reverse()
+        head = sentences[:len(sentences) - len(tail)]
+        return " ".join(head), " ".join(tail)
+
+    # 마지막 문장 하나가 예산보다 큼 → 글자 단위로 뒷부분 유지
+    last = sentences[-1]
+    keep_chars = max(1, int(len(last) * max_tokens / estimate_tokens(last)))
+    head = " ".join(sentences[:-1] + [last[:-keep_chars]])
+    return head, last[-keep_chars:]
+
+
+class TranscriptWindow:
+    """
+    최근 N 토큰은 원문, 그 이전은 압축 다이제스트로 유지하는 전사 윈도우
+
+    Args:
+        recent_token_budget: 원문으로 유지할 최근 대화 토큰 수
+        digest_token_budget: 압축 다이제스트 최대 토큰 수
+        summary_interval_tokens: LLM 미니 요약을 갱신할 누적 압축 토큰 수
+    """
+
+    def __init__(
+        self,
+        recent_token_budget: int = DEFAULT_RECENT_TOKENS,
+        digest_token_budget: int = DIGEST_TOKEN_BUDGET,
+        summary_interval_tokens: int = SUMMARY_INTERVAL_TOKENS
+    ):
+        self.recent_token_budget = recent_token_budget
+        self.digest_token_budget = digest_token_budget
+        self.summary_interval_tokens = summary_interval_tokens
+
+        self.recent: deque = deque()  # (text, tokens)
+        self.recent_tokens = 0
+        self.chunk_count = 0
+        self._cursor = ChunkCursor()
+
+        # 압축 다이제스트
+        self.metrics: set = set()
+        self.topics: set = set()
+        self.numeric_facts: deque = deque(maxlen=MAX_DIGEST_FACTS)
+        self.summary = ""
+
+        # LLM 미니 요약 대기 텍스트
+        self._pending: deque = deque()
+        self._pending_tokens = 0
+        self._summary_task: Optional[asyncio.Task] = None
+
+    def append(self, text: str):
+        """새 전사 청크 추가 (예산을 넘는 오래된 청크는 압축)"""
+        self.chunk_count += 1
+        text = (text or "").strip()
+        if not text:
+            return
+
+        tokens = estimate_tokens(text)
+        if tokens > self.recent_token_budget:
+            head, text = split_tail_by_tokens(text, self.recent_token_budget)
+            if head:
+                self._compress(head)
+            tokens = estimate_tokens(text)
+
+        self.recent.append((text, tokens))
+        self.recent_tokens += tokens
+
+        while self.recent_tokens > self.recent_token_budget and len(self.recent) > 1:
+            old_text, old_tokens = self.recent.popleft()
+            self.recent_tokens -= old_tokens
+            self._compress(old_text)
+
+    def sync(self, transcripts: List[str]):
+        """
+        요청의 전사 리스트(이전 전사 + 현재 청크)에서 아직 반영하지 않은 청크만 추가
+
+        누적 리스트, 고정 크기 윈도우, 현재 청크만 보내는 경우 모두 마지막으로 반영한 청크 위치 기준으로 새 청크 판별
+        """
+        for text in self._cursor.take_new(transcripts):
+            self.append(text)
+
+    def _compress(self, text: str):
+        """밀려난 대화에서 사실 추출 후 다이제스트에 반영"""
+        from app.services.context_analyzer import (
+            extract_mentioned_topics,
+            extract_answered_questions
+        )
+
+        mentioned = extract_mentioned_topics([text])
+        self.metrics.update(mentioned["metrics_mentioned"])
+        self.topics.update(mentioned["topics_discussed"])
+        for fact in extract_answered_questions([text]):
+            fact = fact.strip()
+            if fact and fact not in self.numeric_facts:
+                self.numeric_facts.append(fact)
+
+        tokens = estimate_tokens(text)
+        self._pending.append((text, tokens))
+        self._pending_tokens += tokens
+        while self._pending_tokens > MAX_PENDING_SUMMARY_TOKENS and len(self._pending) > 1:
+            _, dropped = self._pending.popleft()
+            self._pending_tokens -= dropped
+
+    def needs_summary(self) -> bool:
+        """LLM 미니 요약 갱신 필요 여부"""
+        return self._pending_tokens >= self.summary_interval_tokens
+
+    def schedule_summary(self):
+        """필요 시 백그라운드로 미니 요약 갱신 (요청 경로를 막지 않음)"""
+        if not self.needs_summary():
+            return
+        if self._summary_task and not self._summary_task.done():
+            return
+        self._summary_task = asyncio.create_task(self.refresh_summary())
+
+    async def refresh_summary(self):
+        """대기 중인 압축 텍스트로 미니 요약 갱신"""
+        if not self._pending:
+            return
+
+        text = "\n".join(t for t, _ in self._pending)
+        self._pending.clear()
+        self._pending_tokens = 0
+
+        try:
+            self.summary = await summarize_evicted_context(self.summary, text)
+            logger.info(f"Refreshed transcript mini-summary ({estimate_tokens(self.summary)} tokens)")
+        except Exception as e:
+            # 추출된 사실은 이미 다이제스트에 있으므로 요약 실패는 무시
+            logger.warning(f"Mini-summary refresh failed: {e}")
+
+    def render_digest(self) -> str:
+        """압축 다이제스트 문자열 (토큰 예산 내)"""
+        from app.services.context_analyzer import TOPIC_NAMES
+
+        if not (self.summary or self.metrics or self.topics or self.numeric_facts):
+            return ""
+
+        lines = ["[이전 대화 요약]"]
+        if self.summary:
+            _, summary = split_tail_by_tokens(self.summary, self.digest_token_budget // 2)
+            lines.append(summary)
+        if self.metrics:
+            lines.append(f"- 언급된 지표: {', '.join(sorted(self.metrics))}")
+        if self.topics:
+            lines.append(f"- 논의된 주제: {', '.join(TOPIC_NAMES.get(t, t) for t in sorted(self.topics))}")
+
+        used = estimate_tokens("\n".join(lines))
+        facts = []
+        for fact in reversed(self.numeric_facts):  # 최근 수치 우선
+            tokens = estimate_tokens(fact) + 2
+            if used + tokens > self.digest_token_budget:
+                break
+            facts.append(f"  - {fact}")
+            used += tokens
+        if facts:
+            lines.append("- 수치 정보:")
+            lines.extend(reversed(facts))
+
+        return "\n".join(lines)
+
+    def render(self, max_tokens: Optional[int] = None) -> str:
+        """
+        프롬프트용 전사 (다이제스트 + 최근 원문)
+
+        Args:
+            max_tokens: 전체 토큰 상한 (윈도우 예산보다 작으면 최근 원문을 더 줄임)
+        """
+        recent = "\n".join(t for t, _ in self.recent)
+        digest = self.render_digest()
+        if max_tokens is not None:
+            budget = max(1, max_tokens - estimate_tokens(digest))
+            _, recent = split_tail_by_tokens(recent, budget)
+        if not digest:
+            return recent
+        return f"{digest}\n\n[최근 대화]\n{recent}"
+
+
+async def summarize_evicted_context(previous_summary: str, text: str) -> str:
+    """밀려난 대화를 이전 요약과 합쳐 미니 요약 생성 (gpt-4o-mini)"""
+    from app.services.llm_gateway import openai_chat
+
+    response = await openai_chat(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "user", "content": MINI_SUMMARY_PROMPT.format(
+                previous_summary=previous_summary or "없음",
+                text=text
+            )}
+        ],
+        temperature=0.3,
+        max_tokens=300,
+    )
+    return response.choices[0].message.content.strip()
+
+
+def fit_transcript(text: str, max_tokens: int) -> str:
+    """
+    단일 전사 문자열을 토큰 예산에 맞춤
+
+    예산 이내면 그대로, 넘으면 최근 부분은 원문 + 앞부분은 추출 사실 다이제스트로 대체
+    (LLM 호출 없음, 전사 길이에 선형)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    digest_budget = min(DIGEST_TOKEN_BUDGET, max_tokens // 4)
+    window = TranscriptWindow(
+        recent_token_budget=max_tokens - digest_budget,
+        digest_token_budget=digest_budget
+    )
+    head, tail = split_tail_by_tokens(text, window.recent_token_budget)
+    if head:
+        window._compress(head)
+    window.append(tail)
+
+    logger.info(f"Fitted transcript to {max_tokens} tokens (from ~{estimate_tokens(text)})")
+    return window.render()
+
+
+# 회의별 전사 윈도우
+_windows = SessionStore(TranscriptWindow, name="transcript window")
+
+
+def get_transcript_window(meeting_id: str) -> TranscriptWindow:
+    """회의 ID에 해당하는 전사 윈도우 (없으면 생성)"""
+    return _windows.get_or_create(meeting_id)
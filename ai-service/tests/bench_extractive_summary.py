@@ -0,0 +1,115 @@
+"""
+폴백 요약 벤치마크 스크립트
+
+1시간 분량(약 1,200 발화)의 합성 회의 전사로 기존 키워드 루프 폴백과
+추출 요약(TF-IDF 중심 유사도 + 중복 제거) 폴백의 처리 시간과 결과를 비교합니다.
+목표: 1시간 회의 기준 50ms 이내. API 키 없이 실행됩니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_extractive_summary
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.mock_data import MOCK_TRANSCRIPT_SEGMENTS
+from app.services.summary_generator import generate_fallback_summary
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+UTTERANCES = 1200   # 3초 간격 발화 기준 약 1시간
+RUNS = 5
+SEED = 42
+TARGET_MS = 50
+
+EXTRA_UTTERANCES = [
+    ("투자자", "현재 MRR은 얼마인가요?"),
+    ("대표", "저희는 현재 MRR 3천만원을 달성하고 있고 전월 대비 15% 성장했습니다."),
+    ("투자자", "CAC는 어떻게 되나요? 주요 채널은 무엇인가요?"),
+    ("대표", "약 15만원 정도이고, 목표는 10만원 이하로 낮추는 것입니다."),
+    ("투자자", "다음 주까지 코호트별 리텐션 자료를 보내주세요."),
+    ("대표", "네, 금요일까지 정리해서 공유하겠습니다."),
+    ("투자자", "그럼 후속 미팅은 실사 자료 검토 후에 하기로 하죠."),
+    ("대표", "시리즈 A는 30억 규모로 진행하기로 결정했습니다."),
+    ("대표", "런웨이는 18개월 정도 남아 있습니다."),
+    ("투자자", "네."),
+    ("대표", "감사합니다."),
+]
+
+
+def build_transcripts(rng: random.Random) -> list:
+    """발화 풀에서 무작위 추출, 숫자를 바꿔 대부분 서로 다른 문장이 되도록 함"""
+    pool = list(EXTRA_UTTERANCES)
+    for sample in MOCK_TRANSCRIPT_SEGMENTS:
+        pool.extend((seg["speaker"], seg["text"]) for seg in sample["segments"])
+
+    transcripts = []
+    for i in range(UTTERANCES):
+        speaker, text = rng.choice(pool)
+        text = re.sub(r"\d+", lambda m: str(rng.randint(1, 99)), text)
+        transcripts.append({"speaker": speaker, "text": text, "start_time": i * 3.0})
+    return transcripts
+
+
+def legacy_fallback(transcripts: list) -> list:
+    """기존 방식: 키워드마다 전체 텍스트를 '.'으로 다시 분리, 첫 매칭 문장을 100자에서 자름"""
+    transcript_text = " ".join([t['text'] for t in transcripts])
+    key_points = []
+    keywords = ['MRR', 'CAC', 'LTV', 'Churn', '매출', '투자', '성장률', '팀', '기술', '고객']
+    for keyword in keywords:
+        if keyword in transcript_text:
+            sentences = transcript_text.split('.')
+            for s in sentences:
+                if keyword in s and len(s.strip()) > 10:
+                    key_points.append(s.strip()[:100])
+                    break
+    return key_points[:5]
+
+
+def timed_ms(fn, *args) -> tuple:
+    result = None
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main():
+    print("\n" + "=" * 60)
+    print(f"ONNO - Fallback Summary Benchmark ({UTTERANCES:,} utterances, best of {RUNS})")
+    print("=" * 60)
+
+    transcripts = build_transcripts(random.Random(SEED))
+    generate_fallback_summary(transcripts[:10], [])  # 워밍업
+
+    legacy, legacy_ms = timed_ms(legacy_fallback, transcripts)
+    summary, extractive_ms = timed_ms(generate_fallback_summary, transcripts, [])
+
+    print(f"  Legacy keyword loop:     {legacy_ms:8.1f}ms")
+    print(f"  Extractive summarizer:   {extractive_ms:8.1f}ms  (target < {TARGET_MS}ms: {extractive_ms < TARGET_MS})")
+
+    print("\n  [Legacy key points]")
+    for point in legacy:
+        print(f"    - {point}")
+    print("\n  [Extractive]")
+    print(f"    summary: {summary['summary']}")
+    for name, key in [("key points", "keyPoints"), ("decisions", "decisions"), ("action items", "actionItems")]:
+        print(f"    {name}:")
+        for item in summary[key]:
+            print(f"      - {item}")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+LLM 응답 JSON 파서 퍼즈 + 벤치마크 스크립트
+
+정상 응답을 변형한 수천 개의 깨진 응답으로
+기존 greedy 정규식 방식과 새 스캐너의 복구율/처리 시간을 비교합니다.
+API 키 없이 실행됩니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_json_parser
+"""
+
+import json
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.json_parser import (
+    QUESTIONS_SCHEMA,
+    extract_json_object,
+    get_parse_metrics,
+    parse_llm_json,
+)
+
+# 퍼즈 중 파싱 실패 로그는 출력하지 않음
+logging.getLogger("app.services.json_parser").setLevel(logging.ERROR)
+
+FUZZ_CASES = 5000
+SEED = 42
+
+SAMPLE_QUESTIONS = [
+    ("현재 CAC는 얼마이며 LTV 대비 비율은 어떻게 되나요?", "critical", "metrics"),
+    ("월간 리텐션율은 어느 수준인가요?", "important", "metrics"),
+    ("창업팀의 도메인 경험은 어떻게 구성되어 있나요?", "important", "team"),
+    ("경쟁사 대비 차별화 포인트는 무엇인가요? {핵심}", "critical", "strategy"),
+    ("\"번 레이트\"와 런웨이는 어떻게 되나요?", "follow_up", "risk"),
+]
+
+PROSE_PREFIXES = [
+    "",
+    "다음은 질문입니다:\n",
+    "Here is the JSON you asked for:\n",
+    "분석 결과 {요약}을 기반으로 생성했습니다.\n",
+    "중괄호 { 를 포함한 설명문입니다.\n",
+]
+
+PROSE_SUFFIXES = [
+    "",
+    "\n추가로 궁금한 점이 있으면 말씀해주세요.",
+    "\n위 질문은 {우선순위} 순으로 정렬했습니다.",
+    "\n} 끝.",
+]
+
+
+def make_payload(rng: random.Random) -> dict:
+    count = rng.randint(1, 5)
+    questions = []
+    for text, priority, category in rng.sample(SAMPLE_QUESTIONS, count):
+        questions.append({
+            "text": text,
+            "priority": priority,
+            "reason": "투자 의사결정에 중요한 정보입니다 \\ 확인 필요",
+            "category": category,
+        })
+    return {"questions": questions}
+
+
+def mutate(rng: random.Random, payload: dict) -> tuple:
+    """
+    정상 페이로드를 깨진 응답으로 변형
+
+    Returns:
+        (응답 텍스트, 질문이 복구 가능해야 하는지 여부, 변형 종류)
+    """
+    body = json.dumps(payload, ensure_ascii=False, indent=rng.choice([None, 2]))
+    kind = rng.choice([
+        "plain", "fence", "prose", "stray_brace", "trailing_comma",
+        "truncated", "two_objects", "garbage",
+    ])
+    recoverable = True
+
+    if kind == "fence":
+        body = f"```json\n{body}\n```"
+    elif kind == "prose":
+        body = rng.choice(PROSE_PREFIXES) + body + rng.choice(PROSE_SUFFIXES)
+    elif kind == "stray_brace":
+        body = "설명 { 시작 " + body + " 그리고 } 끝 {"
+    elif kind == "trailing_comma":
+        body = body.replace("}\n  ]", "},\n  ]").replace("}]", "},]")
+    elif kind == "truncated":
+        # 첫 질문 이후 임의 지점에서 잘림
+        first_end = body.find("}") + 1
+        if first_end <= 0 or first_end >= len(body) - 1:
+            recoverable = False
+        else:
+            body = body[:rng.randint(first_end, len(body) - 1)]
+    elif kind == "two_objects":
+        body = '{"note": "예시"}\n' + body + '\n{"extra": true}'
+    elif kind == "garbage":
+        body = "죄송합니다. 요청을 처리할 수 없습니다. {질문 없음"
+        recoverable = False
+
+    return body, recoverable, kind
+
+
+def legacy_extract(text: str):
+    """기존 방식: greedy 정규식 + json.loads"""
+    match = re.search(r'\{[\s\S]*\}', text)
+    if match:
+        try:
+            return json.loads(match.group())
+        except json.JSONDecodeError:
+            return None
+    return None
+
+
+def run_fuzz():
+    print("\n" + "=" * 60)
+    print(f"FUZZ: {FUZZ_CASES} malformed responses")
+    print("=" * 60)
+
+    rng = random.Random(SEED)
+    cases = [mutate(rng, make_payload(rng)) for _ in range(FUZZ_CASES)]
+
+    by_kind = {}
+    for text, recoverable, kind in cases:
+        stats = by_kind.setdefault(kind, {"total": 0, "legacy": 0, "scanner": 0, "false_positive": 0})
+        stats["total"] += 1
+
+        legacy = legacy_extract(text)
+        if recoverable and isinstance(legacy, dict) and legacy.get("questions"):
+            stats["legacy"] += 1
+
+        parsed = parse_llm_json(text, QUESTIONS_SCHEMA, "fuzz")
+        if parsed is not None:
+            if recoverable:
+                stats["scanner"] += 1
+            else:
+                stats["false_positive"] += 1
+
+    print(f"  {'kind':<16}{'total':>8}{'legacy':>10}{'scanner':>10}{'false+':>8}")
+    for kind, stats in sorted(by_kind.items()):
+        print(f"  {kind:<16}{stats['total']:>8}{stats['legacy']:>10}{stats['scanner']:>10}{stats['false_positive']:>8}")
+
+    metrics = get_parse_metrics().get("fuzz", {})
+    print(f"\n  Parse metrics: {metrics}")
+    return cases
+
+
+def run_benchmark(cases):
+    print("\n" + "=" * 60)
+    print("BENCHMARK: throughput on fuzz corpus")
+    print("=" * 60)
+
+    texts = [c[0] for c in cases]
+
+    start = time.perf_counter()
+    for text in texts:
+        legacy_extract(text)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        extract_json_object(text, ["questions"])
+    scanner_time = time.perf_counter() - start
+
+    print(f"  Legacy regex:  {legacy_time * 1000:.1f}ms ({legacy_time / len(texts) * 1e6:.1f}us/response)")
+    print(f"  Scanner:       {scanner_time * 1000:.1f}ms ({scanner_time / len(texts) * 1e6:.1f}us/response)")
+
+    print("\n" + "=" * 60)
+    print("BENCHMARK: typical responses (plain / fenced JSON, json.loads fast path)")
+    print("=" * 60)
+
+    rng = random.Random(SEED)
+    typical = []
+    for _ in range(FUZZ_CASES):
+        body = json.dumps(make_payload(rng), ensure_ascii=False, indent=rng.choice([None, 2]))
+        typical.append(rng.choice([body, f"```json\n{body}\n```"]))
+
+    start = time.perf_counter()
+    for text in typical:
+        legacy_extract(text)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in typical:
+        extract_json_object(text, ["questions"])
+    parser_time = time.perf_counter() - start
+
+    print(f"  Legacy regex:  {legacy_time / len(typical) * 1e6:.1f}us/response")
+    print(f"  Parser:        {parser_time / len(typical) * 1e6:.1f}us/response")
+
+    print("\n" + "=" * 60)
+    print("BENCHMARK: pathological input (many '{' without '}')")
+    print("=" * 60)
+
+    for size in [1_000, 4_000, 16_000]:
+        text = "{ " * size
+
+        start = time.perf_counter()
+        legacy_extract(text)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        extract_json_object(text, ["questions"])
+        scanner_time = time.perf_counter() - start
+
+        print(f"  {size:>6} braces: legacy {legacy_time * 1000:8.1f}ms, scanner {scanner_time * 1000:6.1f}ms")
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("ONNO - JSON Parser Fuzz & Benchmark")
+    print("=" * 60)
+
+    cases = run_fuzz()
+    run_benchmark(cases)
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+패턴 엔진 벤치마크 스크립트
+
+지표/토픽 추출과 화자 역할 추정에서
+기존 패턴별 re.findall / re.search 루프와 단일 스캔 패턴 엔진의 처리 시간을 비교하고,
+두 방식의 결과가 같은지 확인합니다. API 키 없이 실행됩니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_pattern_engine
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.context_analyzer import METRIC_PATTERNS, TOPIC_PATTERNS, scan_mentions
+from app.services.mock_data import MOCK_TRANSCRIPT_SEGMENTS
+from app.services.speaker_analyzer import (
+    FOUNDER_PATTERNS,
+    INVESTOR_PATTERNS,
+    estimate_speaker_role,
+)
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+SIZES = [10_000, 100_000, 1_000_000]
+UTTERANCES = 20_000
+SEED = 42
+
+# 테스트 시나리오 스타일의 발화 (대소문자 섞인 지표 포함)
+EXTRA_UTTERANCES = [
+    "현재 MRR은 3천만원이고, 고객사는 25개입니다.",
+    "CAC가 15만원 정도이고, 첫 구매 LTV가 30만원입니다.",
+    "월간 churn은 2% 수준이고 리텐션은 개선 중입니다.",
+    "번 레이트는 월 8천만원, 런웨이는 18개월입니다.",
+    "경쟁사 대비 차별화 포인트는 무엇인가요?",
+    "팀 구성은 어떻게 되나요? CTO는 어떤 경험이 있으신가요?",
+    "시장 규모는 TAM 기준 2조원으로 보고 있습니다.",
+    "시리즈 A 투자 유치를 계획하고 있습니다.",
+]
+
+
+def build_corpus() -> list:
+    utterances = list(EXTRA_UTTERANCES)
+    for sample in MOCK_TRANSCRIPT_SEGMENTS:
+        utterances.extend(seg["text"] for seg in sample["segments"])
+    return utterances
+
+
+def build_text(rng: random.Random, utterances: list, size: int) -> str:
+    parts = []
+    length = 0
+    while length < size:
+        utterance = rng.choice(utterances)
+        parts.append(utterance)
+        length += len(utterance) + 1
+    return " ".join(parts)[:size]
+
+
+def legacy_scan_mentions(text: str):
+    """기존 방식: 패턴별 re.findall(IGNORECASE)"""
+    metrics, topics, keywords = set(), set(), set()
+    for metric, pattern in METRIC_PATTERNS.items():
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            metrics.add(metric)
+            keywords.update(matches)
+    for topic, pattern in TOPIC_PATTERNS.items():
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            topics.add(topic)
+            keywords.update(matches)
+    return metrics, topics, keywords
+
+
+def legacy_role_scores(text: str):
+    """기존 방식: 패턴별 re.search(IGNORECASE)"""
+    investor = sum(1 for p in INVESTOR_PATTERNS if re.search(p, text, re.IGNORECASE))
+    founder = sum(1 for p in FOUNDER_PATTERNS if re.search(p, text, re.IGNORECASE))
+    return investor, founder
+
+
+def legacy_estimate_role(text: str) -> str:
+    if not text or len(text.strip()) < 5:
+        return "unknown"
+    investor, founder = legacy_role_scores(text)
+    if "?" in text:
+        investor += 2
+    if investor > founder and investor >= 2:
+        return "investor"
+    if founder > investor and founder >= 2:
+        return "founder"
+    return "unknown"
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def run_mentions(rng, utterances):
+    print("\n" + "=" * 60)
+    print("BENCHMARK: metric/topic extraction on joined transcript")
+    print("=" * 60)
+    print(f"  {'chars':>10}{'legacy':>12}{'engine':>12}{'speedup':>10}  same")
+
+    for size in SIZES:
+        text = build_text(rng, utterances, size)
+        legacy, legacy_time = timed(legacy_scan_mentions, text)
+        engine, engine_time = timed(scan_mentions, text)
+        print(
+            f"  {size:>10,}{legacy_time * 1000:>10.1f}ms{engine_time * 1000:>10.1f}ms"
+            f"{legacy_time / engine_time:>9.1f}x  {legacy == engine}"
+        )
+
+
+def run_roles(rng, utterances):
+    print("\n" + "=" * 60)
+    print(f"BENCHMARK: speaker role estimation ({UTTERANCES:,} utterances)")
+    print("=" * 60)
+
+    samples = [rng.choice(utterances) for _ in range(UTTERANCES)]
+
+    legacy, legacy_time = timed(lambda: [legacy_estimate_role(t) for t in samples])
+    # 결과 비교는 정규식 휴리스틱만 (분류기 보완은 bench_role_classifier에서 평가)
+    engine, engine_time = timed(lambda: [estimate_speaker_role(t, use_classifier=False) for t in samples])
+
+    print(f"  Legacy loops:  {legacy_time * 1000:.1f}ms ({legacy_time / UTTERANCES * 1e6:.1f}us/utterance)")
+    print(f"  Engine:        {engine_time * 1000:.1f}ms ({engine_time / UTTERANCES * 1e6:.1f}us/utterance)")
+    print(f"  Same roles:    {legacy == engine}")
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("ONNO - Pattern Engine Benchmark")
+    print("=" * 60)
+
+    rng = random.Random(SEED)
+    utterances = build_corpus()
+    run_mentions(rng, utterances)
+    run_roles(rng, utterances)
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
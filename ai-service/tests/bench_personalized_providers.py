@@ -0,0 +1,150 @@
+"""
+개인화 질문 제공자 비교 벤치마크 스크립트
+
+같은 입력(전사 + 관계 + 페르소나/레벨 조합)으로 OpenAI / Anthropic 제공자의
+지연시간, 토큰 사용량, 예상 비용을 비교합니다. 응답 캐시 적중 시 지연시간도 측정합니다.
+실제 API를 호출하므로 OPENAI_API_KEY / ANTHROPIC_API_KEY가 필요합니다 (없는 제공자는 건너뜀).
+호출이 실패하면 폴백 질문이 반환되므로, 실패한 호출은 따로 세고 지연시간/비용/질문 수에서 제외합니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_personalized_providers
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+
+from app.services.llm_gateway import get_gateway_metrics
+from app.services.model_router import FAST_CLAUDE_MODEL, FAST_OPENAI_MODEL
+from app.services.personalized_questions import (
+    PROVIDER_MODELS,
+    build_personalized_prompt,
+    clear_response_cache,
+    generate_personalized_questions,
+)
+
+load_dotenv()
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+# USD / 1M 토큰 (input, output)
+PRICES = {
+    FAST_OPENAI_MODEL: (0.15, 0.60),
+    FAST_CLAUDE_MODEL: (0.80, 4.00),
+}
+API_KEYS = {"openai": "OPENAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY"}
+
+TRANSCRIPT = """투자자: 안녕하세요, 오늘 미팅 감사합니다. 회사 소개 부탁드립니다.
+창업자: 저희는 중소기업용 AI 회계 자동화 SaaS를 만들고 있습니다.
+창업자: 현재 MRR은 4,500만원이고 지난 6개월간 월 평균 12% 성장했습니다.
+투자자: 고객 수와 이탈률은 어떻게 되나요?
+창업자: 유료 고객은 320곳이고 월 이탈률은 2.5% 수준입니다.
+창업자: CAC는 약 80만원, LTV는 1,200만원 정도로 보고 있습니다.
+투자자: 경쟁사 대비 차별점은 무엇인가요?
+창업자: 은행 거래 내역 자동 분류 정확도가 95%로 경쟁사보다 15%p 높습니다."""
+
+RELATIONSHIP = {
+    "name": "택스봇",
+    "type": "STARTUP",
+    "industry": "FinTech",
+    "stage": "Seed",
+    "structured_data": {"mrr": 45000000, "customers": 320, "churn": 2.5},
+    "meeting_number": 2,
+    "recent_meetings": [{"date": "2026-09-01", "summary": "첫 미팅, 팀과 제품 소개"}],
+}
+
+PROFILES = [
+    {"level": 1, "persona": "ANALYST", "domain": "INVESTMENT_SCREENING"},
+    {"level": 3, "persona": "GUARDIAN", "domain": "INVESTMENT_SCREENING",
+     "preferences": {"risksPref": 0.9, "teamPref": 0.3}},
+    {"level": 4, "persona": "VISIONARY", "domain": "INVESTMENT_SCREENING",
+     "features": ["벤치마크 비교", "예측적 질문"]},
+]
+
+
+def usage(provider: str) -> tuple:
+    stats = get_gateway_metrics().get(provider, {})
+    return stats.get("input_tokens", 0), stats.get("output_tokens", 0)
+
+
+def successes(provider: str) -> int:
+    """게이트웨이를 통해 성공한 호출 수 (실패 시 폴백 결과와 구분)"""
+    return get_gateway_metrics().get(provider, {}).get("success", 0)
+
+
+async def run_provider(provider: str):
+    model = PROVIDER_MODELS[provider]
+    clear_response_cache()
+    before = usage(provider)
+    latencies = []
+    question_counts = []
+    failed = 0
+    for profile in PROFILES:
+        succeeded = successes(provider)
+        start = time.perf_counter()
+        result = await generate_personalized_questions(TRANSCRIPT, RELATIONSHIP, profile, provider=provider)
+        elapsed = time.perf_counter() - start
+        if successes(provider) == succeeded:
+            failed += 1
+            continue
+        latencies.append(elapsed)
+        question_counts.append(len(result["questions"]))
+    after = usage(provider)
+
+    print(f"\n  [{provider}] {model}")
+    if failed:
+        print(f"    failed calls:      {failed}/{len(PROFILES)} (fallback results, excluded below)")
+    if not latencies:
+        print("    no successful calls - latency/cost not measured")
+        return
+
+    # 첫 프로필 응답이 캐시에 있을 때만 캐시 적중 시간 측정
+    cached = None
+    if failed == 0:
+        start = time.perf_counter()
+        await generate_personalized_questions(TRANSCRIPT, RELATIONSHIP, PROFILES[0], provider=provider)
+        cached = time.perf_counter() - start
+
+    input_tokens, output_tokens = after[0] - before[0], after[1] - before[1]
+    price_in, price_out = PRICES.get(model, (0.0, 0.0))
+    cost = (input_tokens * price_in + output_tokens * price_out) / 1_000_000
+    calls = len(latencies)
+
+    print(f"    latency per call:  {sum(latencies) / calls * 1000:8.0f}ms (max {max(latencies) * 1000:.0f}ms)")
+    if cached is not None:
+        print(f"    cached call:       {cached * 1000:8.2f}ms")
+    print(f"    tokens:            {input_tokens:,} in / {output_tokens:,} out ({calls} calls)")
+    print(f"    est. cost:         ${cost:.5f} (${cost / calls:.5f}/call)")
+    print(f"    questions:         {question_counts}")
+
+
+async def main():
+    print("\n" + "=" * 60)
+    print(f"ONNO - Personalized Question Provider Benchmark ({len(PROFILES)} profiles)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        for profile in PROFILES:
+            build_personalized_prompt(TRANSCRIPT, RELATIONSHIP, profile)
+    print(f"\n  Prompt assembly:     {(time.perf_counter() - start) / (1000 * len(PROFILES)) * 1e6:8.1f}us/prompt")
+
+    for provider, env_name in API_KEYS.items():
+        if not os.getenv(env_name):
+            print(f"\n  [{provider}] skipped ({env_name} not set)")
+            continue
+        await run_provider(provider)
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
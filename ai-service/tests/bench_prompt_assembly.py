@@ -0,0 +1,180 @@
+"""
+프롬프트 조립 벤치마크 스크립트
+
+개인화 질문 / 관계 맥락 질문 프롬프트의 조립 시간을 측정합니다. API 키 없이 실행됩니다.
+
+- uncached: 요청마다 str.format + 블록 포맷팅 (캐시 없는 기존 방식)
+- cold: 블록 캐시를 비운 상태 (매 요청이 새 관계/선호도)
+- warm: 같은 관계/선호도가 반복되는 회의 중 요청 (요청마다 새로 파싱된 payload)
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_prompt_assembly
+"""
+
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.services.question_generator as question_generator
+from app.services.personalized_questions import (
+    DOMAIN_LABELS,
+    PERSONALIZED_PROMPT,
+    PERSONA_STYLES,
+    build_personalized_prompt,
+    format_preferences,
+    format_relationship_context,
+    render_features,
+    _format_level_block,
+    _format_persona_block,
+)
+from app.services.prompt_assembly import clear_fragment_caches, get_assembly_metrics
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+REQUESTS = 20_000
+
+TRANSCRIPT = "\n".join([
+    "투자자: 현재 MRR과 성장률은 어떻게 되나요?",
+    "창업자: MRR은 4,500만원이고 지난 6개월간 월 평균 12% 성장했습니다.",
+    "투자자: 고객 수와 이탈률은요?",
+    "창업자: 유료 고객은 320곳이고 월 이탈률은 2.5% 수준입니다.",
+] * 25)
+
+RELATIONSHIP = {
+    "name": "택스봇",
+    "type": "STARTUP",
+    "industry": "FinTech",
+    "stage": "Seed",
+    "notes": "회계법인 파트너십 진행 중",
+    "structured_data": {"mrr": 45000000, "customers": 320, "churn": 2.5, "cac": 800000, "ltv": 12000000},
+    "meeting_number": 3,
+    "recent_meetings": [
+        {
+            "date": f"2026-0{month}-01",
+            "summary": "팀과 제품 소개, 초기 고객 확보 현황과 가격 정책 논의. " * 3,
+            "keyQuestions": ["CAC 회수 기간은?", "대기업 고객 확장 계획은?", "규제 리스크는?"],
+        }
+        for month in range(4, 9)
+    ],
+}
+
+PERSONALIZATION = {
+    "level": 3,
+    "persona": "GUARDIAN",
+    "domain": "INVESTMENT_SCREENING",
+    "features": ["벤치마크 비교", "리스크 감지"],
+    "preferences": {"risksPref": 0.9, "teamPref": 0.3, "tone": "DIRECT", "includeExplanation": True},
+}
+
+
+def uncached_personalized_prompt(transcript: str, relationship: dict, personalization: dict) -> str:
+    """캐시 없는 기존 방식 (요청마다 모든 블록 포맷팅 + str.format)"""
+    persona = personalization.get("persona", "ANALYST")
+    return PERSONALIZED_PROMPT.format(
+        persona_name=PERSONA_STYLES[persona]["name"],
+        persona_block=_format_persona_block(persona),
+        level_block=_format_level_block(personalization.get("level", 1)),
+        domain=DOMAIN_LABELS.get(personalization.get("domain", "GENERAL"), "일반"),
+        features=render_features(personalization.get("features") or []),
+        preferences=format_preferences(personalization.get("preferences") or {}),
+        transcript=transcript,
+        suggested_questions="",
+        relationship_context=format_relationship_context(relationship),
+    )
+
+
+def uncached_relationship_prompt(transcript: str, relationship: dict) -> str:
+    """캐시 없는 기존 방식 (요청마다 관계 조각 포맷팅 + str.format)"""
+    return question_generator.RELATIONSHIP_AWARE_PROMPT.format(
+        **question_generator._format_relationship_fragments(relationship),
+        transcript=transcript,
+        suggested_questions="",
+    )
+
+
+def payloads() -> list:
+    """요청마다 새로 파싱된 payload (실제 서비스처럼 같은 내용, 다른 객체)"""
+    relationship = json.dumps(RELATIONSHIP, ensure_ascii=False)
+    personalization = json.dumps(PERSONALIZATION, ensure_ascii=False)
+    return [(json.loads(relationship), json.loads(personalization)) for _ in range(REQUESTS)]
+
+
+def timed(fn, requests: list) -> float:
+    start = time.perf_counter()
+    for relationship, personalization in requests:
+        fn(relationship, personalization)
+    return (time.perf_counter() - start) / len(requests) * 1e6
+
+
+def run_personalized():
+    requests = payloads()
+    print("\n" + "=" * 60)
+    print(f"PERSONALIZED PROMPT ({REQUESTS:,} requests)")
+    print("=" * 60)
+
+    uncached = timed(lambda r, p: uncached_personalized_prompt(TRANSCRIPT, r, p), requests)
+
+    def cold(r, p):
+        clear_fragment_caches()
+        build_personalized_prompt(TRANSCRIPT, r, p)
+
+    cold_us = timed(cold, requests)
+    clear_fragment_caches()
+    warm = timed(lambda r, p: build_personalized_prompt(TRANSCRIPT, r, p), requests)
+
+    assert build_personalized_prompt(TRANSCRIPT, RELATIONSHIP, PERSONALIZATION) == \
+        uncached_personalized_prompt(TRANSCRIPT, RELATIONSHIP, PERSONALIZATION)
+    for name, us in [("uncached (str.format)", uncached), ("cold cache", cold_us), ("warm cache", warm)]:
+        print(f"  {name:<30}{us:8.1f}us/request")
+
+
+def cached_relationship_prompt(transcript: str, relationship: dict) -> str:
+    """서비스 경로 (캐시된 관계 조각 + 미리 파싱한 템플릿)"""
+    fragments = question_generator._relationship_fragments.get(relationship)
+    return question_generator.RELATIONSHIP_TEMPLATE.render(**fragments, transcript=transcript, suggested_questions="")
+
+
+def run_relationship():
+    requests = payloads()
+    print("\n" + "=" * 60)
+    print(f"RELATIONSHIP PROMPT ({REQUESTS:,} requests)")
+    print("=" * 60)
+
+    uncached = timed(lambda r, p: uncached_relationship_prompt(TRANSCRIPT, r), requests)
+
+    def cold(r, p):
+        clear_fragment_caches()
+        cached_relationship_prompt(TRANSCRIPT, r)
+
+    cold_us = timed(cold, requests)
+    clear_fragment_caches()
+    warm = timed(lambda r, p: cached_relationship_prompt(TRANSCRIPT, r), requests)
+
+    assert cached_relationship_prompt(TRANSCRIPT, RELATIONSHIP) == uncached_relationship_prompt(TRANSCRIPT, RELATIONSHIP)
+    for name, us in [("uncached (str.format)", uncached), ("cold cache", cold_us), ("warm cache", warm)]:
+        print(f"  {name:<30}{us:8.1f}us/request")
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("ONNO - Prompt Assembly Benchmark")
+    print("=" * 60)
+
+    run_personalized()
+    run_relationship()
+
+    print("\n" + "=" * 60)
+    print("ASSEMBLY METRICS")
+    print("=" * 60)
+    print(json.dumps(get_assembly_metrics(), indent=2))
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+화자 역할 분류기 벤치마크 스크립트
+
+정규식 패턴 점수(기존 휴리스틱), 학습된 분류기, 정규식 + 분류기 보완(서비스 기본 경로)의
+정확도와 처리량을 비교합니다. API 키 없이 실행됩니다.
+
+- 보류 평가: test_question_gen.py의 시나리오 발화 (학습 데이터와 거의 같은 문장은 제외)
+- 교차 검증: 내장 학습 데이터 5-fold
+- 중립 발화: 역할과 무관한 일상 발화가 unknown으로 남는지 (판정률이 낮을수록 좋음)
+- unknown 판정은 오답으로 계산하고, 판정률(coverage)을 따로 표시
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_role_classifier
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.role_classifier import (
+    CONFIDENCE_THRESHOLD,
+    builtin_samples,
+    load_model,
+    predict_investor_proba,
+    predict_investor_proba_batch,
+    train,
+)
+from app.services.speaker_analyzer import MIN_ROLE_SCORE, estimate_speaker_role, role_scores
+from app.services.text_vectors import dense_matrix
+from test_question_gen import TEST_TRANSCRIPTS
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+FOLDS = 5
+SEED = 42
+THROUGHPUT_UTTERANCES = 20_000
+LABELS = {1: "investor", 0: "founder"}
+NEAR_DUPLICATE = 0.7   # 학습 문장과 코사인 유사도가 이 이상이면 보류 평가에서 제외
+
+# 역할과 무관한 일상 발화 (어느 쪽으로도 판정하지 않아야 함)
+NEUTRAL_UTTERANCES = [
+    "오늘 날씨가 참 좋네요",
+    "그렇군요 흥미롭네요",
+    "아 그런가요",
+    "좋습니다 다음으로 넘어가죠",
+    "잠시만요 화면 공유하겠습니다",
+    "커피 한 잔 하시겠어요",
+    "제가 잠깐 메모 좀 할게요",
+    "그럼 시작해 볼까요",
+    "오늘 시간 내주셔서 감사해요",
+    "잘 들리시나요",
+    "음 그 부분은 좀 생각해 봐야겠네요",
+    "다음 주에 다시 연락드릴게요",
+    "점심은 드셨어요",
+    "여기 자료 보시면 돼요",
+]
+
+
+def held_out_samples() -> list:
+    """시나리오 전사의 '투자자:' / '창업자:' 발화 (학습 데이터와 거의 같은 문장 제외)"""
+    samples = []
+    for scenario in TEST_TRANSCRIPTS:
+        for line in scenario["transcript"].splitlines():
+            m = re.match(r"\s*(투자자|창업자):\s*(.+)", line)
+            if m:
+                samples.append((m.group(2).strip(), 1 if m.group(1) == "투자자" else 0))
+
+    seen = dense_matrix([text for text, _ in builtin_samples()], ngram_range=(2, 3))
+    held = dense_matrix([text for text, _ in samples], ngram_range=(2, 3))
+    closest = (held @ seen.T).max(axis=1)
+    return [sample for sample, similarity in zip(samples, closest) if similarity < NEAR_DUPLICATE]
+
+
+def heuristic_role(text: str) -> str:
+    investor, founder = role_scores(text)
+    if investor > founder and investor >= MIN_ROLE_SCORE:
+        return "investor"
+    if founder > investor and founder >= MIN_ROLE_SCORE:
+        return "founder"
+    return "unknown"
+
+
+def classifier_role(text: str, model: dict) -> str:
+    proba = predict_investor_proba(text, model)
+    if proba >= CONFIDENCE_THRESHOLD:
+        return "investor"
+    if proba <= 1.0 - CONFIDENCE_THRESHOLD:
+        return "founder"
+    return "unknown"
+
+
+def hybrid_role(text: str, model: dict) -> str:
+    """서비스 기본 경로: 정규식으로 판정되지 않은 발화만 분류기 (정규식 점수가 기운 쪽과 반대면 보류)"""
+    role = heuristic_role(text)
+    if role != "unknown":
+        return role
+    role = classifier_role(text, model)
+    investor, founder = role_scores(text)
+    if role == "investor" and investor < founder or role == "founder" and founder < investor:
+        return "unknown"
+    return role
+
+
+def evaluate(samples: list, model: dict) -> dict:
+    """방식별 (정확도, 판정률)"""
+    methods = {
+        "regex heuristic": lambda t: heuristic_role(t),
+        "classifier": lambda t: classifier_role(t, model),
+        "regex + classifier": lambda t: hybrid_role(t, model),
+    }
+    results = {}
+    for name, predict in methods.items():
+        predictions = [predict(text) for text, _ in samples]
+        correct = sum(p == LABELS[label] for p, (_, label) in zip(predictions, samples))
+        decided = sum(p != "unknown" for p in predictions)
+        results[name] = (correct, decided, len(samples))
+    return results
+
+
+def print_results(results: dict):
+    for name, (correct, decided, total) in results.items():
+        print(f"  {name:<30}accuracy {correct / total:6.1%}   coverage {decided / total:6.1%}")
+
+
+def run_held_out(model: dict):
+    samples = held_out_samples()
+    print("\n" + "=" * 60)
+    print(f"HELD-OUT: test_question_gen scenarios ({len(samples)} utterances)")
+    print("=" * 60)
+    print_results(evaluate(samples, model))
+
+
+def run_neutral(model: dict):
+    print("\n" + "=" * 60)
+    print(f"NEUTRAL: small talk ({len(NEUTRAL_UTTERANCES)} utterances, lower coverage is better)")
+    print("=" * 60)
+    for name, predict in [
+        ("regex heuristic", heuristic_role),
+        ("classifier", lambda t: classifier_role(t, model)),
+        ("regex + classifier", lambda t: hybrid_role(t, model)),
+    ]:
+        decided = [text for text in NEUTRAL_UTTERANCES if predict(text) != "unknown"]
+        print(f"  {name:<30}coverage {len(decided) / len(NEUTRAL_UTTERANCES):6.1%}")
+
+
+def run_cross_validation():
+    samples = builtin_samples()
+    random.Random(SEED).shuffle(samples)
+    print("\n" + "=" * 60)
+    print(f"CROSS-VALIDATION: built-in samples ({len(samples)} utterances, {FOLDS}-fold)")
+    print("=" * 60)
+
+    totals = {}
+    for fold in range(FOLDS):
+        test = samples[fold::FOLDS]
+        train_samples = [s for i, s in enumerate(samples) if i % FOLDS != fold]
+        for name, (correct, decided, total) in evaluate(test, train(train_samples)).items():
+            acc = totals.setdefault(name, [0, 0, 0])
+            acc[0] += correct
+            acc[1] += decided
+            acc[2] += total
+    print_results({name: tuple(values) for name, values in totals.items()})
+
+
+def run_throughput(model: dict):
+    rng = random.Random(SEED)
+    pool = [text for text, _ in held_out_samples() + builtin_samples()]
+    texts = [rng.choice(pool) for _ in range(THROUGHPUT_UTTERANCES)]
+
+    print("\n" + "=" * 60)
+    print(f"THROUGHPUT ({THROUGHPUT_UTTERANCES:,} utterances)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    for text in texts:
+        role_scores(text)
+    heuristic = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        predict_investor_proba(text, model)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predict_investor_proba_batch(texts, model)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        estimate_speaker_role(text)
+    default = time.perf_counter() - start
+
+    for name, elapsed in [
+        ("regex pattern scores", heuristic),
+        ("classifier (per utterance)", single),
+        ("classifier (batch)", batch),
+        ("regex + classifier (default)", default),
+    ]:
+        print(f"  {name:<30}{elapsed * 1000:8.1f}ms  ({elapsed / THROUGHPUT_UTTERANCES * 1e6:6.1f}us/utterance)")
+
+
+def main():
+    print("\n" + "=" * 60)
+    print("ONNO - Role Classifier Benchmark")
+    print("=" * 60)
+
+    model = load_model()
+    if model is None:
+        print("  Model file not found. Train first: python -m app.services.role_classifier")
+        return
+
+    run_held_out(model)
+    run_neutral(model)
+    run_cross_validation()
+    run_throughput(model)
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+답변 여부 확인 벤치마크 스크립트
+
+3시간 분량(약 3,600 발화)의 합성 회의 전사를 청크 단위로 회의 세션에 증분 반영하면서
+후보 질문의 답변 여부 확인(전사 문장 인덱스) 시간과 인덱스 크기를 측정하고,
+키워드/지표 필터만 쓸 때와 걸러지는 질문을 비교합니다.
+목표: 질문당 1ms 이내, 인덱스 크기는 회의 길이와 무관하게 상한 유지.
+질문/투자자 발화와 답을 미루는 문장은 색인하지 않으므로 답변되지 않은 질문은 걸러지지 않아야 합니다.
+API 키 없이 실행됩니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_sentence_index
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.context_analyzer import ContextSession, filter_redundant_questions_with_reasons
+from app.services.mock_data import MOCK_TRANSCRIPT_SEGMENTS
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+UTTERANCES = 3600   # 3초 간격 발화 기준 약 3시간
+CHECKPOINTS = (600, 1200, 2400, 3600)
+RUNS = 20
+SEED = 42
+TARGET_US_PER_QUESTION = 1000
+
+EXTRA_UTTERANCES = [
+    "저희 CAC는 현재 약 3만원 수준이고 회수 기간은 8개월 정도입니다.",
+    "팀은 공동창업자 세 명과 개발자 다섯 명으로 구성되어 있습니다.",
+    "내년 상반기에 일본 시장 진출을 준비하고 있습니다.",
+    "이번 라운드에서 30억을 조달해서 영업 인력을 확충할 계획입니다.",
+    "주요 경쟁사는 A사와 B사인데 저희는 자동화 수준에서 차별화됩니다.",
+    "고객은 주로 직원 50인 이하 중소기업입니다.",
+    "그래서 지금 고민하고 있는 게 가격 정책인데요.",
+    "해외 파트너십은 어떻게 진행하실 계획인가요?",
+    "해외 파트너십은 아직 검토 중입니다.",
+    "네.",
+    "감사합니다.",
+]
+
+# (질문, 카테고리) - 앞쪽 4개는 위 발화에서 표현만 달리 답변된 질문,
+# 나머지는 답변되지 않은 질문 (가격 정책/해외 파트너십은 언급만 되거나 질문 후 답이 미뤄짐)
+CANDIDATES = [
+    {"text": "CAC 회수 기간은 얼마나 되나요?", "category": "FINANCIALS"},
+    {"text": "일본 진출 시점은 언제인가요?", "category": "MARKET"},
+    {"text": "이번 라운드 조달 금액은 얼마인가요?", "category": "FINANCIALS"},
+    {"text": "경쟁사 대비 차별점은 무엇인가요?", "category": "MARKET"},
+    {"text": "가격 정책은 어떻게 정하셨나요?", "category": "BUSINESS_MODEL"},
+    {"text": "해외 파트너십 계획은 어떻게 되나요?", "category": "MARKET"},
+    {"text": "규제 리스크는 어떻게 관리하시나요?", "category": "RISKS"},
+    {"text": "B2B 영업 사이클은 얼마나 걸리나요?", "category": "BUSINESS_MODEL"},
+    {"text": "기술 특허를 보유하고 있나요?", "category": "TECHNOLOGY"},
+]
+
+
+def build_utterances(rng: random.Random) -> list:
+    """발화 풀에서 무작위 추출, 숫자를 바꿔 대부분 서로 다른 문장이 되도록 함"""
+    pool = list(EXTRA_UTTERANCES)
+    for sample in MOCK_TRANSCRIPT_SEGMENTS:
+        pool.extend(seg["text"] for seg in sample["segments"])
+    return [
+        re.sub(r"\d+", lambda m: str(rng.randint(1, 99)), rng.choice(pool))
+        for _ in range(UTTERANCES)
+    ]
+
+
+def timed_us(fn, *args) -> tuple:
+    result = None
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1e6
+
+
+def main():
+    print("\n" + "=" * 60)
+    print(f"ONNO - Answered Check Benchmark ({UTTERANCES:,} utterances, best of {RUNS})")
+    print("=" * 60)
+
+    utterances = build_utterances(random.Random(SEED))
+    session = ContextSession()
+
+    ingested = 0
+    ingest_s = 0.0
+    for checkpoint in CHECKPOINTS:
+        start = time.perf_counter()
+        for text in utterances[ingested:checkpoint]:
+            session.ingest(text)
+        ingest_s += time.perf_counter() - start
+        ingested = checkpoint
+
+        _, us = timed_us(session.sentences.answered, CANDIDATES)
+        per_question = us / len(CANDIDATES)
+        print(
+            f"  {checkpoint:5,} utterances: {len(session.sentences):5,} sentences, "
+            f"{session.sentences.nbytes / 2 ** 20:5.1f}MB, "
+            f"{per_question:6.1f}us/question (target < {TARGET_US_PER_QUESTION}us: "
+            f"{per_question < TARGET_US_PER_QUESTION})"
+        )
+    print(f"  Ingest: {ingest_s * 1e6 / UTTERANCES:.1f}us/utterance")
+
+    index = session.redundancy_index()
+    _, keyword_filtered = filter_redundant_questions_with_reasons(CANDIDATES, index=index)
+    _, filtered = filter_redundant_questions_with_reasons(CANDIDATES, index=index, sentences=session.sentences)
+    keyword_texts = {item["question"]["text"] for item in keyword_filtered}
+
+    print(f"\n  [Keyword/metric filter only] {len(keyword_filtered)}/{len(CANDIDATES)} filtered")
+    for item in keyword_filtered:
+        print(f"    - {item['question']['text']}  ({item['reason']['type']}: {item['reason']['matched']})")
+    print(f"\n  [+ Answered check] {len(filtered)}/{len(CANDIDATES)} filtered")
+    for item in filtered:
+        if item["question"]["text"] in keyword_texts:
+            continue
+        reason = item["reason"]
+        print(f"    - {item['question']['text']}  ({reason['similarity']}: {reason['matched']})")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
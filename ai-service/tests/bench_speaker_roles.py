@@ -0,0 +1,169 @@
+"""
+화자 역할 분석 벤치마크 스크립트
+
+10k개의 합성 세그먼트로 기존 방식(세그먼트별 패턴 re.search + 3회 순회)과
+배치 스코어러(단일 스캔 + 배열 집계)의 처리 시간을 비교하고 결과가 같은지 확인합니다.
+(결과 비교는 정규식 휴리스틱만 사용, 학습된 분류기를 함께 쓰는 기본 경로는 시간만 측정)
+스레드 오프로드 시 이벤트 루프가 얼마나 오래 막히는지도 측정합니다. API 키 없이 실행됩니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_speaker_roles
+"""
+
+import asyncio
+import copy
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.mock_data import MOCK_TRANSCRIPT_SEGMENTS
+from app.services.speaker_analyzer import (
+    FOUNDER_PATTERNS,
+    INVESTOR_PATTERNS,
+    analyze_conversation_roles,
+    analyze_conversation_roles_async,
+)
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+SEGMENTS = 10_000
+SPEAKERS = 4
+SEED = 42
+TICK_SECONDS = 0.001
+
+EXTRA_UTTERANCES = [
+    "현재 MRR은 얼마인가요?",
+    "저희는 현재 MRR 3천만원을 달성하고 있습니다.",
+    "CAC는 어떻게 되나요? 주요 채널은 무엇인가요?",
+    "약 15만원 정도이고, 목표는 10만원 이하로 낮추는 것입니다.",
+    "경쟁사 대비 차별화 포인트는 무엇인가요?",
+    "저희 팀은 AI 전문가 3명으로 구성되어 있습니다.",
+    "네.",
+    "런웨이는 18개월 정도 남아 있습니다.",
+]
+
+
+def build_segments(rng: random.Random) -> list:
+    utterances = list(EXTRA_UTTERANCES)
+    for sample in MOCK_TRANSCRIPT_SEGMENTS:
+        utterances.extend(seg["text"] for seg in sample["segments"])
+
+    return [
+        {
+            "speaker": f"화자{rng.randrange(SPEAKERS) + 1}",
+            "text": rng.choice(utterances),
+            "startTime": i * 3.0,
+        }
+        for i in range(SEGMENTS)
+    ]
+
+
+def legacy_estimate_role(text: str) -> str:
+    """기존 방식: 패턴별 re.search(IGNORECASE)"""
+    if not text or len(text.strip()) < 5:
+        return "unknown"
+    investor = sum(1 for p in INVESTOR_PATTERNS if re.search(p, text, re.IGNORECASE))
+    founder = sum(1 for p in FOUNDER_PATTERNS if re.search(p, text, re.IGNORECASE))
+    if "?" in text:
+        investor += 2
+    if investor > founder and investor >= 2:
+        return "investor"
+    if founder > investor and founder >= 2:
+        return "founder"
+    return "unknown"
+
+
+def legacy_analyze(segments: list) -> list:
+    """기존 방식: 세그먼트별 추정 → 화자별 dict 집계 → 최종 역할 적용 (3회 순회)"""
+    for segment in segments:
+        segment["speakerRole"] = legacy_estimate_role(segment.get("text", ""))
+
+    speaker_roles = {}
+    for segment in segments:
+        counts = speaker_roles.setdefault(segment.get("speaker", ""), {"investor": 0, "founder": 0, "unknown": 0})
+        counts[segment["speakerRole"]] += 1
+
+    final = {}
+    for speaker, counts in speaker_roles.items():
+        if counts["investor"] > counts["founder"]:
+            final[speaker] = "investor"
+        elif counts["founder"] > counts["investor"]:
+            final[speaker] = "founder"
+        else:
+            final[speaker] = "unknown"
+
+    for segment in segments:
+        segment["speakerRole"] = final.get(segment.get("speaker", ""), "unknown")
+    return segments
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+async def max_loop_stall(segments: list) -> float:
+    """분석 중 이벤트 루프 틱 간격의 최댓값 (초)"""
+    stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(TICK_SECONDS)
+            now = time.perf_counter()
+            stall = max(stall, now - last - TICK_SECONDS)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await analyze_conversation_roles_async(segments)
+    done = True
+    await task
+    return stall
+
+
+async def inline_loop_stall(segments: list) -> float:
+    """스레드 오프로드 없이 루프에서 직접 실행했을 때의 블로킹 시간"""
+    start = time.perf_counter()
+    analyze_conversation_roles(segments)
+    return time.perf_counter() - start
+
+
+def main():
+    print("\n" + "=" * 60)
+    print(f"ONNO - Speaker Role Benchmark ({SEGMENTS:,} segments, {SPEAKERS} speakers)")
+    print("=" * 60)
+
+    rng = random.Random(SEED)
+    segments = build_segments(rng)
+
+    legacy, legacy_time = timed(legacy_analyze, copy.deepcopy(segments))
+    batch, batch_time = timed(analyze_conversation_roles, copy.deepcopy(segments), False)
+    _, classifier_time = timed(analyze_conversation_roles, copy.deepcopy(segments))
+
+    print(f"  Legacy (per-segment re.search, 3 passes): {legacy_time * 1000:8.1f}ms")
+    print(f"  Batch (single scan, array counts):        {batch_time * 1000:8.1f}ms")
+    print(f"  Speedup:                                  {legacy_time / batch_time:8.1f}x")
+    print(f"  Same roles:                               {legacy == batch}")
+    print(f"  Batch + classifier (default path):        {classifier_time * 1000:8.1f}ms")
+
+    inline = asyncio.run(inline_loop_stall(copy.deepcopy(segments)))
+    offloaded = asyncio.run(max_loop_stall(copy.deepcopy(segments)))
+    print(f"\n  Event loop blocked (inline):              {inline * 1000:8.1f}ms")
+    print(f"  Max loop stall (thread offload):          {offloaded * 1000:8.1f}ms")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+전사 동기화 벤치마크 스크립트
+
+클라이언트가 보내는 세 가지 형태(누적 리스트, 고정 크기 윈도우, 현재 청크만)로
+3시간 분량의 전사를 회의 상태(전사 윈도우, 맥락 세션)에 동기화하면서 반영된 청크 수가 실제 청크 수와 같은지,
+호출당 동기화 시간이 회의 길이와 무관한지 확인합니다. API 키 없이 실행됩니다.
+
+실행 방법:
+    cd ai-service
+    python -m tests.bench_transcript_sync
+"""
+
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.context_analyzer import ContextSession
+from app.services.mock_data import MOCK_TRANSCRIPT_SEGMENTS
+from app.services.transcript_window import TranscriptWindow
+
+logging.getLogger("app.services").setLevel(logging.WARNING)
+
+CHUNKS = 1200       # 약 3시간 (9초 간격 청크), 이전 재전송 판별 상한(256)보다 충분히 길게
+WINDOW = 20         # 고정 크기 윈도우로 보내는 클라이언트의 청크 수
+SEED = 42
+
+# 짧은 응답은 회의 중 그대로 반복됨 (중복 청크로 버려지면 안 됨)
+SHORT_REPLIES = ["네.", "맞습니다.", "감사합니다."]
+
+
+def build_chunks(rng: random.Random) -> list:
+    pool = [seg["text"] for sample in MOCK_TRANSCRIPT_SEGMENTS for seg in sample["segments"]]
+    return [
+        rng.choice(SHORT_REPLIES) if rng.random() < 0.2 else f"{rng.choice(pool)} ({i})"
+        for i in range(CHUNKS)
+    ]
+
+
+def requests_for(mode: str, chunks: list) -> list:
+    """클라이언트 형태별 요청마다 보내는 전사 리스트"""
+    if mode == "cumulative":
+        return [chunks[:i + 1] for i in range(len(chunks))]
+    if mode == "window":
+        return [chunks[max(0, i + 1 - WINDOW):i + 1] for i in range(len(chunks))]
+    return [[chunk] for chunk in chunks]
+
+
+def expected_count(mode: str, chunks: list) -> int:
+    """반영되어야 하는 청크 수 (현재 청크만 보내면 직전과 똑같은 청크는 재전송과 구분할 수 없음)"""
+    if mode != "current":
+        return len(chunks)
+    return sum(1 for i, chunk in enumerate(chunks) if i == 0 or chunk != chunks[i - 1])
+
+
+def run(mode: str, factory, chunks: list) -> tuple:
+    """(반영된 청크 수, 앞/뒤 100회 호출의 평균 동기화 시간 us)"""
+    state = factory()
+    elapsed = []
+    for transcripts in requests_for(mode, chunks):
+        start = time.perf_counter()
+        state.sync(transcripts)
+        elapsed.append(time.perf_counter() - start)
+    head = sum(elapsed[:100]) / 100 * 1e6
+    tail = sum(elapsed[-100:]) / 100 * 1e6
+    return state.chunk_count, head, tail
+
+
+def main():
+    print("\n" + "=" * 60)
+    print(f"ONNO - Transcript Sync Benchmark ({CHUNKS:,} chunks)")
+    print("=" * 60)
+
+    chunks = build_chunks(random.Random(SEED))
+    for name, factory in [("TranscriptWindow", TranscriptWindow), ("ContextSession", ContextSession)]:
+        print(f"\n  [{name}]")
+        for mode in ("cumulative", "window", "current"):
+            count, head, tail = run(mode, factory, chunks)
+            expected = expected_count(mode, chunks)
+            print(
+                f"    {mode:10s}: {count:5,}/{expected:,} chunks (same: {count == expected}), "
+                f"first 100 calls {head:7.1f}us, last 100 calls {tail:7.1f}us"
+            )
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()